@@ -0,0 +1,6 @@
+"""Shared helpers for the pyreForge tools.
+
+pyRevit adds this extension's ``lib`` folder to ``sys.path``, so every
+button script can ``import pyreforge``. Modules that do not import the
+Revit API can also be used and benchmarked outside Revit.
+"""
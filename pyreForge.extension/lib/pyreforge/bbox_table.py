@@ -0,0 +1,102 @@
+"""One-shot snapshot of element bounding boxes in a view.
+
+Each element's ``get_BoundingBox(view)`` is read exactly once and stored
+as Python floats in parallel ``array('d')`` columns, keyed by the integer
+element id. Overlap tests then run on floats instead of .NET
+``BoundingBoxXYZ``/``XYZ`` property access.
+"""
+from array import array
+
+from pyreforge.ids import id_value
+
+
+class BoxTable(object):
+    """Parallel float columns (min/max X, Y, Z) keyed by element id."""
+
+    def __init__(self):
+        self.ids = []
+        self.rows = {}
+        self.minx = array('d')
+        self.miny = array('d')
+        self.minz = array('d')
+        self.maxx = array('d')
+        self.maxy = array('d')
+        self.maxz = array('d')
+
+    @classmethod
+    def from_elements(cls, elements, view):
+        """Snapshot the boxes of ``elements`` in ``view``.
+
+        Elements without a box in the view are left out of the table.
+        """
+        table = cls()
+        for element in elements:
+            key = id_value(element.Id)
+            if key in table.rows:
+                continue
+            bb = element.get_BoundingBox(view)
+            if bb is None:
+                continue
+            bb_min, bb_max = bb.Min, bb.Max
+            table.add(key, bb_min.X, bb_min.Y, bb_max.X, bb_max.Y, bb_min.Z, bb_max.Z)
+        return table
+
+    def add(self, key, minx, miny, maxx, maxy, minz=0.0, maxz=0.0):
+        """Append a row. Adding an existing key overwrites its row."""
+        row = self.rows.get(key)
+        if row is not None:
+            self.minx[row], self.miny[row], self.maxx[row], self.maxy[row] = minx, miny, maxx, maxy
+            self.minz[row], self.maxz[row] = minz, maxz
+            return row
+        row = len(self.ids)
+        self.ids.append(key)
+        self.rows[key] = row
+        self.minx.append(minx)
+        self.miny.append(miny)
+        self.maxx.append(maxx)
+        self.maxy.append(maxy)
+        self.minz.append(minz)
+        self.maxz.append(maxz)
+        return row
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def box(self, key):
+        """Return ``(minx, miny, maxx, maxy)`` for ``key``."""
+        row = self.rows[key]
+        return self.minx[row], self.miny[row], self.maxx[row], self.maxy[row]
+
+    def z_range(self, key):
+        """Return ``(minz, maxz)`` for ``key``."""
+        row = self.rows[key]
+        return self.minz[row], self.maxz[row]
+
+    def items(self):
+        """Yield ``(key, (minx, miny, maxx, maxy))`` in row order."""
+        minx, miny, maxx, maxy = self.minx, self.miny, self.maxx, self.maxy
+        for row, key in enumerate(self.ids):
+            yield key, (minx[row], miny[row], maxx[row], maxy[row])
+
+    def overlaps(self, key_a, key_b, strict=False, use_z=False):
+        """Test two rows for overlap.
+
+        :param strict: Require interior overlap; touching edges do not count.
+        :param use_z:  Also require the Z ranges to overlap.
+        """
+        a = self.rows[key_a]
+        b = self.rows[key_b]
+        if strict:
+            hit = (self.minx[a] < self.maxx[b] and self.maxx[a] > self.minx[b] and
+                   self.miny[a] < self.maxy[b] and self.maxy[a] > self.miny[b])
+            if hit and use_z:
+                hit = self.minz[a] < self.maxz[b] and self.maxz[a] > self.minz[b]
+            return hit
+        hit = (self.minx[a] <= self.maxx[b] and self.maxx[a] >= self.minx[b] and
+               self.miny[a] <= self.maxy[b] and self.maxy[a] >= self.miny[b])
+        if hit and use_z:
+            hit = self.minz[a] <= self.maxz[b] and self.maxz[a] >= self.minz[b]
+        return hit
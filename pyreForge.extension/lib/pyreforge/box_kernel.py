@@ -0,0 +1,119 @@
+"""Batch rectangle overlap kernel with an optional NumPy backend.
+
+``overlaps`` compares every box of one list with every box of another.
+Under a CPython engine with NumPy installed the comparison runs as
+vectorized array operations; under IronPython, or without NumPy, the
+pure-Python backend gives the same pairs in the same order.
+
+``bucket_overlaps`` feeds the kernel from a ``SpatialHash``: one block per
+grid cell, so only boxes sharing a cell are ever compared.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Upper bound on the size of one boolean comparison block
+CHUNK_CELLS = 1 << 22
+
+
+def has_numpy():
+    return numpy is not None
+
+
+def overlaps_python(a_boxes, b_boxes, strict=False):
+    """Pure-Python backend of ``overlaps``."""
+    pairs = []
+    for i, (aminx, aminy, amaxx, amaxy) in enumerate(a_boxes):
+        for j, (bminx, bminy, bmaxx, bmaxy) in enumerate(b_boxes):
+            if strict:
+                hit = aminx < bmaxx and amaxx > bminx and aminy < bmaxy and amaxy > bminy
+            else:
+                hit = aminx <= bmaxx and amaxx >= bminx and aminy <= bmaxy and amaxy >= bminy
+            if hit:
+                pairs.append((i, j))
+    return pairs
+
+
+def overlaps_numpy(a_boxes, b_boxes, strict=False):
+    """NumPy backend of ``overlaps``; compares in row blocks to bound memory."""
+    a = numpy.asarray(a_boxes, dtype=float).reshape(-1, 4)
+    b = numpy.asarray(b_boxes, dtype=float).reshape(-1, 4)
+    if not len(a) or not len(b):
+        return []
+    if strict:
+        less, greater = numpy.less, numpy.greater
+    else:
+        less, greater = numpy.less_equal, numpy.greater_equal
+    bminx, bminy, bmaxx, bmaxy = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
+    step = max(1, CHUNK_CELLS // len(b))
+    pairs = []
+    for start in range(0, len(a), step):
+        block = a[start:start + step]
+        mask = less(block[:, 0:1], bmaxx)
+        mask &= greater(block[:, 2:3], bminx)
+        mask &= less(block[:, 1:2], bmaxy)
+        mask &= greater(block[:, 3:4], bminy)
+        rows, cols = numpy.nonzero(mask)
+        pairs.extend(zip((rows + start).tolist(), cols.tolist()))
+    return pairs
+
+
+def overlaps(a_boxes, b_boxes, strict=False, backend=None):
+    """Return the ``(i, j)`` index pairs where ``a_boxes[i]`` overlaps ``b_boxes[j]``.
+
+    :param a_boxes: Sequence of ``(minx, miny, maxx, maxy)``.
+    :param b_boxes: Sequence of ``(minx, miny, maxx, maxy)``.
+    :param strict:  Require interior overlap; touching edges do not count.
+    :param backend: ``"numpy"``, ``"python"`` or None to pick NumPy when
+                    it is available.
+    :return:        Pairs sorted by ``i`` then ``j``.
+    """
+    if backend is None:
+        backend = "numpy" if numpy is not None else "python"
+    if backend == "numpy":
+        if numpy is None:
+            raise ImportError("NumPy is not available in this engine")
+        return overlaps_numpy(a_boxes, b_boxes, strict)
+    if backend == "python":
+        return overlaps_python(a_boxes, b_boxes, strict)
+    raise ValueError("Unknown backend: {}".format(backend))
+
+
+def bucket_overlaps(items, index, strict=False, backend=None):
+    """Return ``{key: set of index keys}`` for the ``items`` boxes overlapping
+    boxes of ``index``, running ``overlaps`` once per shared grid cell.
+
+    :param items: ``(key, (minx, miny, maxx, maxy))`` pairs.
+    :param index: ``SpatialHash`` of the other boxes.
+    """
+    items = list(items)
+    blocks = {}
+    wide = []
+    for item in items:
+        cells = index.cells_of(item[1])
+        if cells is None:
+            # Spans too many cells: compared once with every indexed box
+            wide.append(item)
+            continue
+        for cell in cells:
+            if index.bucket(cell):
+                blocks.setdefault(cell, []).append(item)
+
+    hits = {}
+
+    def compare(a_items, b_keys):
+        if not a_items or not b_keys:
+            return
+        b_boxes = [index.box(b_key) for b_key in b_keys]
+        for i, j in overlaps([box for _, box in a_items], b_boxes, strict, backend):
+            hits.setdefault(a_items[i][0], set()).add(b_keys[j])
+
+    oversized = index.oversized()
+    for cell, a_items in blocks.items():
+        compare(a_items, list(index.bucket(cell)))
+    if wide:
+        skip = set(oversized)
+        compare(wide, [key for key in index.keys() if key not in skip])
+    compare(items, oversized)
+    return hits
@@ -0,0 +1,255 @@
+"""Rule-driven clash engine shared by the 2D clash tools.
+
+A rule reads "annotation categories X against model categories Y", with
+optional leader skipping and a tolerance. An engine compiles its rules
+once: the union of source and target categories becomes two native
+multi-category filters, so each view is scanned once for sources and
+once for targets whatever the number of rules, and every rule queries
+the same spatial index of targets. Source and target boxes are compared
+per grid cell of that index by the batch kernel (vectorized when NumPy
+is available) before the exact per-rule tests.
+"""
+from Autodesk.Revit.DB import IndependentTag
+
+from pyreforge.bbox_table import BoxTable
+from pyreforge.box_kernel import bucket_overlaps
+from pyreforge.clash_cache import ClashCacheFile, ClashState, element_stamps, plan_recheck
+from pyreforge.ids import category_key, id_value
+from pyreforge.override_journal import OverrideJournal, apply_highlight
+from pyreforge.spatial_index import SpatialHash, boxes_overlap
+from pyreforge.storage import document_key
+from pyreforge.view_scope import collect_in_view
+from pyreforge.wall_footprint import WallFootprints
+
+# Bump when the way rules are evaluated changes, to drop cached results
+ENGINE_VERSION = 4
+
+
+def _unique(categories):
+    seen = set()
+    unique = []
+    for category in categories:
+        if int(category) not in seen:
+            seen.add(int(category))
+            unique.append(category)
+    return unique
+
+
+def has_leader(element):
+    return isinstance(element, IndependentTag) and element.HasLeader
+
+
+class ClashRule(object):
+    """Sources of some categories must not overlap targets of others.
+
+    :param tolerance: Feet added around the source box; positive values
+                      also flag near misses, negative values ignore
+                      shallow overlaps.
+    """
+
+    def __init__(self, name, sources, targets, ignore_leaders=False, tolerance=0.0):
+        self.name = name
+        self.sources = list(sources)
+        self.targets = list(targets)
+        self.ignore_leaders = ignore_leaders
+        self.tolerance = float(tolerance)
+        self.source_ids = frozenset(int(category) for category in self.sources)
+        self.target_ids = frozenset(int(category) for category in self.targets)
+
+    def signature(self):
+        return "{}:{}:{}:{}:{}".format(self.name, sorted(self.source_ids), sorted(self.target_ids),
+                                       self.ignore_leaders, self.tolerance)
+
+
+class TargetSet(object):
+    """Snapshot, spatial index and footprints of the clash targets."""
+
+    def __init__(self, elements, table, index, category_of, footprints):
+        self.elements = elements
+        self.table = table
+        self.index = index
+        self.category_of = category_of
+        self.footprints = footprints
+
+    @classmethod
+    def in_view(cls, doc, view, categories):
+        """Collect and index the targets of ``categories`` shown in ``view``."""
+        elements = collect_in_view(doc, view, categories)
+        table = BoxTable.from_elements(elements, view)
+        category_of = dict((id_value(element.Id), category_key(element)) for element in elements)
+        return cls(elements, table, SpatialHash.from_boxes(table.items()), category_of, WallFootprints(elements))
+
+
+class ClashEngine(object):
+    """Evaluates a set of ``ClashRule`` in one pass over a view."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.source_categories = _unique(category for rule in self.rules for category in rule.sources)
+        self.target_categories = _unique(category for rule in self.rules for category in rule.targets)
+        self._rules_by_category = {}
+        for rule in self.rules:
+            for category_id in rule.source_ids:
+                self._rules_by_category.setdefault(category_id, []).append(rule)
+        # How far any rule reaches beyond a source box
+        self.reach = max([0.0] + [rule.tolerance for rule in self.rules])
+        self.signature = "engine-v{}/{}".format(ENGINE_VERSION, "/".join(rule.signature() for rule in self.rules))
+
+    def collect_sources(self, doc, view):
+        return collect_in_view(doc, view, self.source_categories)
+
+    def collect_targets(self, doc, view):
+        return TargetSet.in_view(doc, view, self.target_categories)
+
+    def find_clash(self, source, source_table, targets, candidates=None):
+        """Return ``(rule, target_key)`` for the first clash of ``source``, or None.
+
+        :param candidates: Target keys whose boxes overlap the source box
+                           grown by ``reach``, as ``candidates`` returns;
+                           None queries the spatial index instead.
+        """
+        source_key = id_value(source.Id)
+        if source_key not in source_table:
+            return None
+        minx, miny, maxx, maxy = source_table.box(source_key)
+        minz, maxz = source_table.z_range(source_key)
+        leader = has_leader(source)
+        if candidates is not None:
+            candidates = sorted(candidates)
+        for rule in self._rules_by_category.get(category_key(source), ()):
+            if rule.ignore_leaders and leader:
+                continue
+            tol = rule.tolerance
+            box = (minx - tol, miny - tol, maxx + tol, maxy + tol)
+            low, high = minz - tol, maxz + tol
+
+            def exact_overlap(target_key):
+                if targets.category_of.get(target_key) not in rule.target_ids:
+                    return False
+                target_min_z, target_max_z = targets.table.z_range(target_key)
+                if low > target_max_z or high < target_min_z:
+                    return False
+                return targets.footprints.box_hits(target_key, box)
+
+            if candidates is None:
+                target_key = targets.index.first_hit(box, exact_overlap)
+            else:
+                target_key = None
+                for candidate in candidates:
+                    if boxes_overlap(box, targets.index.box(candidate)) and exact_overlap(candidate):
+                        target_key = candidate
+                        break
+            if target_key is not None:
+                return rule, target_key
+        return None
+
+    def candidates(self, sources, source_table, targets, keys=None):
+        """Return ``{source_key: target keys}`` of the box overlaps, by grid cell.
+
+        Source boxes are grown by ``reach`` so every rule's tolerance is covered.
+        """
+        reach = self.reach
+        items = []
+        for source in sources:
+            source_key = id_value(source.Id)
+            if source_key not in source_table or (keys is not None and source_key not in keys):
+                continue
+            minx, miny, maxx, maxy = source_table.box(source_key)
+            items.append((source_key, (minx - reach, miny - reach, maxx + reach, maxy + reach)))
+        return bucket_overlaps(items, targets.index)
+
+    def check(self, sources, source_table, targets, keys=None):
+        """Return ``{source_key: (rule, target_key)}`` for the clashing sources.
+
+        :param keys: Only test sources whose key is in this set.
+        """
+        candidates = self.candidates(sources, source_table, targets, keys)
+        hits = {}
+        for source in sources:
+            source_key = id_value(source.Id)
+            if source_key not in candidates:
+                continue
+            hit = self.find_clash(source, source_table, targets, candidates[source_key])
+            if hit is not None:
+                hits[source_key] = hit
+        return hits
+
+
+class ClashRun(object):
+    """Outcome of ``highlight_view_clashes``."""
+
+    def __init__(self, doc, tool, sources, overlapping_keys, retest_count, written, skipped, cache, journal, view_key):
+        self.doc = doc
+        self.tool = tool
+        self.sources = sources
+        self.overlapping_keys = overlapping_keys
+        self.retest_count = retest_count
+        self.written = written
+        self.skipped = skipped
+        self.cache = cache
+        self.journal = journal
+        self.view_key = view_key
+
+    @property
+    def overlapping_ids(self):
+        return [source.Id for source in self.sources if id_value(source.Id) in self.overlapping_keys]
+
+    def forget(self):
+        """Drop the cached result, e.g. after the highlights were reverted."""
+        self.cache.discard(self.view_key)
+        self.cache.save()
+
+    def revert(self, name="Revert Clash Highlights"):
+        """Give every highlighted source of the view its original overrides back.
+
+        :return: Number of elements restored.
+        """
+        # The journal also drops the cached result, so the next run starts from scratch
+        restored = self.journal.restore(self.doc, [self.view_key], self.tool, name)
+        self.journal.save()
+        return restored
+
+
+def highlight_view_clashes(doc, view, engine, tool, transaction_name):
+    """Check ``view`` with ``engine``, highlight clashing sources in red and
+    give sources that no longer clash their original overrides back.
+
+    Results are cached per document and view under ``tool``; a re-run
+    only re-tests sources that changed or sit near targets that changed.
+    Replaced overrides go to the document's ``OverrideJournal``.
+    """
+    sources = engine.collect_sources(doc, view)
+    source_table = BoxTable.from_elements(sources, view)
+    targets = engine.collect_targets(doc, view)
+
+    cache = ClashCacheFile(document_key(doc), tool)
+    view_key = id_value(view.Id)
+    source_stamps = element_stamps(sources, source_table, has_leader)
+    target_stamps = element_stamps(targets.elements, targets.table)
+    target_boxes = dict(targets.table.items())
+    reach = engine.reach
+    source_boxes = dict((key, (minx - reach, miny - reach, maxx + reach, maxy + reach))
+                        for key, (minx, miny, maxx, maxy) in source_table.items())
+    retest_keys, overlapping_keys = plan_recheck(cache.get(view_key), engine.signature,
+                                                 source_boxes, source_stamps,
+                                                 target_boxes, target_stamps)
+
+    hits = engine.check(sources, source_table, targets, retest_keys)
+    overlapping_keys.update(hits)
+    hit_ids = []
+    other_ids = []
+    for source in sources:
+        source_key = id_value(source.Id)
+        # Kept hits are queued too, in case their highlight was undone;
+        # the batch skips the ones that are still red
+        if source_key in overlapping_keys:
+            hit_ids.append(source.Id)
+        elif source_key in retest_keys:
+            other_ids.append(source.Id)
+    journal = OverrideJournal.for_document(doc)
+    written, skipped = apply_highlight(view, hit_ids, other_ids, tool, transaction_name, journal)
+    journal.save()
+
+    cache.put(view_key, ClashState(engine.signature, source_stamps, target_stamps, target_boxes, overlapping_keys))
+    cache.save()
+    return ClashRun(doc, tool, sources, overlapping_keys, len(retest_keys), written, skipped, cache, journal, view_key)
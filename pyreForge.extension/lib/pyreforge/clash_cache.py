@@ -0,0 +1,167 @@
+"""Persisted clash results for incremental re-checks.
+
+Each run stores, per document and view, a version stamp for every
+source (tag/annotation) and target (wall/column) plus the list of
+clashing sources. The next run re-tests only sources that were added or
+modified, or that sit near a target that was added, modified or
+deleted; every other result is carried over.
+
+The planning logic is pure Python; results live in a sidecar JSON file
+under ``%APPDATA%/pyreForge/clash_cache``.
+"""
+import os
+
+from pyreforge.ids import id_value
+from pyreforge.spatial_index import SpatialHash
+from pyreforge.storage import app_data_dir, document_key, load_json, save_json
+
+
+def make_stamp(box, version=None, extra=None):
+    """Build a JSON-friendly version stamp for an element.
+
+    :param box:     Box floats as read from the snapshot table.
+    :param version: ``Element.VersionGuid`` where the Revit version has it.
+    :param extra:   Any other state that changes the result (e.g. leaders).
+    """
+    return [round(value, 6) for value in box] + [str(version or ""), str(extra or "")]
+
+
+def element_stamps(elements, table, extra=None):
+    """Stamp every element, taking the box part from its ``BoxTable`` row.
+
+    Elements missing from the table (no box in the view) get an empty box.
+
+    :param extra: Optional ``extra(element)`` adding result-relevant state.
+    """
+    stamps = {}
+    for element in elements:
+        key = id_value(element.Id)
+        box = table.box(key) + table.z_range(key) if key in table else ()
+        stamps[key] = make_stamp(box, getattr(element, "VersionGuid", None), extra(element) if extra else None)
+    return stamps
+
+
+class ClashState(object):
+    """Result of one clash run in one view."""
+
+    def __init__(self, signature="", source_stamps=None, target_stamps=None, target_boxes=None, hits=None):
+        self.signature = signature
+        self.source_stamps = source_stamps or {}
+        self.target_stamps = target_stamps or {}
+        self.target_boxes = target_boxes or {}
+        self.hits = set(hits or ())
+
+    def to_dict(self):
+        return {
+            "signature": self.signature,
+            "sources": dict((str(key), value) for key, value in self.source_stamps.items()),
+            "targets": dict((str(key), value) for key, value in self.target_stamps.items()),
+            "target_boxes": dict((str(key), list(value)) for key, value in self.target_boxes.items()),
+            "hits": sorted(self.hits),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            signature=data.get("signature", ""),
+            source_stamps=dict((int(key), value) for key, value in data.get("sources", {}).items()),
+            target_stamps=dict((int(key), value) for key, value in data.get("targets", {}).items()),
+            target_boxes=dict((int(key), tuple(value)) for key, value in data.get("target_boxes", {}).items()),
+            hits=data.get("hits", ()),
+        )
+
+
+def plan_recheck(previous, signature, source_boxes, source_stamps, target_boxes, target_stamps):
+    """Work out which sources need a fresh clash test.
+
+    :param previous:      ``ClashState`` from the last run, or None.
+    :param signature:     Description of the check (categories, options);
+                          a different signature forces a full run.
+    :param source_boxes:  ``{key: (minx, miny, maxx, maxy)}`` of the sources.
+    :param target_boxes:  ``{key: (minx, miny, maxx, maxy)}`` of the targets.
+    :return:              ``(retest_keys, kept_hits)`` sets of source keys.
+    """
+    if previous is None or previous.signature != signature:
+        return set(source_stamps), set()
+
+    retest = set(key for key, stamp in source_stamps.items() if previous.source_stamps.get(key) != stamp)
+
+    # Targets that moved, changed or vanished invalidate the sources near
+    # both their old and their new position
+    changed_regions = []
+    for key in set(target_stamps) | set(previous.target_stamps):
+        if target_stamps.get(key) == previous.target_stamps.get(key):
+            continue
+        for box in (previous.target_boxes.get(key), target_boxes.get(key)):
+            if box is not None:
+                changed_regions.append((len(changed_regions), box))
+    if changed_regions:
+        regions = SpatialHash.from_boxes(changed_regions)
+        for key, box in source_boxes.items():
+            if key not in retest and regions.first_hit(box) is not None:
+                retest.add(key)
+
+    kept_hits = set(key for key in previous.hits if key in source_stamps and key not in retest)
+    return retest, kept_hits
+
+
+def default_cache_dir():
+    return app_data_dir("clash_cache")
+
+
+class ClashCacheFile(object):
+    """Sidecar JSON holding the clash states of one document, keyed by view."""
+
+    def __init__(self, doc_key, tool, folder=None):
+        self.path = os.path.join(folder or default_cache_dir(), "{}.{}.json".format(tool, doc_key))
+        self._views = None
+
+    def _load(self):
+        if self._views is None:
+            # A missing or corrupt cache only costs a full re-check
+            self._views = load_json(self.path, {})
+        return self._views
+
+    def get(self, view_key):
+        data = self._load().get(str(view_key))
+        return ClashState.from_dict(data) if data else None
+
+    def put(self, view_key, state):
+        self._load()[str(view_key)] = state.to_dict()
+
+    def discard(self, view_key):
+        self._load().pop(str(view_key), None)
+
+    def clear(self):
+        self._views = {}
+
+    def save(self):
+        save_json(self.path, self._load())
+
+
+def forget_views(doc_key, view_keys=None, tool=None, folder=None):
+    """Drop the cached results of views whose highlights were taken back.
+
+    Cached hits are only trusted while the highlights are on screen, so
+    every restore of journaled overrides must come through here.
+
+    :param view_keys: Views to forget; None for every view.
+    :param tool:      Only forget the cache of this tool; None for all.
+    """
+    folder = folder or default_cache_dir()
+    suffix = ".{}.json".format(doc_key)
+    if not os.path.isdir(folder):
+        return
+    for file_name in os.listdir(folder):
+        if not file_name.endswith(suffix):
+            continue
+        file_tool = file_name[:-len(suffix)]
+        if tool is not None and file_tool != tool:
+            continue
+        cache = ClashCacheFile(doc_key, file_tool, folder)
+        if view_keys is None:
+            cache.clear()
+        else:
+            for view_key in view_keys:
+                cache.discard(view_key)
+        cache.save()
@@ -0,0 +1,45 @@
+"""Declarative rulesets of the 2D clash tools.
+
+Adding a check means adding a ``ClashRule`` here and listing it in the
+tools that should run it; the engine folds it into the same view scan.
+"""
+from Autodesk.Revit.DB import BuiltInCategory
+
+from pyreforge.clash import ClashRule
+
+# Tag categories checked against model elements
+TAG_CATEGORIES = [
+    BuiltInCategory.OST_KeynoteTags,
+    BuiltInCategory.OST_DetailComponentTags,
+    BuiltInCategory.OST_MaterialTags,
+    BuiltInCategory.OST_FloorTags,
+    BuiltInCategory.OST_CurtaSystemTags,
+    BuiltInCategory.OST_HostFinTags,
+    BuiltInCategory.OST_StairsTags,
+    BuiltInCategory.OST_MultiCategoryTags,
+    BuiltInCategory.OST_AreaTags,
+    BuiltInCategory.OST_StructuralColumnTags,
+    BuiltInCategory.OST_ParkingTags,
+    BuiltInCategory.OST_SiteTags,
+    BuiltInCategory.OST_SpecialityEquipmentTags,
+    BuiltInCategory.OST_GenericModelTags,
+    BuiltInCategory.OST_CurtainWallPanelTags,
+    BuiltInCategory.OST_WallTags,
+    BuiltInCategory.OST_CeilingTags,
+    BuiltInCategory.OST_CaseworkTags,
+    BuiltInCategory.OST_FurnitureTags,
+    BuiltInCategory.OST_RoomTags,
+    BuiltInCategory.OST_DoorTags,
+    BuiltInCategory.OST_WindowTags,
+]
+
+TAGS_VS_WALLS_AND_COLUMNS = ClashRule(
+    "Tags vs walls and columns",
+    TAG_CATEGORIES,
+    [BuiltInCategory.OST_Walls, BuiltInCategory.OST_Columns],
+    ignore_leaders=True)
+
+DIMENSIONS_AND_TEXT_VS_WALLS = ClashRule(
+    "Dimensions and text vs walls",
+    [BuiltInCategory.OST_Dimensions, BuiltInCategory.OST_TextNotes],
+    [BuiltInCategory.OST_Walls])
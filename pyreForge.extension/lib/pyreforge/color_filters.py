@@ -0,0 +1,265 @@
+"""Color elements by a parameter value with view filters.
+
+Values are bucketed first (height bands, fire ratings, departments...),
+then each occupied bucket gets one ``ParameterFilterElement``, created or
+reused by name, and one shared override on the view or its template.
+Revit keeps the coloring live as values change inside a bucket, and a
+view costs one write per bucket instead of one per element.
+"""
+from Autodesk.Revit.DB import (ElementId, ElementParameterFilter, FilteredElementCollector, FilterRule,
+                               ParameterFilterElement, ParameterFilterRuleFactory, StorageType, Transaction)
+from System.Collections.Generic import List
+
+from pyreforge.graphics import GraphicsRegistry
+from pyreforge.ids import id_value
+from pyreforge.names import clean_name
+from pyreforge.view_scope import category_filter
+
+# Tolerance of the range rules, in internal units
+RANGE_TOLERANCE = 1e-6
+
+
+def filter_name(prefix, label):
+    return clean_name("{} {}".format(prefix, label))
+
+
+def string_equals_rule(parameter_id, value):
+    try:
+        return ParameterFilterRuleFactory.CreateEqualsRule(parameter_id, value)
+    except TypeError:
+        # Revit 2022 and older also take case sensitivity
+        return ParameterFilterRuleFactory.CreateEqualsRule(parameter_id, value, True)
+
+
+class RangeBuckets(object):
+    """Bands of ``step`` between ``low`` and ``high``, plus below and above.
+
+    Values are in internal units; ``scale`` converts them for labels.
+    Band colors cycle through ``colors``.
+    """
+
+    def __init__(self, low, high, step, colors, below_rgb, above_rgb, scale=1.0, unit=""):
+        self.low = low
+        self.high = high
+        self.step = step
+        self.colors = list(colors)
+        self.below_rgb = below_rgb
+        self.above_rgb = above_rgb
+        self.scale = scale
+        self.unit = unit
+
+    def bucket_of(self, value):
+        if value < self.low:
+            return "below"
+        if value >= self.high:
+            return "above"
+        return int((value - self.low) / self.step)
+
+    def bounds(self, key):
+        """Return ``(lower, upper)`` of a bucket; None for an open end."""
+        if key == "below":
+            return None, self.low
+        if key == "above":
+            return self.high, None
+        return self.low + key * self.step, self.low + (key + 1) * self.step
+
+    def rgb(self, key):
+        if key == "below":
+            return self.below_rgb
+        if key == "above":
+            return self.above_rgb
+        return self.colors[key % len(self.colors)]
+
+    def label(self, key):
+        lower, upper = self.bounds(key)
+        if lower is None:
+            return "below {:.2f}{}".format(upper * self.scale, self.unit)
+        if upper is None:
+            return "above {:.2f}{}".format(lower * self.scale, self.unit)
+        return "{:.2f}-{:.2f}{}".format(lower * self.scale, upper * self.scale, self.unit)
+
+    def rules(self, parameter_id, key):
+        lower, upper = self.bounds(key)
+        rules = []
+        if lower is not None:
+            rules.append(ParameterFilterRuleFactory.CreateGreaterOrEqualRule(parameter_id, lower, RANGE_TOLERANCE))
+        if upper is not None:
+            rules.append(ParameterFilterRuleFactory.CreateLessRule(parameter_id, upper, RANGE_TOLERANCE))
+        return rules
+
+
+def stable_index(value):
+    """Return an index derived from the value alone, the same in every run."""
+    if isinstance(value, int):
+        return value
+    # Built-in hash() of text is randomized between runs on Python 3
+    return sum((position + 1) * ord(character) for position, character in enumerate(value))
+
+
+class ValueBuckets(object):
+    """One bucket per distinct text or integer value.
+
+    Each value picks its color from the value itself, so it keeps the same
+    color between runs whatever else the model holds.
+    """
+
+    def __init__(self, colors):
+        self.colors = list(colors)
+
+    def bucket_of(self, value):
+        if value is None or value == "":
+            return None
+        return value
+
+    def rgb(self, key):
+        return self.colors[stable_index(key) % len(self.colors)]
+
+    def label(self, key):
+        return str(key)
+
+    def rules(self, parameter_id, key):
+        if isinstance(key, int):
+            return [ParameterFilterRuleFactory.CreateEqualsRule(parameter_id, key)]
+        return [string_equals_rule(parameter_id, key)]
+
+
+def bucket_order(key):
+    """Sort key putting "below" first, then numbered bands, then the rest."""
+    if key == "below":
+        return 0, 0, ""
+    if isinstance(key, int):
+        return 1, key, ""
+    return 2, 0, str(key)
+
+
+def parameter_value(parameter):
+    """Return the value of a parameter as a float, int or text, or None."""
+    if parameter is None or not parameter.HasValue:
+        return None
+    storage_type = parameter.StorageType
+    if storage_type == StorageType.Double:
+        return parameter.AsDouble()
+    if storage_type == StorageType.Integer:
+        return parameter.AsInteger()
+    if storage_type == StorageType.String:
+        return parameter.AsString()
+    return None
+
+
+class ColorByParameter(object):
+    """Colors the elements of ``categories`` by a built-in parameter.
+
+    :param prefix:     Name prefix of the filters this scheme owns.
+    :param categories: BuiltInCategories the filters apply to.
+    :param parameter:  BuiltInParameter holding the value.
+    :param buckets:    ``RangeBuckets`` or ``ValueBuckets``.
+    """
+
+    def __init__(self, prefix, categories, parameter, buckets):
+        self.prefix = prefix
+        self.categories = list(categories)
+        self.parameter = parameter
+        self.buckets = buckets
+
+    def value_of(self, doc, element, type_values):
+        """Return the parameter value of an element, or of its type.
+
+        Type parameters (a wall's fire rating, say) are read once per type
+        and kept in ``type_values``.
+        """
+        parameter = element.get_Parameter(self.parameter)
+        if parameter is not None:
+            return parameter_value(parameter)
+        type_id = element.GetTypeId()
+        type_key = id_value(type_id)
+        if type_key not in type_values:
+            element_type = doc.GetElement(type_id)
+            type_values[type_key] = (parameter_value(element_type.get_Parameter(self.parameter))
+                                     if element_type is not None else None)
+        return type_values[type_key]
+
+    def occupied(self, doc, view=None):
+        """Return the sorted bucket keys of the elements, in one collector pass.
+
+        Filter rules match instance and type parameters alike, so the
+        buckets of type values are colored the same way.
+        """
+        keys = set()
+        type_values = {}
+        collector = FilteredElementCollector(doc) if view is None else FilteredElementCollector(doc, view.Id)
+        for element in collector.WherePasses(category_filter(self.categories)).WhereElementIsNotElementType():
+            value = self.value_of(doc, element, type_values)
+            if value is not None:
+                key = self.buckets.bucket_of(value)
+                if key is not None:
+                    keys.add(key)
+        return sorted(keys, key=bucket_order)
+
+    def owned_filters(self, doc):
+        """Return ``{name: ParameterFilterElement}`` of the filters named with ``prefix``."""
+        return dict((element.Name, element) for element in FilteredElementCollector(doc).OfClass(ParameterFilterElement)
+                    if element.Name.startswith(self.prefix + " "))
+
+    def _element_filter(self, key):
+        rules = self.buckets.rules(ElementId(self.parameter), key)
+        return ElementParameterFilter(List[FilterRule](rules))
+
+    def apply(self, doc, view, keys, name="Color by Parameter"):
+        """Color ``view`` (or a view template) with one filter per bucket.
+
+        Filters of this scheme whose bucket is not in ``keys`` are taken
+        off the view, not deleted, since other views may use them.
+
+        :return: Number of filters applied.
+        """
+        existing = self.owned_filters(doc)
+        graphics = GraphicsRegistry.for_document(doc)
+        category_ids = List[ElementId]([ElementId(category) for category in self.categories])
+        wanted = set()
+        t = Transaction(doc, name)
+        t.Start()
+        try:
+            for key in keys:
+                bucket_name = filter_name(self.prefix, self.buckets.label(key))
+                wanted.add(bucket_name)
+                parameter_filter = existing.get(bucket_name)
+                if parameter_filter is None:
+                    parameter_filter = ParameterFilterElement.Create(doc, bucket_name, category_ids,
+                                                                     self._element_filter(key))
+                else:
+                    # Reused filters get the current categories and rules
+                    parameter_filter.SetCategories(category_ids)
+                    parameter_filter.SetElementFilter(self._element_filter(key))
+                if not view.IsFilterApplied(parameter_filter.Id):
+                    view.AddFilter(parameter_filter.Id)
+                rgb = self.buckets.rgb(key)
+                view.SetFilterOverrides(parameter_filter.Id, graphics.preset(line_rgb=rgb, fill_rgb=rgb))
+                view.SetFilterVisibility(parameter_filter.Id, True)
+
+            for bucket_name, parameter_filter in existing.items():
+                if bucket_name not in wanted and view.IsFilterApplied(parameter_filter.Id):
+                    view.RemoveFilter(parameter_filter.Id)
+            t.Commit()
+        except Exception:
+            t.RollBack()
+            raise
+        return len(wanted)
+
+    def remove(self, doc, view, name="Remove Color Filters"):
+        """Take every filter of this scheme off ``view``.
+
+        :return: Number of filters removed.
+        """
+        applied = [parameter_filter for parameter_filter in self.owned_filters(doc).values()
+                   if view.IsFilterApplied(parameter_filter.Id)]
+        if applied:
+            t = Transaction(doc, name)
+            t.Start()
+            try:
+                for parameter_filter in applied:
+                    view.RemoveFilter(parameter_filter.Id)
+                t.Commit()
+            except Exception:
+                t.RollBack()
+                raise
+        return len(applied)
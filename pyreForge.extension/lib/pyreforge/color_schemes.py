@@ -0,0 +1,47 @@
+"""Color-by-parameter schemes of the highlight tools.
+
+Each scheme is a ``ColorByParameter``: a category, a parameter and how
+its values are bucketed. Adding a scheme here is enough for any tool to
+color views with it.
+"""
+from Autodesk.Revit.DB import BuiltInCategory, BuiltInParameter
+
+from pyreforge.color_filters import ColorByParameter, RangeBuckets, ValueBuckets
+
+FEET_TO_METERS = 0.3048
+
+PALETTE = [
+    (255, 0, 0),  # Red
+    (0, 255, 0),  # Green
+    (0, 0, 255),  # Blue
+    (255, 255, 0),  # Yellow
+    (0, 255, 255),  # Cyan
+    (255, 0, 255),  # Magenta
+    (128, 0, 0),  # Maroon
+    (0, 128, 0),  # Dark Green
+    (0, 0, 128),  # Navy
+    (128, 128, 0),  # Olive
+]
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+def ceiling_height():
+    """Ceilings by "Height Offset From Level", 100 mm bands from 1.5 to 5 m."""
+    buckets = RangeBuckets(1.5 / FEET_TO_METERS, 5.0 / FEET_TO_METERS, 0.1 / FEET_TO_METERS, PALETTE,
+                           WHITE, BLACK, scale=FEET_TO_METERS, unit=" m")
+    return ColorByParameter("pyreForge Ceiling Height", [BuiltInCategory.OST_Ceilings],
+                            BuiltInParameter.CEILING_HEIGHTABOVELEVEL_PARAM, buckets)
+
+
+def wall_fire_rating():
+    """Walls by the "Fire Rating" of their type."""
+    return ColorByParameter("pyreForge Wall Fire Rating", [BuiltInCategory.OST_Walls],
+                            BuiltInParameter.FIRE_RATING, ValueBuckets(PALETTE))
+
+
+def room_department():
+    """Rooms by "Department"."""
+    return ColorByParameter("pyreForge Room Department", [BuiltInCategory.OST_Rooms],
+                            BuiltInParameter.ROOM_DEPARTMENT, ValueBuckets(PALETTE))
@@ -0,0 +1,92 @@
+"""Disjoint-set (union-find) clustering of overlap pairs.
+
+Pure Python, no Revit imports. Overlap pairs are merged into connected
+clusters in near-linear time; one representative per cluster is kept
+and the rest can be deleted in bulk.
+"""
+
+
+class DisjointSet(object):
+    """Union-find with path compression and union by rank."""
+
+    def __init__(self):
+        self._parent = {}
+        self._rank = {}
+
+    def __contains__(self, key):
+        return key in self._parent
+
+    def add(self, key):
+        if key not in self._parent:
+            self._parent[key] = key
+            self._rank[key] = 0
+
+    def find(self, key):
+        """Return the root of ``key``, compressing the path on the way."""
+        self.add(key)
+        parent = self._parent
+        root = key
+        while parent[root] != root:
+            root = parent[root]
+        while parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
+
+    def union(self, key_a, key_b):
+        root_a = self.find(key_a)
+        root_b = self.find(key_b)
+        if root_a == root_b:
+            return root_a
+        rank = self._rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        return root_a
+
+    def groups(self):
+        """Return every set as a list of keys."""
+        groups = {}
+        for key in self._parent:
+            groups.setdefault(self.find(key), []).append(key)
+        return list(groups.values())
+
+
+def cluster_pairs(pairs):
+    """Return the connected clusters (two keys or more) formed by ``pairs``."""
+    sets = DisjointSet()
+    for key_a, key_b in pairs:
+        sets.union(key_a, key_b)
+    return [group for group in sets.groups() if len(group) > 1]
+
+
+def keep_oldest(cluster):
+    """Keep policy: the lowest id, i.e. the element created first."""
+    return min(cluster)
+
+
+def keep_highest(score):
+    """Build a keep policy that keeps the key with the highest ``score(key)``.
+
+    Ties go to the lowest id.
+    """
+    def choose(cluster):
+        return max(sorted(cluster), key=score)
+    return choose
+
+
+def split_clusters(clusters, keep=keep_oldest):
+    """Pick one survivor per cluster.
+
+    :param clusters: Lists of keys, e.g. from ``cluster_pairs``.
+    :param keep:     Policy returning the key to keep from a cluster.
+    :return:         ``(kept, deleted)`` lists of keys.
+    """
+    kept = []
+    deleted = []
+    for cluster in clusters:
+        survivor = keep(cluster)
+        kept.append(survivor)
+        deleted.extend(key for key in cluster if key != survivor)
+    return kept, deleted
@@ -0,0 +1,82 @@
+"""Exact duplicate annotations found by quantized geometric hashing.
+
+Most overkill cases are things pasted twice: same category, type, text or
+tagged element, and position to within a millimetre. Keying every
+annotation on those, with positions snapped to a grid, finds them in one
+dictionary pass; only what is left needs the geometric overlap sweep.
+Copies that straddle a grid line are still found (see
+``geometric_hash``).
+"""
+from pyreforge.geometric_hash import group_by_keys, hash_keys
+from pyreforge.ids import id_value
+from pyreforge.tag_registry import tagged_keys
+
+# 1 mm in feet, Revit's internal length unit
+POSITION_QUANTUM = 1.0 / 304.8
+
+# Unit direction components are compared to three decimals
+DIRECTION_QUANTUM = 1e-3
+
+
+def xyz_measures(xyz, quantum=POSITION_QUANTUM):
+    return [(xyz.X, quantum), (xyz.Y, quantum), (xyz.Z, quantum)]
+
+
+def _curve_key(curve):
+    # Lines by origin and direction, arcs by center and radius
+    direction = getattr(curve, "Direction", None)
+    if direction is not None:
+        return ("line",), xyz_measures(curve.Origin) + xyz_measures(direction, DIRECTION_QUANTUM)
+    return ("arc",), xyz_measures(curve.Center) + [(curve.Radius, POSITION_QUANTUM)]
+
+
+def _geometry_key(element):
+    # ``(exact part, measures)`` of an annotation, or None
+    if hasattr(element, "NumberOfSegments"):
+        # Dimensions: same references on the same dimension line
+        references = tuple(sorted(id_value(reference.ElementId) for reference in element.References))
+        curve_kind, measures = _curve_key(element.Curve)
+        return ("dimension", references, element.ValueString) + curve_kind, measures
+    if hasattr(element, "TagHeadPosition"):
+        # Independent, room, area and space tags
+        return (("tag", tuple(sorted(tagged_keys(element))), str(getattr(element, "TagOrientation", ""))),
+                xyz_measures(element.TagHeadPosition))
+    if hasattr(element, "Coord"):
+        # Text notes
+        return ("text", element.Text), xyz_measures(element.Coord) + xyz_measures(element.BaseDirection,
+                                                                                 DIRECTION_QUANTUM)
+    return None
+
+
+def duplicate_keys(element):
+    """Return the hashable duplicate keys of an annotation.
+
+    Usually one key; a position or direction near a grid line adds the
+    keys of the neighbouring cells. Elements without keys (unsupported
+    kinds, or geometry Revit cannot report, such as some multi-segment
+    or radial dimensions) are left to the geometric overlap tools.
+    """
+    category = element.Category
+    if category is None:
+        return []
+    try:
+        geometry = _geometry_key(element)
+    except Exception:
+        return []
+    if geometry is None:
+        return []
+    exact, measures = geometry
+    return hash_keys((id_value(category.Id), id_value(element.GetTypeId())) + exact, measures)
+
+
+def exact_duplicates(elements):
+    """Group ``elements`` sharing a duplicate key, in one pass.
+
+    :return: Lists of element keys, one per group of two or more duplicates.
+    """
+    items = []
+    for element in elements:
+        keys = duplicate_keys(element)
+        if keys:
+            items.append((id_value(element.Id), keys))
+    return group_by_keys(items)
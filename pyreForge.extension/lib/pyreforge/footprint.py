@@ -0,0 +1,95 @@
+"""Exact plan-footprint overlap tests for the clash narrow phase.
+
+Pure Python, no Revit imports. Polygons are lists of ``(x, y)`` corners
+of a convex shape in order; boxes are ``(minx, miny, maxx, maxy)``. The
+clash tools run these tests only on pairs whose boxes already overlap.
+"""
+import math
+
+
+def box_polygon(box):
+    """Return the four corners of a ``(minx, miny, maxx, maxy)`` box."""
+    minx, miny, maxx, maxy = box
+    return [(minx, miny), (maxx, miny), (maxx, maxy), (minx, maxy)]
+
+
+def band_polygon(x0, y0, x1, y1, nx, ny, near, far):
+    """Return the quad swept by a segment offset along a unit normal.
+
+    :param nx, ny: Unit normal of the segment in plan.
+    :param near:   Offset of one long side along the normal (may be < 0).
+    :param far:    Offset of the other long side.
+    """
+    return [(x0 + nx * near, y0 + ny * near), (x1 + nx * near, y1 + ny * near),
+            (x1 + nx * far, y1 + ny * far), (x0 + nx * far, y0 + ny * far)]
+
+
+def extend_polyline(points, distance):
+    """Return ``points`` with the first and last segments lengthened by ``distance``.
+
+    Walls meet at joins beyond their location curve ends, up to half the
+    joined width away; extended bands keep covering those corners.
+    """
+    points = list(points)
+    if len(points) < 2 or distance <= 0:
+        return points
+    (x0, y0), (x1, y1) = points[0], points[1]
+    length = math.hypot(x1 - x0, y1 - y0)
+    if length:
+        points[0] = (x0 - (x1 - x0) / length * distance, y0 - (y1 - y0) / length * distance)
+    (x0, y0), (x1, y1) = points[-2], points[-1]
+    length = math.hypot(x1 - x0, y1 - y0)
+    if length:
+        points[-1] = (x1 + (x1 - x0) / length * distance, y1 + (y1 - y0) / length * distance)
+    return points
+
+
+def polyline_bands(points, near, far):
+    """Return one band quad per segment of a polyline.
+
+    Each segment is offset along its own left-hand normal, so a
+    tessellated arc becomes a chain of quads.
+    """
+    bands = []
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length == 0:
+            continue
+        nx, ny = -(y1 - y0) / length, (x1 - x0) / length
+        bands.append(band_polygon(x0, y0, x1, y1, nx, ny, near, far))
+    return bands
+
+
+def _axes(polygon):
+    count = len(polygon)
+    for index in range(count):
+        x0, y0 = polygon[index]
+        x1, y1 = polygon[(index + 1) % count]
+        ax, ay = y0 - y1, x1 - x0
+        if ax or ay:
+            yield ax, ay
+
+
+def _project(polygon, ax, ay):
+    values = [x * ax + y * ay for x, y in polygon]
+    return min(values), max(values)
+
+
+def convex_overlap(a, b):
+    """Separating axis test of two convex polygons; touching counts."""
+    for polygon in (a, b):
+        for ax, ay in _axes(polygon):
+            a_min, a_max = _project(a, ax, ay)
+            b_min, b_max = _project(b, ax, ay)
+            if a_max < b_min or b_max < a_min:
+                return False
+    return True
+
+
+def box_hits_polygons(box, polygons):
+    """True if ``box`` overlaps any of the convex ``polygons``."""
+    rectangle = box_polygon(box)
+    for polygon in polygons:
+        if convex_overlap(rectangle, polygon):
+            return True
+    return False
@@ -0,0 +1,57 @@
+"""Quantized geometric hashing that holds at cell edges.
+
+Pure Python, no Revit imports. Measured values are snapped to cells of a
+quantum; a value close to a cell edge is filed under the neighbouring
+cell as well, so two values a hair apart on either side of an edge still
+share a key. An item gets one key per combination of its cells, and
+items sharing any key are grouped with a disjoint set.
+"""
+import math
+from itertools import product
+
+from pyreforge.disjoint_set import DisjointSet
+
+# Values within this fraction of a quantum from a cell edge also go to
+# the neighbouring cell
+EDGE_FRACTION = 0.1
+
+
+def cells(value, quantum):
+    """Return the cell of ``value``, followed by its neighbour near an edge."""
+    scaled = value / quantum
+    cell = int(math.floor(scaled + 0.5))
+    offset = scaled - cell
+    if offset >= 0.5 - EDGE_FRACTION:
+        return cell, cell + 1
+    if offset <= EDGE_FRACTION - 0.5:
+        return cell, cell - 1
+    return cell,
+
+
+def hash_keys(exact, measures):
+    """Return every key of an item.
+
+    :param exact:    Hashable tuple compared as is (category, text...).
+    :param measures: ``(value, quantum)`` pairs snapped to cells.
+    :return:         ``exact`` extended with each combination of cells;
+                     a single key unless some value sits near an edge.
+    """
+    return [exact + combination
+            for combination in product(*[cells(value, quantum) for value, quantum in measures])]
+
+
+def group_by_keys(items):
+    """Group the items that share a key, in one dictionary pass.
+
+    :param items: Iterable of ``(item key, [keys])``.
+    :return:      Lists of item keys, one per group of two or more.
+    """
+    sets = DisjointSet()
+    first = {}
+    for item, keys in items:
+        sets.add(item)
+        for key in keys:
+            other = first.setdefault(key, item)
+            if other != item:
+                sets.union(other, item)
+    return [group for group in sets.groups() if len(group) > 1]
@@ -0,0 +1,116 @@
+"""Per-document cache of graphic lookups and shared override presets.
+
+Looking up the solid fill pattern or a line pattern by name means reading
+every pattern element. ``GraphicsRegistry`` does it once per document
+and checks the cached id is still valid before handing it out, so a
+deleted or changed pattern is looked up again. Override presets are
+interned by their description, so every tool asking for "red lines,
+solid red fill" gets the same ``OverrideGraphicSettings`` object.
+"""
+from Autodesk.Revit.DB import (Color, ElementId, FilteredElementCollector, FillPatternElement, LinePatternElement,
+                               OverrideGraphicSettings)
+
+from pyreforge.ids import id_value
+from pyreforge.storage import document_key
+
+# Valid pen numbers of line weight overrides
+LINE_WEIGHTS = range(1, 17)
+
+
+class GraphicsRegistry(object):
+    """Cached graphic lookups and presets of one document.
+
+    Presets are shared: callers must copy one before changing it.
+    """
+
+    _registries = {}
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._solid_fill_key = None
+        self._line_patterns = None
+        self._presets = {}
+
+    @classmethod
+    def for_document(cls, doc):
+        """Return the registry of ``doc``, kept for as long as the engine lives."""
+        key = document_key(doc)
+        registry = cls._registries.get(key)
+        # Copies of one file share the key; only reuse the registry of this very document
+        if registry is None or not registry.doc.IsValidObject or not registry.doc.Equals(doc):
+            registry = cls(doc)
+            cls._registries[key] = registry
+        return registry
+
+    def solid_fill_id(self):
+        """Return the id of the solid fill pattern, or None if there is none."""
+        if self._solid_fill_key is not None:
+            pattern = self.doc.GetElement(ElementId(self._solid_fill_key))
+            if isinstance(pattern, FillPatternElement) and pattern.GetFillPattern().IsSolidFill:
+                return pattern.Id
+            self._solid_fill_key = None
+        for pattern in FilteredElementCollector(self.doc).OfClass(FillPatternElement):
+            if pattern.GetFillPattern().IsSolidFill:
+                self._solid_fill_key = id_value(pattern.Id)
+                return pattern.Id
+        return None
+
+    def line_pattern_id(self, name):
+        """Return the id of the line pattern called ``name``, or None.
+
+        "Solid" is the built-in solid line pattern.
+        """
+        if name == "Solid":
+            return LinePatternElement.GetSolidPatternId()
+        if self._line_patterns is not None:
+            key = self._line_patterns.get(name)
+            pattern = self.doc.GetElement(ElementId(key)) if key is not None else None
+            if pattern is not None and pattern.Name == name:
+                return pattern.Id
+        # Missing or renamed since the last lookup: read them all again
+        self._line_patterns = dict((pattern.Name, id_value(pattern.Id))
+                                   for pattern in FilteredElementCollector(self.doc).OfClass(LinePatternElement))
+        key = self._line_patterns.get(name)
+        return ElementId(key) if key is not None else None
+
+    def preset(self, line_rgb=None, fill_rgb=None, line_weight=None, line_pattern=None, halftone=False):
+        """Return the shared override settings described by the arguments.
+
+        :param line_rgb:     Projection line color.
+        :param fill_rgb:     Surface color, drawn with the solid fill pattern.
+        :param line_weight:  Projection line weight, 1 to 16.
+        :param line_pattern: Projection line pattern name.
+        """
+        if line_weight is not None and line_weight not in LINE_WEIGHTS:
+            raise ValueError("Invalid line weight: {}".format(line_weight))
+        # Pattern ids are part of the key, so a preset never outlives its pattern
+        solid_fill_id = self.solid_fill_id() if fill_rgb else None
+        line_pattern_id = self.line_pattern_id(line_pattern) if line_pattern is not None else None
+        key = (tuple(line_rgb) if line_rgb else None, tuple(fill_rgb) if fill_rgb else None,
+               id_value(solid_fill_id) if solid_fill_id is not None else None, line_weight,
+               id_value(line_pattern_id) if line_pattern_id is not None else None, bool(halftone))
+        settings = self._presets.get(key)
+        if settings is not None:
+            return settings
+
+        settings = OverrideGraphicSettings()
+        if line_rgb:
+            settings.SetProjectionLineColor(Color(*line_rgb))
+        if fill_rgb:
+            settings.SetSurfaceForegroundPatternColor(Color(*fill_rgb))
+            if solid_fill_id is not None:
+                settings.SetSurfaceForegroundPatternId(solid_fill_id)
+        if line_weight is not None:
+            settings.SetProjectionLineWeight(line_weight)
+        if line_pattern_id is not None:
+            settings.SetProjectionLinePatternId(line_pattern_id)
+        if halftone:
+            settings.SetHalftone(True)
+        self._presets[key] = settings
+        return settings
+
+    def clear(self):
+        """Forget every cached lookup and preset."""
+        self._solid_fill_key = None
+        self._line_patterns = None
+        self._presets = {}
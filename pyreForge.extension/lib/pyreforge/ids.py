@@ -0,0 +1,18 @@
+"""ElementId helpers that work across Revit versions."""
+
+
+def id_value(element_id):
+    """Return the integer value of an ElementId.
+
+    Revit 2024 added ``ElementId.Value`` and deprecated ``IntegerValue``.
+    """
+    value = getattr(element_id, "Value", None)
+    if value is None:
+        value = element_id.IntegerValue
+    return int(value)
+
+
+def category_key(element):
+    """Integer id of the element's category, or None."""
+    category = element.Category
+    return id_value(category.Id) if category is not None else None
@@ -0,0 +1,129 @@
+"""Run several model checks in as few collector passes as possible.
+
+Checks declare the element class and categories they look at. The
+runner groups them by class, collects each group once with the union of
+its categories, and evaluates every check that applies to an element
+while it is in hand, so adding a check adds its test, not another scan
+of the model. Parameter rules are evaluated by their compiled native
+filter, and checks without categories only see model categories.
+"""
+import time
+
+from Autodesk.Revit.DB import ElementFilter, FilteredElementCollector, LogicalOrFilter
+from System.Collections.Generic import List
+
+from pyreforge.ids import category_key, id_value
+from pyreforge.parameter_rules import rules_filter
+from pyreforge.view_scope import category_filter, model_category_filter, model_category_ids
+
+
+class AuditCheck(object):
+    """A named test flagging violating elements.
+
+    :param test:          ``test(element)`` returns True for a violation.
+    :param categories:    BuiltInCategories to look at; None for every
+                          model category.
+    :param element_class: Revit class to collect, e.g. ``FamilyInstance``.
+    """
+
+    def __init__(self, name, test, categories=None, element_class=None):
+        self.name = name
+        self.test = test
+        self.categories = list(categories) if categories is not None else None
+        self.element_class = element_class
+
+
+def rule_check(name, categories, rules, element_class=None):
+    """Check flagging the elements that match every ``ParameterRule``.
+
+    The rules are compiled once into an ``ElementParameterFilter`` and
+    Revit evaluates it, tolerances included, with ``PassesFilter``.
+    """
+    element_filter = rules_filter(rules)
+    return AuditCheck(name, element_filter.PassesFilter, categories, element_class)
+
+
+class AuditResult(object):
+    """Combined result of an audit run.
+
+    :ivar violations: ``{check name: [element]}``.
+    :ivar timings:    ``{check name: seconds spent in its test}``.
+    :ivar collect_time: Seconds spent collecting elements.
+    :ivar scanned:    Number of elements read from the model.
+    """
+
+    def __init__(self, checks):
+        self.checks = list(checks)
+        self.violations = dict((check.name, []) for check in checks)
+        self.timings = dict((check.name, 0.0) for check in checks)
+        self.collect_time = 0.0
+        self.scanned = 0
+
+    def rows(self):
+        """Return ``(check name, element)`` for every violation, in check order."""
+        return [(check.name, element) for check in self.checks for element in self.violations[check.name]]
+
+
+def _groups(checks):
+    groups = []
+    by_class = {}
+    for check in checks:
+        key = check.element_class
+        if key not in by_class:
+            by_class[key] = []
+            groups.append((key, by_class[key]))
+        by_class[key].append(check)
+    return groups
+
+
+def run_audit(doc, checks, view=None):
+    """Evaluate ``checks`` in one collector pass per element class.
+
+    :param view: Only look at elements visible in this view.
+    :return:     ``AuditResult``.
+    """
+    result = AuditResult(checks)
+    violations = result.violations
+    timings = result.timings
+    for element_class, group in _groups(checks):
+        # Checks per category key; checks without categories see every model category
+        by_category = {}
+        any_category = [check for check in group if check.categories is None]
+        categories = []
+        for check in group:
+            for category in check.categories or ():
+                checks_of_category = by_category.setdefault(int(category), [])
+                if not checks_of_category:
+                    categories.append(category)
+                checks_of_category.append(check)
+
+        start = time.time()
+        collector = FilteredElementCollector(doc) if view is None else FilteredElementCollector(doc, view.Id)
+        if element_class is not None:
+            collector = collector.OfClass(element_class)
+        if not any_category:
+            collector = collector.WherePasses(category_filter(categories))
+        elif categories:
+            collector = collector.WherePasses(LogicalOrFilter(List[ElementFilter](
+                [model_category_filter(doc), category_filter(categories)])))
+        else:
+            collector = collector.WherePasses(model_category_filter(doc))
+        elements = collector.WhereElementIsNotElementType().ToElements()
+        result.collect_time += time.time() - start
+        result.scanned += len(elements)
+
+        model_keys = set(id_value(category_id) for category_id in model_category_ids(doc)) if any_category else ()
+        for element in elements:
+            key = category_key(element)
+            if key is None:
+                continue
+            element_checks = by_category.get(key, [])
+            if key in model_keys:
+                element_checks = element_checks + any_category
+            for check in element_checks:
+                start = time.time()
+                failed = check.test(element)
+                timings[check.name] += time.time() - start
+                if failed:
+                    violations[check.name].append(element)
+    return result
@@ -0,0 +1,16 @@
+"""Element names Revit accepts (views, filters, types...)."""
+
+# Characters Revit does not accept in element names
+INVALID_NAME_CHARACTERS = "\\:{}[]|;<>?`~"
+
+
+def invalid_characters(text):
+    """Return the sorted characters of ``text`` Revit rejects in names."""
+    return sorted(set(character for character in text if character in INVALID_NAME_CHARACTERS))
+
+
+def clean_name(name, replacement="_"):
+    """Return ``name`` with every rejected character replaced."""
+    for character in INVALID_NAME_CHARACTERS:
+        name = name.replace(character, replacement)
+    return name
@@ -0,0 +1,217 @@
+"""Persistent journal of the overrides replaced by the highlight tools.
+
+For every element a tool recolors, the overrides it had before are kept
+per document and view in ``%APPDATA%/pyreForge/override_journal``, as
+only the properties that differ from a blank ``OverrideGraphicSettings``.
+Any number of views can later be put back exactly, in one transaction,
+from the same session or days later.
+"""
+import os
+
+from Autodesk.Revit.DB import Color, ElementId, OverrideGraphicSettings, Transaction, ViewDetailLevel
+
+from pyreforge.clash_cache import forget_views
+from pyreforge.ids import id_value
+from pyreforge.overrides import OVERRIDE_PROPERTIES, RED, OverrideBatch, restore_highlight, settings_signature
+from pyreforge.storage import app_data_dir, document_key, load_json, save_json
+
+# Setter of each entry of OVERRIDE_PROPERTIES
+SETTERS = {
+    "Halftone": "SetHalftone",
+    "DetailLevel": "SetDetailLevel",
+    "Transparency": "SetSurfaceTransparency",
+    "ProjectionLineColor": "SetProjectionLineColor",
+    "ProjectionLinePatternId": "SetProjectionLinePatternId",
+    "ProjectionLineWeight": "SetProjectionLineWeight",
+    "CutLineColor": "SetCutLineColor",
+    "CutLinePatternId": "SetCutLinePatternId",
+    "CutLineWeight": "SetCutLineWeight",
+    "SurfaceForegroundPatternColor": "SetSurfaceForegroundPatternColor",
+    "SurfaceForegroundPatternId": "SetSurfaceForegroundPatternId",
+    "IsSurfaceForegroundPatternVisible": "SetSurfaceForegroundPatternVisible",
+    "SurfaceBackgroundPatternColor": "SetSurfaceBackgroundPatternColor",
+    "SurfaceBackgroundPatternId": "SetSurfaceBackgroundPatternId",
+    "IsSurfaceBackgroundPatternVisible": "SetSurfaceBackgroundPatternVisible",
+    "CutForegroundPatternColor": "SetCutForegroundPatternColor",
+    "CutForegroundPatternId": "SetCutForegroundPatternId",
+    "IsCutForegroundPatternVisible": "SetCutForegroundPatternVisible",
+    "CutBackgroundPatternColor": "SetCutBackgroundPatternColor",
+    "CutBackgroundPatternId": "SetCutBackgroundPatternId",
+    "IsCutBackgroundPatternVisible": "SetCutBackgroundPatternVisible",
+}
+
+_blank_signature = []
+
+
+def serialize_settings(settings):
+    """Return the properties of ``settings`` that differ from no override."""
+    if not _blank_signature:
+        _blank_signature.extend(settings_signature(OverrideGraphicSettings()))
+    data = {}
+    for name, value, blank in zip(OVERRIDE_PROPERTIES, settings_signature(settings), _blank_signature):
+        if value != blank:
+            data[name] = list(value) if isinstance(value, tuple) else value
+    return data
+
+
+def deserialize_settings(data):
+    """Build ``OverrideGraphicSettings`` from ``serialize_settings`` output."""
+    settings = OverrideGraphicSettings()
+    for name, value in data.items():
+        setter = getattr(settings, SETTERS.get(name, ""), None)
+        if setter is None:
+            # Property of a newer Revit version
+            continue
+        if name.endswith("Color"):
+            value = Color(*value) if value else Color.InvalidColorValue
+        elif name.endswith("Id"):
+            value = ElementId(value)
+        elif name == "DetailLevel":
+            value = getattr(ViewDetailLevel, value)
+        setter(value)
+    return settings
+
+
+def default_journal_dir():
+    return app_data_dir("override_journal")
+
+
+class OverrideJournal(object):
+    """Original overrides of the elements the tools changed, per view.
+
+    Each entry is ``[tool, serialized settings]``; the first original
+    recorded for an element is kept until it is restored or forgotten.
+    """
+
+    def __init__(self, doc_key, folder=None):
+        self.doc_key = doc_key
+        self.path = os.path.join(folder or default_journal_dir(), "{}.json".format(doc_key))
+        self._views = None
+
+    @classmethod
+    def for_document(cls, doc):
+        return cls(document_key(doc))
+
+    def _load(self):
+        if self._views is None:
+            self._views = load_json(self.path, {})
+        return self._views
+
+    def record(self, view_key, originals, tool):
+        """Journal ``{element key: OverrideGraphicSettings}`` replaced by ``tool``."""
+        if not originals:
+            return
+        entries = self._load().setdefault(str(view_key), {})
+        for key, settings in originals.items():
+            entries.setdefault(str(key), [tool, serialize_settings(settings)])
+
+    def original(self, view_key, key, tool=None):
+        """Return the journaled settings of an element, or None."""
+        entry = self._load().get(str(view_key), {}).get(str(key))
+        if entry is None or (tool is not None and entry[0] != tool):
+            return None
+        return deserialize_settings(entry[1])
+
+    def forget(self, view_key, key):
+        entries = self._load().get(str(view_key))
+        if entries is not None:
+            entries.pop(str(key), None)
+            if not entries:
+                del self._views[str(view_key)]
+
+    def elements(self, view_key, tool=None):
+        """Return the keys of the elements journaled in ``view_key``."""
+        return set(int(key) for key, entry in self._load().get(str(view_key), {}).items()
+                   if tool is None or entry[0] == tool)
+
+    def views(self, tool=None):
+        """Return ``{view key: number of journaled elements}``."""
+        counts = {}
+        for view_key, entries in self._load().items():
+            count = sum(1 for entry in entries.values() if tool is None or entry[0] == tool)
+            if count:
+                counts[int(view_key)] = count
+        return counts
+
+    def restore(self, doc, view_keys=None, tool=None, name="Restore Overrides"):
+        """Write back the journaled originals in one transaction and drop them.
+
+        :param view_keys: Views to restore; None for every journaled view.
+        :param tool:      Only restore what this tool changed.
+        :return:          Number of elements restored.
+        """
+        data = self._load()
+        wanted = None if view_keys is None else set(str(key) for key in view_keys)
+        plan = []
+        done = []
+        for view_key, entries in data.items():
+            if wanted is not None and view_key not in wanted:
+                continue
+            # Deleted views have nothing left to restore
+            view = doc.GetElement(ElementId(int(view_key)))
+            for key, (entry_tool, settings) in entries.items():
+                if tool is not None and entry_tool != tool:
+                    continue
+                done.append((view_key, key))
+                if view is not None:
+                    plan.append((view, ElementId(int(key)), settings))
+
+        restored = 0
+        if plan:
+            t = Transaction(doc, name)
+            t.Start()
+            try:
+                for view, element_id, settings in plan:
+                    try:
+                        view.SetElementOverrides(element_id, deserialize_settings(settings))
+                    except Exception:
+                        # Deleted since it was journaled; no lookup per element beforehand
+                        continue
+                    restored += 1
+                t.Commit()
+            except Exception:
+                t.RollBack()
+                raise
+        for view_key, key in done:
+            self.forget(view_key, key)
+        # Cached clash hits of these views no longer have their highlights
+        forget_views(self.doc_key, view_keys, tool)
+        return restored
+
+    def save(self):
+        save_json(self.path, self._load())
+
+
+def apply_highlight(view, hit_ids, other_ids, tool, name, journal, rgb=RED):
+    """Highlight ``hit_ids`` and put ``other_ids`` back the way they were.
+
+    Originals replaced by the highlight are journaled under ``tool``;
+    elements that no longer need it get their journaled original back
+    (or, if none was journaled, lose the highlight color). An original
+    leaves the journal only once it has been written back. The journal
+    is not saved here.
+
+    :return: ``(written, skipped)`` of the override batch.
+    """
+    view_key = id_value(view.Id)
+    batch = OverrideBatch(view)
+    hit_keys = set()
+    restore_keys = []
+    for element_id in hit_ids:
+        hit_keys.add(id_value(element_id))
+        batch.set_projection_line_color(element_id, rgb)
+    for element_id in other_ids:
+        key = id_value(element_id)
+        original = journal.original(view_key, key, tool)
+        if original is None:
+            batch.reset_projection_line_color(element_id, rgb)
+        else:
+            batch.queue(element_id, ("restore", key), restore_highlight(rgb, original))
+            restore_keys.append(key)
+    written, skipped = batch.apply(name)
+    # Originals the batch declined (recolored since) stay journaled
+    for key in restore_keys:
+        if key in batch.journal:
+            journal.forget(view_key, key)
+    journal.record(view_key, dict(item for item in batch.journal.items() if item[0] in hit_keys), tool)
+    return written, skipped
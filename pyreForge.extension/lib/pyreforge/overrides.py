@@ -0,0 +1,253 @@
+"""Batched per-element graphic overrides.
+
+Tools queue ``element id -> OverrideGraphicSettings`` intents while they
+scan a view and write them all at the end, in one transaction, instead
+of opening a transaction per element.
+
+Before writing, the current overrides of every queued element are read
+once and compared with the target; elements that already look right are
+left alone, and the settings replaced by each write are journaled.
+"""
+from Autodesk.Revit.DB import Color, ElementId, OverrideGraphicSettings, Transaction
+
+from pyreforge.ids import id_value
+
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+
+# OverrideGraphicSettings properties compared by ``settings_signature``;
+# names missing from older Revit versions are read as None
+OVERRIDE_PROPERTIES = (
+    "Halftone",
+    "DetailLevel",
+    "Transparency",
+    "ProjectionLineColor",
+    "ProjectionLinePatternId",
+    "ProjectionLineWeight",
+    "CutLineColor",
+    "CutLinePatternId",
+    "CutLineWeight",
+    "SurfaceForegroundPatternColor",
+    "SurfaceForegroundPatternId",
+    "IsSurfaceForegroundPatternVisible",
+    "SurfaceBackgroundPatternColor",
+    "SurfaceBackgroundPatternId",
+    "IsSurfaceBackgroundPatternVisible",
+    "CutForegroundPatternColor",
+    "CutForegroundPatternId",
+    "IsCutForegroundPatternVisible",
+    "CutBackgroundPatternColor",
+    "CutBackgroundPatternId",
+    "IsCutBackgroundPatternVisible",
+)
+
+
+def color_signature(color):
+    """Return ``(r, g, b)`` of a Revit color, or None if it is unset."""
+    if color is None or not color.IsValid:
+        return None
+    return color.Red, color.Green, color.Blue
+
+
+def settings_signature(settings):
+    """Return a hashable, comparable description of override settings."""
+    signature = []
+    for name in OVERRIDE_PROPERTIES:
+        value = getattr(settings, name, None)
+        if isinstance(value, Color):
+            value = color_signature(value)
+        elif isinstance(value, ElementId):
+            value = id_value(value)
+        elif value is not None and not isinstance(value, (bool, int, float)):
+            value = str(value)
+        signature.append(value)
+    return tuple(signature)
+
+
+def replace_with(settings):
+    """Patch replacing the current overrides by ``settings`` unless equal."""
+    target = settings_signature(settings)
+
+    def patch(current):
+        return None if settings_signature(current) == target else settings
+    return patch
+
+
+def projection_line_color(rgb):
+    """Patch changing only the projection line color, keeping other overrides."""
+    rgb = tuple(rgb)
+
+    def patch(current):
+        if color_signature(current.ProjectionLineColor) == rgb:
+            return None
+        return OverrideGraphicSettings(current).SetProjectionLineColor(Color(*rgb))
+    return patch
+
+
+def reset_projection_line_color(rgb):
+    """Patch clearing the projection line color only while it is still ``rgb``.
+
+    Used to take back a highlight without touching colors set by users.
+    """
+    rgb = tuple(rgb)
+
+    def patch(current):
+        if color_signature(current.ProjectionLineColor) != rgb:
+            return None
+        return OverrideGraphicSettings(current).SetProjectionLineColor(Color.InvalidColorValue)
+    return patch
+
+
+def reset_solid_fill(colors, fill_pattern_id):
+    """Patch clearing a solid color fill while it is still one of ``colors``.
+
+    Only elements whose projection lines and surface foreground share one
+    of ``colors``, with ``fill_pattern_id`` as pattern, lose those three
+    overrides; every other override, and any other element, is kept.
+    """
+    colors = set(tuple(rgb) for rgb in colors)
+    fill_key = id_value(fill_pattern_id)
+
+    def patch(current):
+        line = color_signature(current.ProjectionLineColor)
+        if line not in colors or color_signature(current.SurfaceForegroundPatternColor) != line:
+            return None
+        if id_value(current.SurfaceForegroundPatternId) != fill_key:
+            return None
+        settings = OverrideGraphicSettings(current)
+        settings.SetProjectionLineColor(Color.InvalidColorValue)
+        settings.SetSurfaceForegroundPatternColor(Color.InvalidColorValue)
+        settings.SetSurfaceForegroundPatternId(ElementId.InvalidElementId)
+        return settings
+    return patch
+
+
+def restore_highlight(rgb, original):
+    """Patch writing ``original`` back while the element still has the
+    ``rgb`` highlight; anything else means a user changed it since."""
+    rgb = tuple(rgb)
+
+    def patch(current):
+        if color_signature(current.ProjectionLineColor) != rgb:
+            return None
+        return original
+    return patch
+
+
+class OverrideBatch(object):
+    """Collects override intents for one view and applies them together.
+
+    :ivar journal: ``{element id value: OverrideGraphicSettings}`` holding
+                   the settings each write replaced, first write wins.
+    """
+
+    def __init__(self, view):
+        self.view = view
+        self._intents = {}
+        self._settings = {}
+        self._patches = {}
+        self._order = []
+        self.journal = {}
+        self.written = 0
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self._intents)
+
+    def settings_for(self, key, factory):
+        """Return the shared settings object for ``key``, creating it once."""
+        settings = self._settings.get(key)
+        if settings is None:
+            settings = factory()
+            self._settings[key] = settings
+        return settings
+
+    def queue(self, element_id, key, patch):
+        """Queue ``patch(current_settings)`` for ``element_id``.
+
+        The patch returns the settings to write, or None when the element
+        already has the target graphics. Intents with the same ``key``
+        share one patch.
+        """
+        self._patches.setdefault(key, patch)
+        int_id = id_value(element_id)
+        previous = self._intents.get(int_id)
+        if previous is not None and previous[1] == key:
+            self.skipped += 1
+            return
+        if previous is None:
+            self._order.append(int_id)
+        self._intents[int_id] = (element_id, key)
+
+    def set(self, element_id, settings, key=None):
+        """Queue ``settings`` for ``element_id``.
+
+        :param key: Hashable description of the settings. Intents with the
+                    same key share one settings object; defaults to the
+                    identity of ``settings``.
+        """
+        if key is None:
+            key = ("object", id(settings))
+        settings = self._settings.setdefault(key, settings)
+        self.queue(element_id, key, replace_with(settings))
+
+    def set_projection_line_color(self, element_id, rgb):
+        """Queue a projection line color override, e.g. ``RED`` or ``BLACK``.
+
+        Other overrides the element already has are kept.
+        """
+        self.queue(element_id, ("projection_line_color", tuple(rgb)), projection_line_color(rgb))
+
+    def reset_projection_line_color(self, element_id, rgb):
+        """Queue clearing a projection line color we set earlier, e.g. ``RED``."""
+        self.queue(element_id, ("reset_projection_line_color", tuple(rgb)), reset_projection_line_color(rgb))
+
+    def reset_solid_fill(self, element_id, colors, fill_pattern_id):
+        """Queue clearing a solid fill of one of ``colors`` set by an older tool."""
+        self.queue(element_id, ("reset_solid_fill", tuple(sorted(tuple(rgb) for rgb in colors)),
+                                id_value(fill_pattern_id)), reset_solid_fill(colors, fill_pattern_id))
+
+    def apply(self, name="Apply Graphic Overrides"):
+        """Write every queued intent that changes something and clear the queue.
+
+        :param name: Transaction name shown in the undo list.
+        :return:     ``(written, skipped)`` totals for this batch.
+        """
+        pending = self._diff([self._intents[int_id] for int_id in self._order])
+        self._intents = {}
+        self._order = []
+        if not pending:
+            return self.written, self.skipped
+
+        self._write(self.view.Document, name, pending)
+        return self.written, self.skipped
+
+    def _diff(self, intents):
+        # Read each element's current overrides once; keep real changes only
+        view = self.view
+        patches = self._patches
+        pending = []
+        for element_id, key in intents:
+            current = view.GetElementOverrides(element_id)
+            settings = patches[key](current)
+            if settings is None:
+                self.skipped += 1
+                continue
+            pending.append((element_id, current, settings))
+        return pending
+
+    def _write(self, doc, name, pending):
+        view = self.view
+        journal = self.journal
+        t = Transaction(doc, name)
+        t.Start()
+        try:
+            for element_id, current, settings in pending:
+                view.SetElementOverrides(element_id, settings)
+            t.Commit()
+        except Exception:
+            t.RollBack()
+            raise
+        for element_id, current, settings in pending:
+            journal.setdefault(id_value(element_id), current)
+        self.written += len(pending)
@@ -0,0 +1,72 @@
+"""Declarative parameter audits filtered natively by Revit.
+
+A ``ParameterRule`` such as ``ParameterRule(INSTANCE_SILL_HEIGHT_PARAM,
+"!=", 0)`` describes what a violation looks like. Rules compile to
+``ParameterFilterRuleFactory`` rules inside one ``ElementParameterFilter``,
+so Revit does the comparison and only violating elements reach Python.
+Double values are compared with a tolerance instead of exact equality.
+"""
+from Autodesk.Revit.DB import (ElementFilter, ElementId, ElementParameterFilter, FilteredElementCollector,
+                               FilterRule, LogicalOrFilter, ParameterFilterRuleFactory)
+from System.Collections.Generic import List
+
+# 0.1 mm in feet, Revit's internal length unit
+DEFAULT_TOLERANCE = 0.1 / 304.8
+
+# ParameterFilterRuleFactory method of each operator
+RULE_FACTORIES = {
+    "==": "CreateEqualsRule",
+    "!=": "CreateNotEqualsRule",
+    ">": "CreateGreaterRule",
+    ">=": "CreateGreaterOrEqualRule",
+    "<": "CreateLessRule",
+    "<=": "CreateLessOrEqualRule",
+}
+
+
+class ParameterRule(object):
+    """``parameter <operator> value`` on a built-in double parameter.
+
+    :param parameter: BuiltInParameter to compare.
+    :param operator:  One of the keys of ``RULE_FACTORIES``.
+    :param value:     Value in internal units.
+    :param tolerance: Values closer than this count as equal.
+    """
+
+    def __init__(self, parameter, operator, value, tolerance=DEFAULT_TOLERANCE):
+        if operator not in RULE_FACTORIES:
+            raise ValueError("Unknown operator: {}".format(operator))
+        self.parameter = parameter
+        self.operator = operator
+        self.value = float(value)
+        self.tolerance = tolerance
+
+    def filter_rule(self):
+        create = getattr(ParameterFilterRuleFactory, RULE_FACTORIES[self.operator])
+        return create(ElementId(self.parameter), self.value, self.tolerance)
+
+    def __repr__(self):
+        return "{} {} {} +/- {}".format(self.parameter, self.operator, self.value, self.tolerance)
+
+
+def rules_filter(rules, match_any=False):
+    """Build one native filter from ``rules``.
+
+    :param match_any: Pass elements matching any rule instead of all of them.
+    """
+    filter_rules = [rule.filter_rule() for rule in rules]
+    if not match_any or len(filter_rules) == 1:
+        return ElementParameterFilter(List[FilterRule](filter_rules))
+    return LogicalOrFilter(List[ElementFilter]([ElementParameterFilter(rule) for rule in filter_rules]))
+
+
+def find_violations(doc, category, rules, view=None, match_any=False):
+    """Return the non-type elements of ``category`` matching ``rules``.
+
+    Elements that do not have the parameter never match.
+
+    :param view: Only look at elements visible in this view.
+    """
+    collector = FilteredElementCollector(doc) if view is None else FilteredElementCollector(doc, view.Id)
+    return collector.OfCategory(category).WhereElementIsNotElementType().WherePasses(
+        rules_filter(rules, match_any)).ToElements()
@@ -0,0 +1,64 @@
+"""Reverse index of which materials and filled region types use a fill pattern.
+
+Every material and every ``FilledRegionType`` is read once and each
+pattern id it references is mapped back to it, so finding the unused
+patterns is a single set difference instead of a model scan per pattern.
+"""
+from Autodesk.Revit.DB import ElementId, FilledRegionType, FilteredElementCollector, FillPatternElement, Material
+
+from pyreforge.graphics import GraphicsRegistry
+from pyreforge.ids import id_value
+
+# Pattern properties of materials; the last two are the names used
+# before Revit 2019 split foreground and background patterns
+MATERIAL_PATTERN_PROPERTIES = (
+    "SurfaceForegroundPatternId",
+    "SurfaceBackgroundPatternId",
+    "CutForegroundPatternId",
+    "CutBackgroundPatternId",
+    "SurfacePatternId",
+    "CutPatternId",
+)
+
+# Pattern properties of filled region types, newest first
+FILLED_REGION_PATTERN_PROPERTIES = (
+    "ForegroundPatternId",
+    "BackgroundPatternId",
+    "FillPatternId",
+)
+
+
+def _pattern_keys(element, properties):
+    keys = set()
+    for name in properties:
+        pattern_id = getattr(element, name, None)
+        if pattern_id is not None and pattern_id != ElementId.InvalidElementId:
+            keys.add(id_value(pattern_id))
+    return keys
+
+
+def fill_pattern_users(doc):
+    """Return ``{pattern key: [material or filled region type key]}``."""
+    users = {}
+    for element_class, properties in ((Material, MATERIAL_PATTERN_PROPERTIES),
+                                      (FilledRegionType, FILLED_REGION_PATTERN_PROPERTIES)):
+        for element in FilteredElementCollector(doc).OfClass(element_class):
+            element_key = id_value(element.Id)
+            for pattern_key in _pattern_keys(element, properties):
+                users.setdefault(pattern_key, []).append(element_key)
+    return users
+
+
+def unused_fill_patterns(doc, users=None):
+    """Return the fill patterns no material or filled region type uses.
+
+    The solid fill pattern is never returned.
+    """
+    if users is None:
+        users = fill_pattern_users(doc)
+    used = set(users)
+    solid_fill_id = GraphicsRegistry.for_document(doc).solid_fill_id()
+    if solid_fill_id is not None:
+        used.add(id_value(solid_fill_id))
+    return [pattern for pattern in FilteredElementCollector(doc).OfClass(FillPatternElement)
+            if id_value(pattern.Id) not in used]
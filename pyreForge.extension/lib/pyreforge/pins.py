@@ -0,0 +1,144 @@
+"""Bulk pin and unpin of viewports and links, writing only what changes.
+
+Targets are gathered per group (the sheet of a viewport, the type of a
+link) and their pinned state is read once. Only the elements whose state
+differs from the requested one are written, all in one transaction, and
+``PinReport`` keeps the counts before and after for every group.
+"""
+from Autodesk.Revit.DB import (Element, FilteredElementCollector, ImportInstance, RevitLinkInstance, Transaction,
+                               Viewport, ViewSheet)
+
+from pyreforge.ids import id_value
+
+
+def sheet_label(sheet):
+    return "{} - {}".format(sheet.SheetNumber, sheet.Name)
+
+
+def type_label(doc, element):
+    element_type = doc.GetElement(element.GetTypeId())
+    return Element.Name.GetValue(element_type) if element_type is not None else "<no type>"
+
+
+def sheet_viewports(doc, sheets=None):
+    """Yield ``(sheet label, viewport)`` for the viewports on ``sheets``.
+
+    With no sheets, every viewport of the project is yielded, read in one
+    collector pass.
+    """
+    if sheets is not None:
+        for sheet in sheets:
+            label = sheet_label(sheet)
+            for viewport_id in sheet.GetAllViewports():
+                viewport = doc.GetElement(viewport_id)
+                if viewport is not None:
+                    yield label, viewport
+        return
+    labels = dict((id_value(sheet.Id), sheet_label(sheet))
+                  for sheet in FilteredElementCollector(doc).OfClass(ViewSheet))
+    for viewport in FilteredElementCollector(doc).OfClass(Viewport):
+        yield labels.get(id_value(viewport.SheetId), "<no sheet>"), viewport
+
+
+def linked_instances(doc, cad=False):
+    """Return the Revit or CAD link instances; unlinked CAD imports are skipped."""
+    return [instance for instance in FilteredElementCollector(doc).OfClass(ImportInstance if cad else RevitLinkInstance)
+            if not cad or instance.IsLinked]
+
+
+def link_instances(doc, cad=False, types=None):
+    """Yield ``(link type label, instance)`` for Revit or CAD links.
+
+    :param cad:   True for CAD links, False for Revit links.
+    :param types: ``{type key: label}`` of the link types to keep, as
+                  returned by ``link_types``; None keeps them all, labeled
+                  by type name.
+    """
+    for instance in linked_instances(doc, cad):
+        if types is None:
+            yield type_label(doc, instance), instance
+            continue
+        label = types.get(id_value(instance.GetTypeId()))
+        if label is not None:
+            yield label, instance
+
+
+def link_types(doc, cad=False):
+    """Return ``{type key: label}`` of the link types with linked instances.
+
+    Labels are the type names; types sharing a name get their id appended,
+    so every label stands for one type.
+    """
+    names = {}
+    for instance in linked_instances(doc, cad):
+        type_key = id_value(instance.GetTypeId())
+        if type_key not in names:
+            names[type_key] = type_label(doc, instance)
+    counts = {}
+    for name in names.values():
+        counts[name] = counts.get(name, 0) + 1
+    return dict((type_key, name if counts[name] == 1 else "{} [{}]".format(name, type_key))
+                for type_key, name in names.items())
+
+
+class PinReport(object):
+    """Pinned counts per group before and after setting ``pinned``.
+
+    Built from the targets alone; ``changes`` holds the elements to write.
+    """
+
+    def __init__(self, targets, pinned):
+        self.pinned = pinned
+        self.totals = {}
+        self.pinned_before = {}
+        self.changed = {}
+        self.changes = []
+        self.failed = []
+        for label, element in targets:
+            self.totals[label] = self.totals.get(label, 0) + 1
+            self.changed.setdefault(label, 0)
+            state = element.Pinned
+            if state:
+                self.pinned_before[label] = self.pinned_before.get(label, 0) + 1
+            if state != pinned:
+                self.changes.append((label, element))
+
+    def pinned_after(self, label):
+        changed = self.changed.get(label, 0)
+        before = self.pinned_before.get(label, 0)
+        return before + changed if self.pinned else before - changed
+
+    def written(self):
+        return sum(self.changed.values())
+
+    def rows(self):
+        """Rows of ``[group, elements, pinned before, changed, pinned after]``."""
+        return [[label, self.totals[label], self.pinned_before.get(label, 0), self.changed[label],
+                 self.pinned_after(label)] for label in sorted(self.totals)]
+
+
+def apply_pins(doc, report, name="Pin Elements"):
+    """Write the changes of ``report`` in one transaction.
+
+    Elements Revit refuses to change (inside groups, for example) are
+    listed in ``report.failed`` as ``(group, element key, message)``.
+
+    :return: Number of elements written.
+    """
+    if not report.changes:
+        return 0
+    t = Transaction(doc, name)
+    t.Start()
+    try:
+        for label, element in report.changes:
+            try:
+                element.Pinned = report.pinned
+            except Exception as error:
+                report.failed.append((label, id_value(element.Id), str(error)))
+                continue
+            report.changed[label] += 1
+        t.Commit()
+    except Exception:
+        t.RollBack()
+        raise
+    return report.written()
@@ -0,0 +1,143 @@
+"""Batch creation of plan views for many levels at once.
+
+``PlanGenerator`` reads the levels, view family types, view templates and
+view names of a document once into maps, then creates every requested
+plan in a single transaction, named from a template and with an optional
+view template per plan type.
+"""
+from string import Formatter
+
+from Autodesk.Revit.DB import (AreaScheme, Element, FilteredElementCollector, Level, Transaction, View, ViewFamily,
+                               ViewFamilyType, ViewPlan, ViewType)
+
+from pyreforge.names import invalid_characters
+
+# Plan types offered by the tools: (label, view family, view type of its templates)
+PLAN_TYPES = [
+    ("Floor Plan", ViewFamily.FloorPlan, ViewType.FloorPlan),
+    ("Area Plan", ViewFamily.AreaPlan, ViewType.AreaPlan),
+    ("Structural Plan", ViewFamily.StructuralPlan, ViewType.EngineeringPlan),
+    ("Ceiling Plan", ViewFamily.CeilingPlan, ViewType.CeilingPlan),
+]
+
+# Fields: {level}, {plan} (plan type label), {type} (view family type name)
+DEFAULT_NAME_TEMPLATE = "{level} - {plan}"
+
+
+def check_name_template(name_template):
+    """Raise ``ValueError`` if ``name_template`` uses unknown fields or
+    characters Revit does not accept in view names."""
+    try:
+        name_template.format(level="", plan="", type="")
+        literal = "".join(text for text, _, _, _ in Formatter().parse(name_template))
+    except (KeyError, IndexError, ValueError) as error:
+        raise ValueError("Invalid name template {}: {}".format(name_template, error))
+    invalid = invalid_characters(literal)
+    if invalid:
+        raise ValueError("Invalid name template {}: view names cannot contain {}".format(
+            name_template, " ".join(invalid)))
+
+
+def unique_name(name, taken):
+    """Return ``name``, or ``name (2)``, ``name (3)``... if it is taken."""
+    candidate = name
+    number = 2
+    while candidate in taken:
+        candidate = "{} ({})".format(name, number)
+        number += 1
+    return candidate
+
+
+class PlanGenerator(object):
+    """Creates plan views from lookups built once per document."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        levels = FilteredElementCollector(doc).OfClass(Level).ToElements()
+        self.levels = sorted(levels, key=lambda level: level.Elevation)
+        self.levels_by_name = dict((level.Name, level) for level in levels)
+
+        # First view family type of each family
+        self.view_family_types = {}
+        for view_family_type in FilteredElementCollector(doc).OfClass(ViewFamilyType):
+            self.view_family_types.setdefault(str(view_family_type.ViewFamily), view_family_type)
+
+        # View templates per view type, and every view name in use
+        self.templates = {}
+        self.view_names = set()
+        for view in FilteredElementCollector(doc).OfClass(View):
+            if view.IsTemplate:
+                self.templates.setdefault(str(view.ViewType), []).append(view)
+            else:
+                self.view_names.add(view.Name)
+
+        area_schemes = FilteredElementCollector(doc).OfClass(AreaScheme).ToElements()
+        self.area_scheme = area_schemes[0] if area_schemes else None
+
+    def plan_type(self, label):
+        for plan_type in PLAN_TYPES:
+            if plan_type[0] == label:
+                return plan_type
+        raise ValueError("Unknown plan type: {}".format(label))
+
+    def templates_for(self, label):
+        """Return the view templates that can be applied to ``label`` plans."""
+        return sorted(self.templates.get(str(self.plan_type(label)[2]), []), key=lambda view: view.Name)
+
+    def _create_view(self, view_family, view_family_type, level):
+        if view_family == ViewFamily.AreaPlan:
+            if self.area_scheme is None:
+                raise ValueError("The project has no area scheme")
+            return ViewPlan.CreateAreaPlan(self.doc, self.area_scheme.Id, level.Id)
+        return ViewPlan.Create(self.doc, view_family_type.Id, level.Id)
+
+    def create(self, level_names, labels, name_template=DEFAULT_NAME_TEMPLATE, view_templates=None,
+               name="Create Plans"):
+        """Create a plan of every ``labels`` type for every level, in one transaction.
+
+        :param view_templates: ``{plan type label: view template}`` to apply.
+        :return: ``(created views, [(level name, label, error message)])``.
+        """
+        view_templates = view_templates or {}
+        created = []
+        failures = []
+        t = Transaction(self.doc, name)
+        t.Start()
+        try:
+            for level_name in level_names:
+                level = self.levels_by_name.get(level_name)
+                if level is None:
+                    failures.append((level_name, "", "Level not found"))
+                    continue
+                for label in labels:
+                    _, view_family, _ = self.plan_type(label)
+                    view_family_type = self.view_family_types.get(str(view_family))
+                    # Area plans are created from the area scheme, not a type
+                    if view_family_type is None and view_family != ViewFamily.AreaPlan:
+                        failures.append((level_name, label, "No view family type"))
+                        continue
+                    try:
+                        view = self._create_view(view_family, view_family_type, level)
+                    except Exception as error:
+                        failures.append((level_name, label, str(error)))
+                        continue
+                    type_name = Element.Name.GetValue(view_family_type) if view_family_type is not None else label
+                    view_name = unique_name(name_template.format(level=level_name, plan=label, type=type_name),
+                                            self.view_names)
+                    try:
+                        # Level and type names can still bring characters Revit rejects
+                        view.Name = view_name
+                        template = view_templates.get(label)
+                        if template is not None:
+                            view.ViewTemplateId = template.Id
+                    except Exception as error:
+                        self.doc.Delete(view.Id)
+                        failures.append((level_name, label, str(error)))
+                        continue
+                    self.view_names.add(view_name)
+                    created.append(view)
+            t.Commit()
+        except Exception:
+            t.RollBack()
+            raise
+        return created, failures
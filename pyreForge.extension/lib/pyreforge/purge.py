@@ -0,0 +1,58 @@
+"""Revit side of purge plans: ask for dependents, then delete in one call."""
+from Autodesk.Revit.DB import ElementId, Transaction
+from System.Collections.Generic import List
+
+from pyreforge.ids import id_value
+from pyreforge.purge_plan import PurgePlan
+
+
+def dependents_of(doc, element_ids):
+    """Return ``{key: keys Revit would delete with it}`` for ``element_ids``.
+
+    Uses ``Element.GetDependentElements`` (Revit 2018.1 and newer); older
+    versions report no dependents.
+    """
+    dependents = {}
+    for element_id in element_ids:
+        element = doc.GetElement(element_id)
+        if element is None:
+            continue
+        get_dependents = getattr(element, "GetDependentElements", None)
+        keys = [id_value(dependent_id) for dependent_id in get_dependents(None)] if get_dependents else []
+        dependents[id_value(element_id)] = keys
+    return dependents
+
+
+def plan_purge(doc, element_ids):
+    """Build the ``PurgePlan`` of deleting ``element_ids``."""
+    element_ids = list(element_ids)
+    return PurgePlan([id_value(element_id) for element_id in element_ids], dependents_of(doc, element_ids))
+
+
+def category_label(doc):
+    """``label_of`` for ``PurgePlan.summary`` naming each key's category."""
+    def label_of(key):
+        element = doc.GetElement(ElementId(key))
+        category = element.Category if element is not None else None
+        return category.Name if category is not None else "Other"
+    return label_of
+
+
+def delete_plan(doc, plan, name="Purge"):
+    """Delete the safe candidates of ``plan`` in one transaction and one call.
+
+    Candidates the plan holds back are left in place.
+
+    :return: Number of elements Revit deleted, cascade included.
+    """
+    if not plan.safe:
+        return 0
+    t = Transaction(doc, name)
+    t.Start()
+    try:
+        deleted = doc.Delete(List[ElementId]([ElementId(key) for key in plan.safe]))
+        t.Commit()
+    except Exception:
+        t.RollBack()
+        raise
+    return deleted.Count
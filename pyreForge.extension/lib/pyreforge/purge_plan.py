@@ -0,0 +1,117 @@
+"""Dry-run plan of a purge: what gets deleted and what goes with it.
+
+Pure Python: the plan works on integer element keys and a
+``{key: dependent keys}`` map, so the cascade can be worked out and
+reported before anything is deleted, and tested without Revit.
+
+The map may also hold elements that are not candidates. They survive
+the purge, and so must what they own: a candidate whose cascade would
+take along a dependent shared with a survivor is held back, and only the
+safe candidates are deleted.
+"""
+
+
+def reachable(graph, roots):
+    """Return every key reachable from ``roots`` in ``graph``, roots included."""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        key = stack.pop()
+        if key in seen:
+            continue
+        seen.add(key)
+        stack.extend(graph.get(key, ()))
+    return seen
+
+
+class PurgePlan(object):
+    """Candidates of a purge and the elements deleted along with them.
+
+    :param candidates: Element keys the purge would delete.
+    :param dependents: ``{key: keys deleted together with it}``, for the
+                       candidates and for any surviving owners known.
+    """
+
+    def __init__(self, candidates, dependents):
+        self.candidates = []
+        seen = set()
+        for key in candidates:
+            if key not in seen:
+                seen.add(key)
+                self.candidates.append(key)
+        self._candidate_set = seen
+        self.graph = dict((key, set(keys) - set([key])) for key, keys in dependents.items())
+        self._safe = None
+        self._cascade = None
+
+    def __len__(self):
+        return len(self.candidates)
+
+    @property
+    def safe(self):
+        """Candidates that can go without taking along what a survivor owns.
+
+        Holding a candidate back makes it a survivor too, which can hold
+        back others in turn, so this runs until nothing changes.
+        """
+        if self._safe is None:
+            safe = set(self._candidate_set)
+            while True:
+                deleted = reachable(self.graph, safe)
+                owned = reachable(self.graph, [key for key in self.graph if key not in deleted])
+                held = set(key for key in safe if (self.cascade_of(key) - safe) & owned)
+                if not held:
+                    break
+                safe -= held
+            self._safe = [key for key in self.candidates if key in safe]
+        return self._safe
+
+    @property
+    def held(self):
+        """Candidates kept because their cascade reaches a survivor's dependents."""
+        safe = set(self.safe)
+        return [key for key in self.candidates if key not in safe]
+
+    @property
+    def cascade(self):
+        """Keys deleted only because a safe candidate depends on them."""
+        if self._cascade is None:
+            safe = self.safe
+            self._cascade = reachable(self.graph, safe) - set(safe)
+        return self._cascade
+
+    @property
+    def total(self):
+        return len(self.safe) + len(self.cascade)
+
+    def cascade_of(self, key):
+        """Keys that deleting ``key`` alone would take along."""
+        return reachable(self.graph, [key]) - set([key])
+
+    def shared(self):
+        """Cascade keys reached from more than one safe candidate."""
+        counts = {}
+        safe = set(self.safe)
+        for key in self.safe:
+            for dependent in self.cascade_of(key) - safe:
+                counts[dependent] = counts.get(dependent, 0) + 1
+        return set(key for key, count in counts.items() if count > 1)
+
+    def covered(self):
+        """Safe candidates that another safe candidate deletes anyway."""
+        covered = set()
+        safe = set(self.safe)
+        for key in self.safe:
+            covered.update(self.cascade_of(key) & safe)
+        return covered
+
+    def summary(self, label_of):
+        """Count the cascade by ``label_of(key)``, e.g. a category name.
+
+        :return: ``[(label, count)]``, largest first.
+        """
+        counts = {}
+        for key in self.cascade:
+            label = label_of(key)
+            counts[label] = counts.get(label, 0) + 1
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,154 @@
+"""Uniform-grid spatial hash for 2D rectangles.
+
+Pure Python, no Revit imports. Boxes are ``(minx, miny, maxx, maxy)``
+tuples in view coordinates; keys can be anything hashable (ElementIds,
+integers, strings).
+"""
+import math
+
+# Boxes touching more cells than this are kept in a separate list and
+# tested linearly, so one huge element cannot flood the grid.
+MAX_CELLS_PER_BOX = 256
+
+
+def boxes_overlap(a, b):
+    """Return True if two ``(minx, miny, maxx, maxy)`` boxes touch or overlap."""
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+def suggest_cell_size(boxes, factor=2.0):
+    """Pick a cell size from the median box extent.
+
+    :param boxes:  Iterable of ``(minx, miny, maxx, maxy)`` tuples.
+    :param factor: Multiplier applied to the median extent.
+    """
+    extents = sorted(max(b[2] - b[0], b[3] - b[1]) for b in boxes)
+    if not extents:
+        return 1.0
+    median = extents[len(extents) // 2]
+    if median <= 0:
+        return 1.0
+    return median * factor
+
+
+class SpatialHash(object):
+    """Buckets boxes into square grid cells for fast overlap queries."""
+
+    def __init__(self, cell_size):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive, got {}".format(cell_size))
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._boxes = {}
+        self._oversized = []
+
+    @classmethod
+    def from_boxes(cls, items, cell_size=None):
+        """Build an index from ``(key, (minx, miny, maxx, maxy))`` pairs."""
+        items = list(items)
+        if cell_size is None:
+            cell_size = suggest_cell_size(box for _, box in items)
+        index = cls(cell_size)
+        for key, box in items:
+            index.insert(key, box)
+        return index
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __contains__(self, key):
+        return key in self._boxes
+
+    def keys(self):
+        return list(self._boxes)
+
+    def _cell_range(self, box):
+        size = self.cell_size
+        return (int(math.floor(box[0] / size)), int(math.floor(box[1] / size)),
+                int(math.floor(box[2] / size)), int(math.floor(box[3] / size)))
+
+    def insert(self, key, box):
+        """Add a box under ``key``. Re-inserting a key replaces its box."""
+        if key in self._boxes:
+            self.remove(key)
+        box = tuple(box)
+        self._boxes[key] = box
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS_PER_BOX:
+            self._oversized.append(key)
+            return
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [key]
+                else:
+                    bucket.append(key)
+
+    def remove(self, key):
+        """Drop ``key`` from the index. Unknown keys are ignored."""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return
+        if key in self._oversized:
+            self._oversized.remove(key)
+            return
+        x0, y0, x1, y1 = self._cell_range(box)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None and key in bucket:
+                    bucket.remove(key)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+
+    def box(self, key):
+        """Return the stored box for ``key``."""
+        return self._boxes[key]
+
+    def cells_of(self, box):
+        """Return the grid cells ``box`` touches, or None past ``MAX_CELLS_PER_BOX``."""
+        x0, y0, x1, y1 = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS_PER_BOX:
+            return None
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def bucket(self, cell):
+        """Return the keys stored in one grid cell."""
+        return self._cells.get(cell, ())
+
+    def oversized(self):
+        """Return the keys kept outside the grid."""
+        return list(self._oversized)
+
+    def candidates(self, box):
+        """Return the keys sharing at least one grid cell with ``box``."""
+        found = set(self._oversized)
+        x0, y0, x1, y1 = self._cell_range(box)
+        cells = self._cells
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # Query box is larger than the populated grid, walk the buckets instead
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.update(bucket)
+            return found
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def query(self, box):
+        """Return the keys whose boxes overlap ``box``."""
+        boxes = self._boxes
+        return [key for key in self.candidates(box) if boxes_overlap(box, boxes[key])]
+
+    def first_hit(self, box, accept=None):
+        """Return one overlapping key (optionally passing ``accept(key)``), or None."""
+        boxes = self._boxes
+        for key in self.candidates(box):
+            if boxes_overlap(box, boxes[key]) and (accept is None or accept(key)):
+                return key
+        return None
@@ -0,0 +1,37 @@
+"""Per-user files of the pyreForge tools (caches and journals).
+
+Everything lives under ``%APPDATA%/pyreForge`` and is keyed by document,
+so results follow a project across sessions but not across users.
+"""
+import json
+import os
+
+
+def app_data_dir(*parts):
+    """Return ``%APPDATA%/pyreForge/<parts>`` (home folder if unset)."""
+    root = os.getenv("APPDATA") or os.path.expanduser("~")
+    return os.path.join(root, "pyreForge", *parts)
+
+
+def document_key(doc):
+    """Stable key for a document: the unique id of its Project Information."""
+    return doc.ProjectInformation.UniqueId
+
+
+def load_json(path, default):
+    """Read a JSON file; a missing or corrupt file gives ``default``."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except ValueError:
+        return default
+
+
+def save_json(path, data):
+    folder = os.path.dirname(path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    with open(path, "w") as handle:
+        json.dump(data, handle, separators=(",", ":"))
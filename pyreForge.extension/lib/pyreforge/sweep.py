@@ -0,0 +1,38 @@
+"""Sort-and-sweep self-overlap search for 2D boxes.
+
+Pure Python, no Revit imports. Boxes are sorted on their X extent and
+swept left to right with an active list; only boxes still active on X
+are tested on Y, so the cost follows the number of real neighbours
+rather than n squared.
+"""
+
+
+def sweep_pairs(items, strict=False):
+    """Yield ``(key_a, key_b)`` for every pair of overlapping boxes.
+
+    :param items:  Iterable of ``(key, (minx, miny, maxx, maxy))``, e.g.
+                   ``BoxTable.items()``.
+    :param strict: Require interior overlap; touching edges do not count.
+    :return:       Pairs ordered so that ``key_a`` came before ``key_b`` in
+                   ``items``, matching an ``i < j`` double loop.
+    """
+    entries = [(box[0], order, key, box) for order, (key, box) in enumerate(items)]
+    entries.sort()
+    active = []
+    for minx, order, key, box in entries:
+        if strict:
+            active = [entry for entry in active if entry[3][2] > minx]
+        else:
+            active = [entry for entry in active if entry[3][2] >= minx]
+        miny, maxy = box[1], box[3]
+        for _, other_order, other_key, other_box in active:
+            if strict:
+                hit = other_box[1] < maxy and other_box[3] > miny and other_box[0] < box[2]
+            else:
+                hit = other_box[1] <= maxy and other_box[3] >= miny
+            if hit:
+                if other_order < order:
+                    yield other_key, key
+                else:
+                    yield key, other_key
+        active.append((minx, order, key, box))
@@ -0,0 +1,110 @@
+"""Project-wide index of which element is tagged in which view.
+
+One pass over every ``IndependentTag`` in the document maps each tagged
+element to the views it is tagged in. The index is saved per document
+under ``%APPDATA%/pyreForge/tag_index`` and updated incrementally: the
+next run compares each tag's ``VersionGuid``, straight from the
+collector, and only reads tags that are new or changed again; deleted
+tags are dropped.
+"""
+import os
+
+from Autodesk.Revit.DB import ElementId, FilteredElementCollector, IndependentTag
+
+from pyreforge.ids import id_value
+from pyreforge.storage import app_data_dir, document_key, load_json, save_json
+
+# Bump when the stored entry layout changes
+INDEX_VERSION = 1
+
+
+def tagged_element_keys(tag):
+    """Return the integer ids of the local elements ``tag`` refers to."""
+    if hasattr(tag, "GetTaggedLocalElementIds"):
+        element_ids = tag.GetTaggedLocalElementIds()
+    else:
+        # Revit 2021 and older tag a single element
+        element_ids = [tag.TaggedLocalElementId]
+    return [id_value(element_id) for element_id in element_ids if element_id != ElementId.InvalidElementId]
+
+
+def tag_stamp(tag):
+    version = getattr(tag, "VersionGuid", None)
+    return str(version) if version is not None else None
+
+
+def default_index_dir():
+    return app_data_dir("tag_index")
+
+
+class TagIndex(object):
+    """Tagged element -> views index of one document.
+
+    Entries are ``{tag key: [view key, category key, [element keys], stamp]}``.
+    """
+
+    def __init__(self, path=None, tags=None):
+        self.path = path
+        self.tags = tags or {}
+        self._by_element = None
+
+    @classmethod
+    def for_document(cls, doc, folder=None):
+        """Load the saved index of ``doc`` and bring it up to date."""
+        path = os.path.join(folder or default_index_dir(), "{}.json".format(document_key(doc)))
+        data = load_json(path, {})
+        tags = data.get("tags", {}) if data.get("version") == INDEX_VERSION else {}
+        index = cls(path, dict((int(key), entry) for key, entry in tags.items()))
+        index.update(doc)
+        return index
+
+    def update(self, doc):
+        """Re-read new and changed tags and drop deleted ones.
+
+        :return: ``(read, dropped)`` tag counts.
+        """
+        tags = self.tags
+        current = set()
+        read = 0
+        for tag in FilteredElementCollector(doc).OfClass(IndependentTag):
+            key = id_value(tag.Id)
+            current.add(key)
+            entry = tags.get(key)
+            stamp = tag_stamp(tag)
+            if entry is not None and stamp is not None and entry[3] == stamp:
+                continue
+            category = tag.Category
+            tags[key] = [id_value(tag.OwnerViewId), id_value(category.Id) if category is not None else None,
+                         tagged_element_keys(tag), stamp]
+            read += 1
+
+        dropped = [key for key in tags if key not in current]
+        for key in dropped:
+            del tags[key]
+
+        if read or dropped:
+            self._by_element = None
+        return read, len(dropped)
+
+    def save(self):
+        save_json(self.path, {"version": INDEX_VERSION,
+                              "tags": dict((str(key), entry) for key, entry in self.tags.items())})
+
+    def _element_map(self):
+        if self._by_element is None:
+            by_element = {}
+            for view_key, category_key, element_keys, _ in self.tags.values():
+                for element_key in element_keys:
+                    by_element.setdefault(element_key, []).append((view_key, category_key))
+            self._by_element = by_element
+        return self._by_element
+
+    def untagged(self, element_keys, tag_categories=None):
+        """Return the ``element_keys`` that are not tagged in any view."""
+        by_element = self._element_map()
+        untagged = set()
+        for element_key in element_keys:
+            if not any(tag_categories is None or category_key in tag_categories
+                       for _, category_key in by_element.get(element_key, ())):
+                untagged.add(element_key)
+        return untagged
@@ -0,0 +1,137 @@
+"""Which tag categories can tag which element categories.
+
+``UntaggedFinder`` checks any mix of registered categories in one
+view-scoped multi-category collector pass: elements and their tags come
+back together, tagged ids go into integer sets, and untagged elements
+are a set membership test away.
+"""
+from Autodesk.Revit.DB import BuiltInCategory, ElementId, FilteredElementCollector, IndependentTag
+
+from pyreforge.ids import id_value
+from pyreforge.tag_index import tagged_element_keys
+from pyreforge.view_scope import category_filter
+
+MULTI_CATEGORY_TAGS = BuiltInCategory.OST_MultiCategoryTags
+
+
+class TagPair(object):
+    """An element category and the tag categories that tag it.
+
+    :param multi_category: Multi-category tags also count.
+    """
+
+    def __init__(self, label, element_category, tag_categories, multi_category=True):
+        self.label = label
+        self.element_category = element_category
+        self.tag_categories = list(tag_categories)
+        if multi_category:
+            self.tag_categories.append(MULTI_CATEGORY_TAGS)
+        self.element_key = int(element_category)
+        self.tag_keys = frozenset(int(category) for category in self.tag_categories)
+
+
+# Spatial elements are tagged by their own tag classes, never by
+# multi-category tags
+TAG_REGISTRY = [
+    TagPair("Doors", BuiltInCategory.OST_Doors, [BuiltInCategory.OST_DoorTags]),
+    TagPair("Windows", BuiltInCategory.OST_Windows, [BuiltInCategory.OST_WindowTags]),
+    TagPair("Rooms", BuiltInCategory.OST_Rooms, [BuiltInCategory.OST_RoomTags], multi_category=False),
+    TagPair("Areas", BuiltInCategory.OST_Areas, [BuiltInCategory.OST_AreaTags], multi_category=False),
+    TagPair("Spaces", BuiltInCategory.OST_MEPSpaces, [BuiltInCategory.OST_MEPSpaceTags], multi_category=False),
+    TagPair("Walls", BuiltInCategory.OST_Walls, [BuiltInCategory.OST_WallTags]),
+    TagPair("Floors", BuiltInCategory.OST_Floors, [BuiltInCategory.OST_FloorTags]),
+    TagPair("Ceilings", BuiltInCategory.OST_Ceilings, [BuiltInCategory.OST_CeilingTags]),
+    TagPair("Stairs", BuiltInCategory.OST_Stairs, [BuiltInCategory.OST_StairsTags]),
+    TagPair("Curtain Panels", BuiltInCategory.OST_CurtainWallPanels, [BuiltInCategory.OST_CurtainWallPanelTags]),
+    TagPair("Casework", BuiltInCategory.OST_Casework, [BuiltInCategory.OST_CaseworkTags]),
+    TagPair("Furniture", BuiltInCategory.OST_Furniture, [BuiltInCategory.OST_FurnitureTags]),
+    TagPair("Generic Models", BuiltInCategory.OST_GenericModel, [BuiltInCategory.OST_GenericModelTags]),
+    TagPair("Specialty Equipment", BuiltInCategory.OST_SpecialityEquipment,
+            [BuiltInCategory.OST_SpecialityEquipmentTags]),
+    TagPair("Parking", BuiltInCategory.OST_Parking, [BuiltInCategory.OST_ParkingTags]),
+    TagPair("Structural Columns", BuiltInCategory.OST_StructuralColumns, [BuiltInCategory.OST_StructuralColumnTags]),
+    TagPair("Structural Framing", BuiltInCategory.OST_StructuralFraming, [BuiltInCategory.OST_StructuralFramingTags]),
+    TagPair("Mechanical Equipment", BuiltInCategory.OST_MechanicalEquipment,
+            [BuiltInCategory.OST_MechanicalEquipmentTags]),
+    TagPair("Electrical Equipment", BuiltInCategory.OST_ElectricalEquipment,
+            [BuiltInCategory.OST_ElectricalEquipmentTags]),
+    TagPair("Electrical Fixtures", BuiltInCategory.OST_ElectricalFixtures, [BuiltInCategory.OST_ElectricalFixtureTags]),
+    TagPair("Lighting Fixtures", BuiltInCategory.OST_LightingFixtures, [BuiltInCategory.OST_LightingFixtureTags]),
+    TagPair("Plumbing Fixtures", BuiltInCategory.OST_PlumbingFixtures, [BuiltInCategory.OST_PlumbingFixtureTags]),
+    TagPair("Air Terminals", BuiltInCategory.OST_DuctTerminal, [BuiltInCategory.OST_DuctTerminalTags]),
+    TagPair("Sprinklers", BuiltInCategory.OST_Sprinklers, [BuiltInCategory.OST_SprinklerTags]),
+    TagPair("Ducts", BuiltInCategory.OST_DuctCurves, [BuiltInCategory.OST_DuctTags]),
+    TagPair("Pipes", BuiltInCategory.OST_PipeCurves, [BuiltInCategory.OST_PipeTags]),
+]
+
+
+def tag_pair(element_category):
+    """Return the registered ``TagPair`` of an element category, or None."""
+    key = int(element_category)
+    for pair in TAG_REGISTRY:
+        if pair.element_key == key:
+            return pair
+    return None
+
+
+def tagged_keys(tag):
+    """Return the integer ids of the elements a tag of any kind refers to."""
+    if isinstance(tag, IndependentTag):
+        return tagged_element_keys(tag)
+    # Room, area and space tags
+    room_id = getattr(tag, "TaggedLocalRoomId", None)
+    if room_id is not None:
+        return [id_value(room_id)] if room_id != ElementId.InvalidElementId else []
+    for name in ("Area", "Space"):
+        element = getattr(tag, name, None)
+        if element is not None:
+            return [id_value(element.Id)]
+    return []
+
+
+class UntaggedFinder(object):
+    """Finds untagged elements of several registered categories at once."""
+
+    def __init__(self, pairs):
+        self.pairs = list(pairs)
+        self._tag_keys_of = dict((pair.element_key, pair.tag_keys) for pair in self.pairs)
+        tag_categories = []
+        for pair in self.pairs:
+            tag_categories.extend(pair.tag_categories)
+        self._all_tag_keys = set(int(category) for category in tag_categories)
+        categories = [pair.element_category for pair in self.pairs]
+        seen = set(pair.element_key for pair in self.pairs)
+        for category in tag_categories:
+            if int(category) not in seen:
+                seen.add(int(category))
+                categories.append(category)
+        # Compiled once, reused for every view
+        self._filter = category_filter(categories)
+
+    def find(self, doc, view):
+        """Split the registered elements shown in ``view`` by tag state.
+
+        :return: ``(untagged, tagged)`` lists of elements.
+        """
+        elements = []
+        tagged_by = {}
+        for element in FilteredElementCollector(doc, view.Id).WherePasses(
+                self._filter).WhereElementIsNotElementType():
+            category = element.Category
+            if category is None:
+                continue
+            category_key = id_value(category.Id)
+            if category_key in self._all_tag_keys:
+                for element_key in tagged_keys(element):
+                    tagged_by.setdefault(element_key, set()).add(category_key)
+            elif category_key in self._tag_keys_of:
+                elements.append((category_key, element))
+
+        untagged = []
+        tagged = []
+        for category_key, element in elements:
+            if tagged_by.get(id_value(element.Id), set()) & self._tag_keys_of[category_key]:
+                tagged.append(element)
+            else:
+                untagged.append(element)
+        return untagged, tagged
@@ -0,0 +1,58 @@
+"""Declarative checks of the Vertical Check tools.
+
+The single tools and the Model Audit runner share these definitions;
+adding a check here and to ``VERTICAL_CHECKS`` folds it into the same
+audit pass.
+"""
+from Autodesk.Revit.DB import (BuiltInCategory, BuiltInParameter, CategoryType, FamilyInstance,
+                               FilteredElementCollector, Wall)
+
+from pyreforge.ids import id_value
+from pyreforge.model_audit import AuditCheck, rule_check
+from pyreforge.parameter_rules import ParameterRule
+from pyreforge.view_scope import model_category_filter
+
+# A door violates the rule when its sill height is not zero
+DOOR_SILL_RULES = [ParameterRule(BuiltInParameter.INSTANCE_SILL_HEIGHT_PARAM, "!=", 0)]
+
+# A wall violates the rule when its base offset is not zero
+WALL_BASE_RULES = [ParameterRule(BuiltInParameter.WALL_BASE_OFFSET, "!=", 0)]
+
+
+def is_mirrored(element):
+    """True for mirrored model family instances."""
+    category = element.Category
+    return category is not None and category.CategoryType == CategoryType.Model and element.Mirrored
+
+
+def mirrored_instances(doc, view=None):
+    """Yield the mirrored model family instances of ``doc`` or ``view``.
+
+    The class and model-category filters run inside Revit, and the
+    collector is iterated lazily, so only candidates reach Python and
+    no list of them is built.
+    """
+    collector = FilteredElementCollector(doc) if view is None else FilteredElementCollector(doc, view.Id)
+    for instance in collector.OfClass(FamilyInstance).WherePasses(model_category_filter(doc)):
+        if instance.Mirrored:
+            yield instance
+
+
+def mirrored_counts_by_type(doc):
+    """Return ``{family type key: [mirrored count, instance count]}``."""
+    counts = {}
+    for instance in FilteredElementCollector(doc).OfClass(FamilyInstance).WherePasses(model_category_filter(doc)):
+        type_counts = counts.setdefault(id_value(instance.GetTypeId()), [0, 0])
+        type_counts[1] += 1
+        if instance.Mirrored:
+            type_counts[0] += 1
+    return dict((key, type_counts) for key, type_counts in counts.items() if type_counts[0])
+
+
+DOOR_SILL_CHECK = rule_check("Door sill height", [BuiltInCategory.OST_Doors], DOOR_SILL_RULES, FamilyInstance)
+
+WALL_BASE_CHECK = rule_check("Wall base offset", [BuiltInCategory.OST_Walls], WALL_BASE_RULES, Wall)
+
+MIRRORED_CHECK = AuditCheck("Mirrored elements", is_mirrored, element_class=FamilyInstance)
+
+VERTICAL_CHECKS = [DOOR_SILL_CHECK, WALL_BASE_CHECK, MIRRORED_CHECK]
@@ -0,0 +1,139 @@
+"""Run the clash checks over many views with shared target sets.
+
+Plan views that cut the model at the same elevations share one spatial
+index of the walls and columns in that range, read and indexed once.
+Each view still only clashes with what it shows: the ids of its visible
+targets (crop, visibility/graphics, phase, design options, worksets) come
+from a view-scoped collector and everything else in the shared index is
+ignored. Other views (sections, elevations, details) get an index of
+their own built from a view-scoped collector.
+"""
+from Autodesk.Revit.DB import FilteredElementCollector, PlanViewPlane, ViewPlan, ViewType
+
+from pyreforge.bbox_table import BoxTable
+from pyreforge.clash import TargetSet
+from pyreforge.ids import category_key, id_value
+from pyreforge.spatial_index import SpatialHash
+from pyreforge.view_scope import category_filter
+from pyreforge.wall_footprint import WallFootprints
+
+CHECKABLE_VIEW_TYPES = (
+    ViewType.FloorPlan,
+    ViewType.CeilingPlan,
+    ViewType.EngineeringPlan,
+    ViewType.AreaPlan,
+    ViewType.Section,
+    ViewType.Elevation,
+    ViewType.Detail,
+)
+
+
+def is_checkable_view(view):
+    """True for non-template views that can hold tags over model elements."""
+    return not view.IsTemplate and view.ViewType in CHECKABLE_VIEW_TYPES
+
+
+def views_on_sheets(doc, sheets):
+    """Return the checkable views placed on ``sheets``, each view once."""
+    seen = set()
+    views = []
+    for sheet in sheets:
+        for view_id in sheet.GetAllPlacedViews():
+            key = id_value(view_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            view = doc.GetElement(view_id)
+            if view is not None and is_checkable_view(view):
+                views.append(view)
+    return views
+
+
+def _plane_elevation(doc, view_range, plane):
+    level = doc.GetElement(view_range.GetLevelId(plane))
+    if level is None:
+        # Unlimited
+        return None
+    return level.Elevation + view_range.GetOffset(plane)
+
+
+def view_range_key(view):
+    """Key shared by views that show the same slice of the model.
+
+    Plan views map to the absolute ``(low, high)`` elevations of their view
+    range (``None`` when unlimited); any other view maps to its own id.
+    """
+    if not isinstance(view, ViewPlan):
+        return ("view", id_value(view.Id))
+    doc = view.Document
+    view_range = view.GetViewRange()
+    low_plane, high_plane = PlanViewPlane.ViewDepthPlane, PlanViewPlane.TopClipPlane
+    if view.ViewType == ViewType.CeilingPlan:
+        # Reflected ceiling plans look up
+        low_plane, high_plane = PlanViewPlane.CutPlane, PlanViewPlane.ViewDepthPlane
+    low = _plane_elevation(doc, view_range, low_plane)
+    high = _plane_elevation(doc, view_range, high_plane)
+    return ("range",
+            None if low is None else round(low, 6),
+            None if high is None else round(high, 6))
+
+
+class SharedTargetIndex(object):
+    """Clash target indexes shared between views with the same view range."""
+
+    def __init__(self, doc, categories):
+        self.doc = doc
+        self.categories = categories
+        self._filter = category_filter(categories)
+        self._model_targets = None
+        self._range_indexes = {}
+        self._view_sets = {}
+
+    def __len__(self):
+        return len(self._range_indexes) + len(self._view_sets)
+
+    def _model(self):
+        # One model-wide read of every target, shared by all plan views
+        if self._model_targets is None:
+            elements = FilteredElementCollector(self.doc).WherePasses(
+                self._filter).WhereElementIsNotElementType().ToElements()
+            self._model_targets = TargetSet(
+                elements, BoxTable.from_elements(elements, None), None,
+                dict((id_value(element.Id), category_key(element)) for element in elements),
+                WallFootprints(elements))
+        return self._model_targets
+
+    def _range_index(self, key):
+        index = self._range_indexes.get(key)
+        if index is None:
+            table = self._model().table
+            low, high = key[1], key[2]
+            items = []
+            for target_key, box in table.items():
+                minz, maxz = table.z_range(target_key)
+                if (high is None or minz <= high) and (low is None or maxz >= low):
+                    items.append((target_key, box))
+            index = SpatialHash.from_boxes(items)
+            self._range_indexes[key] = index
+        return index
+
+    def for_view(self, view):
+        """Return the ``TargetSet`` of the targets ``view`` can clash with."""
+        key = view_range_key(view)
+        if key[0] == "view":
+            target_set = self._view_sets.get(key)
+            if target_set is None:
+                target_set = TargetSet.in_view(self.doc, view, self.categories)
+                self._view_sets[key] = target_set
+            return target_set
+
+        model = self._model()
+        index = self._range_index(key)
+        # Only the ids of what the view shows are read; targets it hides
+        # stay in the shared index but fail the category test
+        visible = set(id_value(element_id) for element_id in FilteredElementCollector(self.doc, view.Id).WherePasses(
+            self._filter).WhereElementIsNotElementType().ToElementIds())
+        category_of = dict((target_key, category) for target_key, category in model.category_of.items()
+                           if target_key in visible)
+        elements = [element for element in model.elements if id_value(element.Id) in visible]
+        return TargetSet(elements, model.table, index, category_of, model.footprints)
@@ -0,0 +1,29 @@
+"""Collect clash candidates scoped to a view instead of the whole model."""
+from Autodesk.Revit.DB import (BuiltInCategory, CategoryType, ElementId, ElementMulticategoryFilter,
+                               FilteredElementCollector)
+from System.Collections.Generic import List
+
+
+def category_filter(categories):
+    """Build one native filter matching any of ``categories``."""
+    return ElementMulticategoryFilter(List[BuiltInCategory](categories))
+
+
+def collect_in_view(doc, view, categories):
+    """Return the non-type elements of ``categories`` visible in ``view``.
+
+    A view-scoped collector applies the crop region and view range inside
+    Revit, so only elements the view actually shows reach Python.
+    """
+    return FilteredElementCollector(doc, view.Id).WherePasses(
+        category_filter(categories)).WhereElementIsNotElementType().ToElements()
+
+
+def model_category_ids(doc):
+    """Return the ids of every model category of ``doc``."""
+    return [category.Id for category in doc.Settings.Categories if category.CategoryType == CategoryType.Model]
+
+
+def model_category_filter(doc):
+    """Build one native filter matching every model category of ``doc``."""
+    return ElementMulticategoryFilter(List[ElementId](model_category_ids(doc)))
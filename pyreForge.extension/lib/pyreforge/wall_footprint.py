@@ -0,0 +1,88 @@
+"""Plan footprints of walls, read from their location curve and width.
+
+Footprints are extracted lazily, once per wall, and only for walls that
+survive the bounding-box broad phase.
+"""
+from Autodesk.Revit.DB import BuiltInParameter, Line, LocationCurve, Wall
+
+from pyreforge.footprint import band_polygon, box_hits_polygons, extend_polyline, polyline_bands
+from pyreforge.ids import id_value
+
+# WALL_KEY_REF_PARAM values
+CENTERLINE = 0
+FINISH_FACE_EXTERIOR = 2
+FINISH_FACE_INTERIOR = 3
+
+
+def _location_line(wall):
+    parameter = wall.get_Parameter(BuiltInParameter.WALL_KEY_REF_PARAM)
+    return parameter.AsInteger() if parameter is not None else CENTERLINE
+
+
+def wall_footprint(wall):
+    """Return the wall's plan footprint as a list of convex quads, or None.
+
+    Elements that are not basic walls with a location curve return None,
+    so their bounding box stays the final answer. Core-based location
+    lines are covered with the full width on both sides, and bands run
+    past both curve ends by the same reach so joined corners stay
+    covered; this may keep a few extra hits at free ends but never drops
+    a real one.
+    """
+    if not isinstance(wall, Wall):
+        return None
+    location = wall.Location
+    if not isinstance(location, LocationCurve):
+        return None
+    curve = location.Curve
+    width = wall.Width
+    location_line = _location_line(wall)
+
+    if isinstance(curve, Line):
+        # Offsets along the exterior direction of the wall
+        if location_line == CENTERLINE:
+            near, far = -width / 2.0, width / 2.0
+        elif location_line == FINISH_FACE_EXTERIOR:
+            near, far = -width, 0.0
+        elif location_line == FINISH_FACE_INTERIOR:
+            near, far = 0.0, width
+        else:
+            near, far = -width, width
+        start, end = curve.GetEndPoint(0), curve.GetEndPoint(1)
+        (x0, y0), (x1, y1) = extend_polyline([(start.X, start.Y), (end.X, end.Y)], max(-near, far))
+        orientation = wall.Orientation
+        return [band_polygon(x0, y0, x1, y1, orientation.X, orientation.Y, near, far)]
+
+    reach = width / 2.0 if location_line == CENTERLINE else width
+    points = extend_polyline([(point.X, point.Y) for point in curve.Tessellate()], reach)
+    return polyline_bands(points, -reach, reach) or None
+
+
+class WallFootprints(object):
+    """Lazy per-wall footprint cache keyed by integer element id."""
+
+    def __init__(self, elements=()):
+        self._elements = {}
+        self._footprints = {}
+        self.add(elements)
+
+    def add(self, elements):
+        for element in elements:
+            self._elements[id_value(element.Id)] = element
+
+    def get(self, key):
+        """Return the footprint quads of ``key``, or None if it has none."""
+        if key not in self._footprints:
+            element = self._elements.get(key)
+            self._footprints[key] = wall_footprint(element) if element is not None else None
+        return self._footprints[key]
+
+    def box_hits(self, key, box):
+        """Narrow phase: True if ``box`` overlaps the footprint of ``key``.
+
+        Targets without a footprint keep the broad-phase result (True).
+        """
+        polygons = self.get(key)
+        if polygons is None:
+            return True
+        return box_hits_polygons(box, polygons)
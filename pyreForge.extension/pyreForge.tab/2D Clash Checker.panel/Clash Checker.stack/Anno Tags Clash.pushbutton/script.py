@@ -1,6 +1,6 @@
 __title__ = "Anno&Tag\nClash"
-__doc__ = """Version = 1.2
-Date    = 18.07.2024
+__doc__ = """Version = 1.12
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script detects and highlights specified tags in the active 
@@ -15,9 +15,37 @@ you wish to analyze.
 2. Run the script to begin the overlap detection process.
 3. Tags that overlap with 3D elements will be highlighted in 
 red in the active view.
-4. Non-overlapping tags will revert to their default black color.
+4. Tags that no longer overlap lose the red highlight; other 
+overrides are kept.
+5. Running it again in the same view only re-tests tags that were 
+added or moved, or that sit near walls and columns that changed.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.12.0 Tag and wall/column boxes are compared per grid cell 
+in one batch (vectorized when NumPy is available) before the exact 
+checks, inside the shared clash engine.
+- [18.10.2026] - v1.11.0 The overrides each tag had before being 
+highlighted are journaled; reverting puts them back exactly instead 
+of forcing black, also in a later session.
+- [18.10.2026] - v1.10.0 Only tags whose graphics actually change are 
+written; tags that no longer clash lose the red highlight instead of 
+being forced to black, so users' own overrides are kept.
+- [18.10.2026] - v1.9.0 Runs on the shared rule-driven clash engine 
+(one rule: tags vs walls and columns, ignoring leaders).
+- [18.10.2026] - v1.8.0 Tags whose box touches a wall box are checked 
+again against the wall's real plan footprint (location line and 
+width), so rotated and curved walls no longer give false clashes.
+- [18.10.2026] - v1.7.0 Results are cached per view; a re-run only 
+re-tests tags that changed or sit near walls and columns that changed.
+- [18.10.2026] - v1.6.0 Walls and columns are collected from the active 
+view only (crop region and view range) instead of the whole model.
+- [18.10.2026] - v1.5.0 Colors are written in a single transaction at 
+the end of the run instead of one transaction per tag.
+- [18.10.2026] - v1.4.0 Bounding boxes are read once into a snapshot 
+table and compared as plain numbers.
+- [18.10.2026] - v1.3.0 Tags are only tested against walls and columns 
+that share a grid cell with them (spatial hash) instead of every 
+element in the model.
 - [18.07.2024] - v1.0.2 Updated to ignore leaders when checking 
 for overlaps with 3D elements.
 - [06.07.2024] - v1.0.1 Updated to highlight specified tags when 
@@ -32,6 +60,9 @@ from Autodesk.Revit.UI import Selection, TaskDialog, TaskDialogCommonButtons, Ta
 from Autodesk.Revit.DB import *
 from System.Collections.Generic import List
 
+from pyreforge.clash import ClashEngine, highlight_view_clashes
+from pyreforge.clash_rules import TAGS_VS_WALLS_AND_COLUMNS
+
 # Get the active document and selection
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
@@ -40,93 +71,8 @@ selection = uidoc.Selection
 # Get the active view
 active_view = doc.ActiveView
 
-# List of tag categories to check
-tag_categories = [
-    BuiltInCategory.OST_KeynoteTags,
-    BuiltInCategory.OST_DetailComponentTags,
-    BuiltInCategory.OST_MaterialTags,
-    BuiltInCategory.OST_FloorTags,
-    BuiltInCategory.OST_CurtaSystemTags,
-    BuiltInCategory.OST_HostFinTags,
-    BuiltInCategory.OST_StairsTags,
-    BuiltInCategory.OST_MultiCategoryTags,
-    BuiltInCategory.OST_AreaTags,
-    BuiltInCategory.OST_StructuralColumnTags,
-    BuiltInCategory.OST_ParkingTags,
-    BuiltInCategory.OST_SiteTags,
-    BuiltInCategory.OST_SpecialityEquipmentTags,
-    BuiltInCategory.OST_GenericModelTags,
-    BuiltInCategory.OST_CurtainWallPanelTags,
-    BuiltInCategory.OST_WallTags,
-    BuiltInCategory.OST_CeilingTags,
-    BuiltInCategory.OST_CaseworkTags,
-    BuiltInCategory.OST_FurnitureTags,
-    BuiltInCategory.OST_RoomTags,
-    BuiltInCategory.OST_DoorTags,
-    BuiltInCategory.OST_WindowTags
-]
-
-# 3D elements categories to check against
-element_categories = [
-    BuiltInCategory.OST_Walls,
-    BuiltInCategory.OST_Columns
-]
-
-# Function to check overlap between annotation tag and 3D element
-def check_overlap_with_element(tag, element):
-    # Check if the tag is a leader
-    if isinstance(tag, IndependentTag) and tag.HasLeader:
-        return False  # Ignore leaders
-
-    # Get the bounding box of the tag head
-    tag_bb = tag.get_BoundingBox(active_view)
-
-    if tag_bb is None:
-        return False
-
-    # Get the bounding box of the 3D element
-    element_bb = element.get_BoundingBox(active_view)
-
-    if element_bb is None:
-        return False
-
-    # Check for overlap along X axis
-    x_overlap = (tag_bb.Min.X <= element_bb.Max.X) and (tag_bb.Max.X >= element_bb.Min.X)
-
-    # Check for overlap along Y axis
-    y_overlap = (tag_bb.Min.Y <= element_bb.Max.Y) and (tag_bb.Max.Y >= element_bb.Min.Y)
-
-    # Check for overlap along Z axis
-    z_overlap = (tag_bb.Min.Z <= element_bb.Max.Z) and (tag_bb.Max.Z >= element_bb.Min.Z)
-
-    # If overlaps along all axes, consider it as overlapping
-    return x_overlap and y_overlap and z_overlap
-
-# Function to set default color (black) for elements
-def set_default_color(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-    transaction = Transaction(view.Document, "Set Default Color")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
-
-# Function to highlight elements with red color
-def highlight_element(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(255, 0, 0))  # Red color for highlighting
-    transaction = Transaction(view.Document, "Highlight Element")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
-
-# Function to revert colors of all tags back to black
-def revert_tag_colors(tags, view):
-    transaction = Transaction(view.Document, "Revert Tag Colors")
-    transaction.Start()
-    for tag_id in tags:
-        element = doc.GetElement(tag_id)
-        overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-        view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
+# Clash rules checked by this tool
+clash_rules = [TAGS_VS_WALLS_AND_COLUMNS]
 
 # Show a warning prompt before proceeding
 warning_dialog = TaskDialog("Warning")
@@ -137,46 +83,31 @@ warning_dialog.DefaultButton = TaskDialogResult.Yes
 result = warning_dialog.Show()
 
 if result == TaskDialogResult.Yes:
-    # Get all tags in the active view
-    tags = []
-    for category in tag_categories:
-        tags.extend(FilteredElementCollector(doc, active_view.Id).OfCategory(category).WhereElementIsNotElementType().ToElements())
-
-    # List to store tags that overlap with 3D elements
-    overlapping_tags = []
-
-    # Collect all 3D elements in the model
-    elements = []
-    for category in element_categories:
-        elements.extend(FilteredElementCollector(doc).OfCategory(category).WhereElementIsNotElementType().ToElements())
+    # Check the active view and highlight the clashing tags
+    clash_run = highlight_view_clashes(doc, active_view, ClashEngine(clash_rules),
+                                       "anno_tag_clash", "Highlight Tag Clashes")
 
-    # Iterate through tags and check for overlap with 3D elements
-    for tag in tags:
-        is_overlapping = False
-        for element in elements:
-            if check_overlap_with_element(tag, element):
-                overlapping_tags.append(tag.Id)
-                highlight_element(tag, active_view)
-                is_overlapping = True
-                break  # No need to check further if overlap detected
-        if not is_overlapping:
-            set_default_color(tag, active_view)
+    # List of tags that overlap with 3D elements
+    overlapping_tags = clash_run.overlapping_ids
 
     # Inform the user about the number of overlapping tags found
     overlap_count = len(overlapping_tags)
-    TaskDialog.Show("Overlap Detection with 3D Elements", "{} tags overlap with 3D elements.".format(overlap_count))
+    TaskDialog.Show("Overlap Detection with 3D Elements",
+                    "{} tags overlap with 3D elements.\n{} of {} tags re-checked, {} overrides written, "
+                    "{} skipped as unchanged.".format(overlap_count, clash_run.retest_count, len(clash_run.sources),
+                                                      clash_run.written, clash_run.skipped))
 
     # Show a prompt to revert colors
     revert_dialog = TaskDialog("Revert Colors")
-    revert_dialog.MainInstruction = "Do you want to revert the colors of the highlighted tags to black?"
+    revert_dialog.MainInstruction = "Do you want to revert the highlighted tags to their original graphics?"
     revert_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
     revert_dialog.DefaultButton = TaskDialogResult.No
 
     revert_result = revert_dialog.Show()
 
     if revert_result == TaskDialogResult.Yes:
-        revert_tag_colors(overlapping_tags, active_view)
-        TaskDialog.Show("Colors Reverted", "The colors of the highlighted tags have been reverted to black.")
+        restored_count = clash_run.revert("Revert Tag Colors")
+        TaskDialog.Show("Colors Reverted", "{} tags have been restored to their original graphics.".format(restored_count))
 else:
     TaskDialog.Show("Operation Cancelled", "The operation was cancelled by the user.")
 
@@ -1,6 +1,6 @@
 __title__ = "Dim&Text\nClash"
-__doc__ = """Version = 1.0
-Date    = 26.06.2024
+__doc__ = """Version = 1.10
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script detects and selects annotations (dimensions and text 
@@ -13,8 +13,35 @@ overlaps between annotations and wall elements.
 the active view.
 3. A message dialog will appear, informing you of the number 
 of overlapping annotations detected.
+4. Running it again in the same view only re-tests annotations that 
+were added or moved, or that sit near walls that changed.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.10.0 The shared clash engine runs the box kernel 
+of v1.6 again (NumPy when available), now per spatial grid bucket: 
+each bucket's annotations are compared only with the walls sharing 
+its cells instead of with every wall in the view.
+- [18.10.2026] - v1.9.0 The overrides each annotation had before being 
+highlighted are journaled; reverting puts them back exactly instead 
+of forcing black, also in a later session.
+- [18.10.2026] - v1.8.0 Only annotations whose graphics actually change 
+are written; annotations that no longer clash lose the red highlight 
+instead of being forced to black, so users' own overrides are kept.
+- [18.10.2026] - v1.7.0 Runs on the shared rule-driven clash engine 
+(one rule: dimensions and text notes vs walls).
+- [18.10.2026] - v1.6.0 Annotation and wall boxes are compared in one 
+batch (vectorized when NumPy is available) before the exact checks.
+- [18.10.2026] - v1.5.0 Annotations whose box touches a wall box are 
+checked again against the wall's real plan footprint (location line 
+and width), so rotated and curved walls no longer give false clashes.
+- [18.10.2026] - v1.4.0 Results are cached per view; a re-run only 
+re-tests annotations that changed or sit near walls that changed.
+- [18.10.2026] - v1.3.0 Walls are collected from the active view only 
+(crop region and view range) instead of the whole model.
+- [18.10.2026] - v1.2.0 Colors are written in a single transaction at 
+the end of the run instead of one transaction per annotation.
+- [18.10.2026] - v1.1.0 Bounding boxes are read once into a snapshot 
+table and compared as plain numbers.
 - [26.06.2024] - v1.0.0 Initial release
 __________________________________________________________________
 To-Do:
@@ -27,6 +54,9 @@ from Autodesk.Revit.UI import Selection, TaskDialog, TaskDialogCommonButtons, Ta
 from Autodesk.Revit.DB import *
 from System.Collections.Generic import List
 
+from pyreforge.clash import ClashEngine, highlight_view_clashes
+from pyreforge.clash_rules import DIMENSIONS_AND_TEXT_VS_WALLS
+
 # Get the active document and selection
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
@@ -35,57 +65,8 @@ selection = uidoc.Selection
 # Get the active view
 active_view = doc.ActiveView
 
-# Function to check overlap between annotation and wall
-def check_overlap_with_wall(annotation, wall):
-    # Get the bounding box of the annotation
-    annotation_bb = annotation.get_BoundingBox(active_view)
-
-    if annotation_bb is None:
-        return False
-
-    # Get the bounding box of the wall
-    wall_bb = wall.get_BoundingBox(active_view)
-
-    if wall_bb is None:
-        return False
-
-    # Check for overlap along X axis
-    x_overlap = (annotation_bb.Min.X <= wall_bb.Max.X) and (annotation_bb.Max.X >= wall_bb.Min.X)
-
-    # Check for overlap along Y axis
-    y_overlap = (annotation_bb.Min.Y <= wall_bb.Max.Y) and (annotation_bb.Max.Y >= wall_bb.Min.Y)
-
-    # Check for overlap along Z axis
-    z_overlap = (annotation_bb.Min.Z <= wall_bb.Max.Z) and (annotation_bb.Max.Z >= wall_bb.Min.Z)
-
-    # If overlaps along all axes, consider it as overlapping
-    return x_overlap and y_overlap and z_overlap
-
-# Function to set default color (black) for elements
-def set_default_color(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-    transaction = Transaction(view.Document, "Set Default Color")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
-
-# Function to highlight elements with red color
-def highlight_element(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(255, 0, 0))  # Red color for highlighting
-    transaction = Transaction(view.Document, "Highlight Element")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
-
-# Function to revert colors of all annotations back to black
-def revert_annotation_colors(annotations, view):
-    transaction = Transaction(view.Document, "Revert Annotation Colors")
-    transaction.Start()
-    for annotation_id in annotations:
-        element = doc.GetElement(annotation_id)
-        overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-        view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
+# Clash rules checked by this tool
+clash_rules = [DIMENSIONS_AND_TEXT_VS_WALLS]
 
 # Show a warning prompt before proceeding
 warning_dialog = TaskDialog("Warning")
@@ -96,47 +77,31 @@ warning_dialog.DefaultButton = TaskDialogResult.Yes
 result = warning_dialog.Show()
 
 if result == TaskDialogResult.Yes:
-    # Get all dimensions and text notes in the active view
-    annotations = FilteredElementCollector(doc, active_view.Id).OfCategory(
-        BuiltInCategory.OST_Dimensions).WhereElementIsNotElementType().ToElements()
-    text_notes = FilteredElementCollector(doc, active_view.Id).OfCategory(
-        BuiltInCategory.OST_TextNotes).WhereElementIsNotElementType().ToElements()
-
-    # Combine dimensions and text notes into one list
-    all_annotations = list(annotations) + list(text_notes)
-
-    # List to store annotations that overlap with walls
-    overlapping_annotations = []
-
-    # Collect all walls in the model
-    walls = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Walls).WhereElementIsNotElementType().ToElements()
+    # Check the active view and highlight the clashing annotations
+    clash_run = highlight_view_clashes(doc, active_view, ClashEngine(clash_rules),
+                                       "dim_text_clash", "Highlight Annotation Clashes")
 
-    # Iterate through annotations and check for overlap with walls
-    for annotation in all_annotations:
-        is_overlapping = False
-        for wall in walls:
-            if check_overlap_with_wall(annotation, wall):
-                overlapping_annotations.append(annotation.Id)
-                highlight_element(annotation, active_view)
-                is_overlapping = True
-                break  # No need to check further if overlap detected
-        if not is_overlapping:
-            set_default_color(annotation, active_view)
+    # List of annotations that overlap with walls
+    overlapping_annotations = clash_run.overlapping_ids
 
     # Inform the user about the number of overlapping annotations found
     overlap_count = len(overlapping_annotations)
-    TaskDialog.Show("Overlap Detection with Walls", "{} annotations overlap with walls.".format(overlap_count))
+    TaskDialog.Show("Overlap Detection with Walls",
+                    "{} annotations overlap with walls.\n{} of {} annotations re-checked, {} overrides written, "
+                    "{} skipped as unchanged.".format(overlap_count, clash_run.retest_count, len(clash_run.sources),
+                                                      clash_run.written, clash_run.skipped))
 
     # Show a prompt to revert colors
     revert_dialog = TaskDialog("Revert Colors")
-    revert_dialog.MainInstruction = "Do you want to revert the colors of the highlighted annotations to black?"
+    revert_dialog.MainInstruction = "Do you want to revert the highlighted annotations to their original graphics?"
     revert_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
     revert_dialog.DefaultButton = TaskDialogResult.No
 
     revert_result = revert_dialog.Show()
 
     if revert_result == TaskDialogResult.Yes:
-        revert_annotation_colors(overlapping_annotations, active_view)
-        TaskDialog.Show("Colors Reverted", "The colors of the highlighted annotations have been reverted to black.")
+        restored_count = clash_run.revert("Revert Annotation Colors")
+        TaskDialog.Show("Colors Reverted",
+                        "{} annotations have been restored to their original graphics.".format(restored_count))
 else:
     TaskDialog.Show("Operation Cancelled", "The operation was cancelled by the user.")
@@ -1,6 +1,6 @@
 __title__ = "Door Tag\nFinder"
-__doc__ = """Version = 1.0
-Date    = 26.06.2024
+__doc__ = """Version = 1.5
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 identifies and highlights doors in the active view that do not 
@@ -10,12 +10,29 @@ __________________________________________________________________
 How-to:
 1. Navigate to the view within your Revit project where you 
 want to check for untagged doors.
-2. Execute the script
+2. Execute the script and choose the active view or the whole 
+project.
 3. Observe the highlighted doors in the active view, which 
 indicates the doors without associated tags, and take necessary 
 actions to tag them appropriately.
+4. For the whole project, a table lists the doors that are not 
+tagged in any view.
 _________________________________________________________________
 Last update:
+- [18.10.2026] - v1.5.0 The active view is checked against the tags it 
+shows, read with a view-scoped collector, so dependent views see the 
+tags owned by their primary view.
+- [18.10.2026] - v1.4.0 Uses a project-wide tag index that is updated 
+incrementally between runs; added a whole-project report of doors 
+not tagged in any view.
+- [18.10.2026] - v1.3.0 The overrides each door had before being 
+highlighted are journaled; doors that get tagged get them back exactly, 
+and the Restore Overrides tool can undo the highlight later.
+- [18.10.2026] - v1.2.0 Only doors whose graphics actually change are 
+written; tagged doors lose the red highlight instead of being forced 
+to black, so users' own overrides are kept.
+- [18.10.2026] - v1.1.0 Colors are written in a single transaction at 
+the end of the run instead of one transaction per door.
 - [26.06.2024] - v1.0.0 Initial Release
 __________________________________________________________________
 To-Do:
@@ -24,25 +41,15 @@ __________________________________________________________________
 Author: Luis Ibanez"""
 
 # Import necessary Revit API classes
-from Autodesk.Revit.UI import Selection, TaskDialog, UIApplication
+from Autodesk.Revit.UI import Selection, TaskDialog, TaskDialogCommandLinkId, TaskDialogResult, UIApplication
 from Autodesk.Revit.DB import *
 from System.Collections.Generic import List
+from pyrevit import script
 
-# Function to set default color (black) for elements
-def set_default_color(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-    transaction = Transaction(view.Document, "Set Default Color")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
-
-# Function to highlight elements with red color
-def highlight_element(element, view):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(255, 0, 0))  # Red color for highlighting
-    transaction = Transaction(view.Document, "Highlight Element")
-    transaction.Start()
-    view.SetElementOverrides(element.Id, overrideSettings)
-    transaction.Commit()
+from pyreforge.ids import id_value
+from pyreforge.override_journal import OverrideJournal, apply_highlight
+from pyreforge.tag_index import TagIndex
+from pyreforge.tag_registry import UntaggedFinder, tag_pair
 
 # Get the active document and selection
 doc = __revit__.ActiveUIDocument.Document
@@ -51,45 +58,74 @@ uidoc = __revit__.ActiveUIDocument
 # Get the active view
 active_view = doc.ActiveView
 
-# Get all doors in the active view
-doors = FilteredElementCollector(doc, active_view.Id).OfCategory(BuiltInCategory.OST_Doors).WhereElementIsNotElementType().ToElements()
+# Doors and the tag categories that count as tagging a door
+door_pair = tag_pair(BuiltInCategory.OST_Doors)
+door_tag_categories = door_pair.tag_keys
+
+# Function to highlight the doors without a tag in the active view
+def check_active_view():
+    # Doors and the tags shown in the active view, in one view-scoped pass;
+    # a dependent view shows the tags owned by its primary view
+    untagged_doors, tagged_doors = UntaggedFinder([door_pair]).find(doc, active_view)
+    unmarked_door_ids = [door.Id for door in untagged_doors]
+
+    # Highlight the unmarked doors in red and give the others their original graphics back
+    override_journal = OverrideJournal.for_document(doc)
+    apply_highlight(active_view, unmarked_door_ids, [door.Id for door in tagged_doors],
+                    "door_tag_finder", "Highlight Untagged Doors", override_journal)
+    override_journal.save()
 
-# Get all door tags in the active view
-door_tags = FilteredElementCollector(doc, active_view.Id).OfCategory(BuiltInCategory.OST_DoorTags).WhereElementIsNotElementType().ToElements()
+    # Convert the list of unmarked door ids to a List of ElementId
+    unmarked_door_element_ids = List[ElementId](unmarked_door_ids)
 
-# Create a set of door IDs that have tags
-tagged_door_ids = set()
-for door_tag in door_tags:
-    tagged_element_ids = door_tag.GetTaggedLocalElementIds()
-    for tagged_element_id in tagged_element_ids:
-        if tagged_element_id != ElementId.InvalidElementId:
-            tagged_door_ids.add(tagged_element_id)
+    # Highlight the unmarked doors in the UI selection
+    uidoc.Selection.SetElementIds(unmarked_door_element_ids)
 
-# Find doors that do not have tags
-unmarked_door_ids = [door.Id for door in doors if door.Id not in tagged_door_ids]
+    # Determine the number of unmarked doors
+    num_unmarked_doors = len(unmarked_door_element_ids)
 
-# Highlight the unmarked doors in red and set default color to others
-for door in doors:
-    if door.Id in unmarked_door_ids:
-        highlight_element(door, active_view)
+    # Show a TaskDialog with the number of unmarked doors found or a message if none found
+    if num_unmarked_doors > 0:
+        task_dialog = TaskDialog("Doors with Missing Tags")
+        task_dialog.MainContent = "There are {} doors with missing tags found. Please fix them.".format(num_unmarked_doors)
+        task_dialog.Show()
     else:
-        set_default_color(door, active_view)
+        task_dialog = TaskDialog("No Doors Found")
+        task_dialog.MainContent = "No doors with missing tags found in the active view."
+        task_dialog.Show()
 
-# Convert the list of unmarked door ids to a List of ElementId
-unmarked_door_element_ids = List[ElementId](unmarked_door_ids)
+# Function to list the doors that are not tagged in any view of the project
+def report_project(tag_index):
+    doors = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Doors).WhereElementIsNotElementType().ToElements()
+    untagged_keys = tag_index.untagged([id_value(door.Id) for door in doors], door_tag_categories)
+    if not untagged_keys:
+        TaskDialog.Show("No Doors Found", "Every door in the project is tagged in at least one view.")
+        return
 
-# Highlight the unmarked doors in the UI selection
-uidoc.Selection.SetElementIds(unmarked_door_element_ids)
+    output = script.get_output()
+    rows = []
+    for door in doors:
+        if id_value(door.Id) in untagged_keys:
+            level = doc.GetElement(door.LevelId)
+            rows.append([output.linkify(door.Id), door.Symbol.Family.Name, door.Name,
+                         level.Name if level is not None else ""])
+    output.print_table(table_data=rows,
+                       title="{} doors not tagged in any view".format(len(rows)),
+                       columns=["Door", "Family", "Type", "Level"])
 
-# Determine the number of unmarked doors
-num_unmarked_doors = len(unmarked_door_element_ids)
+# Ask for the scope of the check
+scope_dialog = TaskDialog("Door Tag Finder")
+scope_dialog.MainInstruction = "Where do you want to look for untagged doors?"
+scope_dialog.AddCommandLink(TaskDialogCommandLinkId.CommandLink1, "Active view",
+                            "Highlight the doors without a tag in the active view.")
+scope_dialog.AddCommandLink(TaskDialogCommandLinkId.CommandLink2, "Whole project",
+                            "List the doors that are not tagged in any view.")
+scope_result = scope_dialog.Show()
 
-# Show a TaskDialog with the number of unmarked doors found or a message if none found
-if num_unmarked_doors > 0:
-    task_dialog = TaskDialog("Doors with Missing Tags")
-    task_dialog.MainContent = "There are {} doors with missing tags found. Please fix them.".format(num_unmarked_doors)
-    task_dialog.Show()
-else:
-    task_dialog = TaskDialog("No Doors Found")
-    task_dialog.MainContent = "No doors with missing tags found in the active view."
-    task_dialog.Show()
+if scope_result == TaskDialogResult.CommandLink1:
+    check_active_view()
+elif scope_result == TaskDialogResult.CommandLink2:
+    # Bring the saved tag index up to date, then answer from it
+    tag_index = TagIndex.for_document(doc)
+    tag_index.save()
+    report_project(tag_index)
@@ -0,0 +1,66 @@
+__title__ = "Model\nAudit"
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+__________________________________________________________________
+Description:
+Runs the Vertical Check tools together: door sill height, wall
+base offset and mirrored elements. Checks that look at the same
+kind of element share one pass over the model, so running all of
+them costs little more than running one.
+__________________________________________________________________
+How-to:
+1. Run the script and choose the whole model or the active view.
+2. Every violation is listed in one table and selected; a second
+table shows how long each check took.
+__________________________________________________________________
+Last update:
+- [18.10.2026] - v1.0.0 Initial release
+__________________________________________________________________
+To-Do:
+-
+__________________________________________________________________
+Author: Luis Ibanez"""
+
+# Import necessary Revit API classes
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.UI import TaskDialog
+from System.Collections.Generic import List
+from pyrevit import forms
+from pyrevit import script
+
+from pyreforge.model_audit import run_audit
+from pyreforge.vertical_checks import VERTICAL_CHECKS
+
+# Get the active document and UI document
+doc = __revit__.ActiveUIDocument.Document
+uidoc = __revit__.ActiveUIDocument
+
+# Ask for the scope of the audit
+audit_scope = forms.CommandSwitchWindow.show(["Whole model", "Active view"], message="Where do you want to run the audit?")
+
+if audit_scope:
+    audit_view = uidoc.ActiveView if audit_scope == "Active view" else None
+    audit_result = run_audit(doc, VERTICAL_CHECKS, audit_view)
+
+    # Select every violating element
+    rows = audit_result.rows()
+    uidoc.Selection.SetElementIds(List[ElementId]([element.Id for _, element in rows]))
+
+    output = script.get_output()
+    if rows:
+        output.print_table(table_data=[[check_name, element.Category.Name, output.linkify(element.Id)]
+                                       for check_name, element in rows],
+                           title="{} violations".format(len(rows)),
+                           columns=["Check", "Category", "Element"])
+    else:
+        print("No violations found.")
+
+    # Time spent per check, after the shared collector passes
+    output.print_table(table_data=[[check.name, len(audit_result.violations[check.name]),
+                                    "{:.3f}".format(audit_result.timings[check.name])]
+                                   for check in audit_result.checks],
+                       title="{} elements scanned, collected in {:.3f} s".format(
+                           audit_result.scanned, audit_result.collect_time),
+                       columns=["Check", "Violations", "Seconds"])
+else:
+    TaskDialog.Show("Operation Cancelled", "No scope was selected.")
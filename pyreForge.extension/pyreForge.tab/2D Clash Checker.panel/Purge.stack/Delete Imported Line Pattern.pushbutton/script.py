@@ -1,6 +1,6 @@
 __title__ = "Delete Imported Line Pattern"
-__doc__ = """Version = 1.2
-Date    = 18.07.2024
+__doc__ = """Version = 1.4
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 Delete imported line pattern
@@ -9,6 +9,11 @@ How-to:
 
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.4.0 Shows a dry-run report of the patterns and of 
+the elements Revit would delete with them before anything is deleted.
+- [18.10.2026] - v1.3.0 Pattern usage is read once from all materials 
+(surface and cut, foreground and background) and filled region types; 
+unused patterns are deleted in a single call.
 - [22.11.2024] - v1.0.0 Updated to ignore leaders when checking 
 for overlaps with 3D elements.
 __________________________________________________________________
@@ -18,9 +23,13 @@ __________________________________________________________________
 Author: Luis Ibanez"""
 
 # Import necessary Revit API classes
-from Autodesk.Revit.DB import FilteredElementCollector, FillPatternElement, Transaction, BuiltInCategory, ElementId, \
-    Element
-from Autodesk.Revit.UI import TaskDialog
+from Autodesk.Revit.DB import ElementId
+from Autodesk.Revit.UI import TaskDialog, TaskDialogCommonButtons, TaskDialogResult
+from pyrevit import script
+
+from pyreforge.ids import id_value
+from pyreforge.pattern_usage import unused_fill_patterns
+from pyreforge.purge import category_label, delete_plan, plan_purge
 
 # Get the current document
 doc = __revit__.ActiveUIDocument.Document
@@ -28,51 +37,40 @@ doc = __revit__.ActiveUIDocument.Document
 
 # Function to delete unused filled patterns
 def delete_unused_filled_patterns(document):
-    # Collect all FillPatternElement objects
-    fill_patterns = FilteredElementCollector(document).OfClass(FillPatternElement).ToElements()
-
-    # Initialize lists for unused patterns and their IDs
-    unused_patterns = []
-    unused_ids = []
-
-    # Check each fill pattern to see if it is in use
-    for pattern in fill_patterns:
-        # Collect all elements that might use the fill pattern
-        is_used = False
-        for category in [BuiltInCategory.OST_Floors, BuiltInCategory.OST_Ceilings, BuiltInCategory.OST_Walls,
-                         BuiltInCategory.OST_Roofs, BuiltInCategory.OST_Materials]:
-            elements = FilteredElementCollector(document).OfCategory(category).ToElements()
-            for element in elements:
-                if hasattr(element, "GetMaterialIds"):
-                    material_ids = element.GetMaterialIds(False)
-                    for mat_id in material_ids:
-                        material = document.GetElement(mat_id)
-                        if material and material.SurfaceForegroundPatternId == pattern.Id:
-                            is_used = True
-                            break
-                if is_used:
-                    break
-            if is_used:
-                break
-
-        # Add unused patterns to the list
-        if not is_used:
-            unused_patterns.append(pattern)
-            unused_ids.append(pattern.Id)
+    # Patterns that no material or filled region type uses
+    unused_patterns = unused_fill_patterns(document)
+    if not unused_patterns:
+        TaskDialog.Show("Delete Unused Filled Patterns", "There are no unused filled patterns to delete.")
+        return
 
-    # Begin a transaction to delete the unused fill patterns
-    with Transaction(document, "Delete Unused Filled Patterns") as trans:
-        trans.Start()
+    # Dry run: work out what Revit would delete along with the patterns
+    purge_plan = plan_purge(document, [pattern.Id for pattern in unused_patterns])
+    output = script.get_output()
+    output.print_table(table_data=[[pattern.Name, len(purge_plan.cascade_of(id_value(pattern.Id)))]
+                                   for pattern in unused_patterns],
+                       title="{} unused filled patterns".format(len(purge_plan)),
+                       columns=["Pattern", "Dependent Elements"])
+    if purge_plan.cascade:
+        output.print_table(table_data=purge_plan.summary(category_label(document)),
+                           title="{} dependent elements deleted with them".format(len(purge_plan.cascade)),
+                           columns=["Category", "Count"])
 
-        # Delete each unused fill pattern
-        for pattern_id in unused_ids:
-            document.Delete(pattern_id)
+    # Ask for confirmation before deleting
+    confirm_dialog = TaskDialog("Delete Unused Filled Patterns")
+    confirm_dialog.MainContent = "{} unused filled patterns and {} dependent elements will be deleted. Continue?".format(
+        len(purge_plan), len(purge_plan.cascade))
+    confirm_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
+    if confirm_dialog.Show() != TaskDialogResult.Yes:
+        TaskDialog.Show("Cancelled", "Operation cancelled.")
+        return
 
-        trans.Commit()
+    # Delete all unused fill patterns at once
+    deleted_count = delete_plan(document, purge_plan, "Delete Unused Filled Patterns")
 
     # Display a confirmation message
-    TaskDialog.Show("Delete Unused Filled Patterns", "{} unused filled patterns were deleted.".format(len(unused_patterns)))
+    TaskDialog.Show("Delete Unused Filled Patterns", "{} unused filled patterns were deleted ({} elements in total).".format(
+        len(purge_plan), deleted_count))
 
 
 # Run the function to delete unused filled patterns
-delete_unused_filled_patterns(doc)
+delete_unused_filled_patterns(doc)
\ No newline at end of file
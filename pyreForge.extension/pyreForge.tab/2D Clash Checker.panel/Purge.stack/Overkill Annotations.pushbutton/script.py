@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Overkill \nAnnotations"
-__doc__ = """Version = 1.5
-Date    = 14.01.2025
+__doc__ = """Version = 1.9
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script identifies and deletes overlapping text notes, room tags, window tags, door tags, and wall tags in the active view of Autodesk Revit.
@@ -12,10 +12,14 @@ How-to:
 1. Run the script.
 2. A dialog will appear allowing you to select which annotations to purge.
 3. The script will check for overlapping annotations in the active view based on your selection.
-4. The first occurrence of each overlapping set will be retained, and others will be deleted.
+4. The oldest element of each overlapping set will be retained, and others will be deleted.
 5. A success message will confirm the number of elements retained.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.9.0 Exact duplicates (same type, text or tagged element and position within 1 mm) are found by hashing first; only the rest goes through the overlap sweep.
+- [18.10.2026] - v1.8.0 Chains of overlapping annotations are grouped, the oldest of each group is kept and the rest are deleted in one call.
+- [18.10.2026] - v1.7.0 Overlaps are found with a sort-and-sweep on X instead of comparing every pair.
+- [18.10.2026] - v1.6.0 Bounding boxes are read once into a snapshot table and compared as plain numbers.
 - [14.01.2025] - v1.5.0 Added user selection for annotation types
 __________________________________________________________________
 To-Do:
@@ -34,6 +38,12 @@ clr.AddReference("System.Drawing")
 from System.Windows.Forms import Form, Label, Button, CheckBox, DialogResult
 from System.Drawing import Point, Size
 
+from pyreforge.bbox_table import BoxTable
+from pyreforge.disjoint_set import cluster_pairs, keep_oldest, split_clusters
+from pyreforge.duplicates import exact_duplicates
+from pyreforge.ids import id_value
+from pyreforge.sweep import sweep_pairs
+
 # Get the active document
 doc = __revit__.ActiveUIDocument.Document
 
@@ -79,36 +89,33 @@ def create_selection_dialog():
         "result": result
     }
 
-# Function to check if two elements are overlapping based on their bounding boxes
-def are_elements_overlapping(el1, el2):
-    bbox1 = el1.get_BoundingBox(doc.ActiveView)
-    bbox2 = el2.get_BoundingBox(doc.ActiveView)
-
-    if bbox1 and bbox2:
-        return bbox1.Min.X < bbox2.Max.X and bbox1.Max.X > bbox2.Min.X and \
-            bbox1.Min.Y < bbox2.Max.Y and bbox1.Max.Y > bbox2.Min.Y
-    return False
-
 # Process and delete overlapping elements
 def process_and_delete_overlapping_elements(collector, element_type):
     if collector.GetElementCount() > 0:
         elements = list(collector)
-        to_delete = []
+        elements_by_key = dict((id_value(el.Id), el) for el in elements)
+
+        # Exact duplicates are found by hashing, the oldest of each group is kept
+        _, deleted_keys = split_clusters(exact_duplicates(elements), keep_oldest)
+        duplicate_keys = set(deleted_keys)
+        candidates = [el for el in elements if id_value(el.Id) not in duplicate_keys]
 
-        for i, el1 in enumerate(elements):
-            for j, el2 in enumerate(elements):
-                if i < j and are_elements_overlapping(el1, el2):
-                    to_delete.append(el2)
+        # Read every bounding box once, elements without one never overlap
+        table = BoxTable.from_elements(candidates, doc.ActiveView)
 
-        to_delete = list(set(to_delete))
+        # Group chains of overlapping elements and keep the oldest of each group
+        clusters = cluster_pairs(sweep_pairs(table.items(), strict=True))
+        kept_keys, overlapping_keys = split_clusters(clusters, keep_oldest)
+        deleted_keys.extend(overlapping_keys)
 
         with Transaction(doc, "Delete overlapping " + element_type) as t:
             t.Start()
-            for el in to_delete:
-                doc.Delete(el.Id)
+            if deleted_keys:
+                doc.Delete(List[ElementId]([elements_by_key[key].Id for key in deleted_keys]))
             t.Commit()
 
-        return list(set(elements) - set(to_delete))
+        deleted = set(deleted_keys)
+        return [el for el in elements if id_value(el.Id) not in deleted]
     return []
 
 # Show the selection dialog
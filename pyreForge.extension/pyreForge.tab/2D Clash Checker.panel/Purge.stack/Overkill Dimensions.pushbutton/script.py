@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Overkill \nDimensions"
-__doc__ = """Version = 1.1
-Date    = 22.01.2025
+__doc__ = """Version = 1.5
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script identifies and deletes overlapping dimensions in the active view of Autodesk Revit.
@@ -11,10 +11,14 @@ __________________________________________________________________
 How-to:
 1. Run the script.
 2. The script will check for overlapping dimensions in the active view.
-3. The first occurrence of each overlapping set will be retained, and others will be deleted.
+3. The oldest dimension of each overlapping set will be retained, and others will be deleted.
 4. A success message will confirm the number of dimensions retained.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.5.0 Exact duplicates (same type, references and dimension line within 1 mm) are found by hashing first; only the rest goes through the overlap sweep.
+- [18.10.2026] - v1.4.0 Chains of overlapping dimensions are grouped, the oldest of each group is kept and the rest are deleted in one call.
+- [18.10.2026] - v1.3.0 Overlaps are found with a sort-and-sweep on X instead of comparing every pair.
+- [18.10.2026] - v1.2.0 Bounding boxes are read once into a snapshot table and compared as plain numbers.
 - [22.01.2025] - v1.1.0 Added orientation check to prevent overlapping of vertical and horizontal dimensions
 - [14.01.2025] - v1.0.0 Initial release
 __________________________________________________________________
@@ -31,6 +35,12 @@ clr.AddReference("System.Drawing")
 from System.Windows.Forms import Form, Label, Button, CheckBox, DialogResult
 from System.Drawing import Point, Size
 
+from pyreforge.bbox_table import BoxTable
+from pyreforge.disjoint_set import cluster_pairs, keep_oldest, split_clusters
+from pyreforge.duplicates import exact_duplicates
+from pyreforge.ids import id_value
+from pyreforge.sweep import sweep_pairs
+
 
 # Get the active document
 doc = __revit__.ActiveUIDocument.Document
@@ -41,17 +51,6 @@ dimension_filter = ElementCategoryFilter(BuiltInCategory.OST_Dimensions)
 # Collect all dimensions in the active view
 collector = FilteredElementCollector(doc, doc.ActiveView.Id).WherePasses(dimension_filter)
 
-# Function to check if two dimensions are overlapping based on their bounding box
-def are_dimensions_overlapping(dim1, dim2):
-    bbox1 = dim1.get_BoundingBox(doc.ActiveView)
-    bbox2 = dim2.get_BoundingBox(doc.ActiveView)
-
-    if bbox1 and bbox2:
-        # Check if bounding boxes intersect
-        return bbox1.Min.X < bbox2.Max.X and bbox1.Max.X > bbox2.Min.X and \
-            bbox1.Min.Y < bbox2.Max.Y and bbox1.Max.Y > bbox2.Min.Y
-    return False
-
 # Function to check if the dimension is vertical
 def is_vertical_dimension(dim):
     line = dim.Curve
@@ -61,29 +60,41 @@ def is_vertical_dimension(dim):
 if collector.GetElementCount() > 0:
     # Convert the collected dimensions to a list
     dimensions = list(collector)
-    to_delete = []
+    dimensions_by_key = dict((id_value(dim.Id), dim) for dim in dimensions)
+
+    # Exact duplicates are found by hashing, the oldest of each group is kept
+    _, duplicate_keys = split_clusters(exact_duplicates(dimensions), keep_oldest)
+    duplicates = set(duplicate_keys)
+    candidates = [dim for dim in dimensions if id_value(dim.Id) not in duplicates]
+
+    # Read every bounding box once, orientations are cached on first use
+    table = BoxTable.from_elements(candidates, doc.ActiveView)
+    vertical = {}
+
+    def is_vertical_cached(key):
+        if key not in vertical:
+            vertical[key] = is_vertical_dimension(dimensions_by_key[key])
+        return vertical[key]
 
-    # Iterate through dimensions and compare for overlaps
-    for i, dim1 in enumerate(dimensions):
-        for j, dim2 in enumerate(dimensions):
-            if i < j and are_dimensions_overlapping(dim1, dim2):
-                # Only consider overlap if both dimensions are the same orientation (both vertical or both horizontal)
-                if is_vertical_dimension(dim1) == is_vertical_dimension(dim2):
-                    # Add overlapping dimension to delete list
-                    to_delete.append(dim2)
+    # Sweep the bounding boxes on X to find overlapping pairs
+    # Only consider overlap if both dimensions are the same orientation (both vertical or both horizontal)
+    overlapping_pairs = [(key1, key2) for key1, key2 in sweep_pairs(table.items(), strict=True)
+                         if is_vertical_cached(key1) == is_vertical_cached(key2)]
 
-    # Retain only one copy (keep the first dimension)
-    to_delete = list(set(to_delete))  # Remove duplicates
+    # Group chains of overlapping dimensions and keep the oldest of each group
+    kept_keys, deleted_keys = split_clusters(cluster_pairs(overlapping_pairs), keep_oldest)
+    deleted_keys.extend(duplicate_keys)
 
-    # Delete overlapping dimensions
+    # Delete overlapping dimensions in a single call
     with Transaction(doc, "Delete overlapping dimensions") as t:
         t.Start()
-        for dim in to_delete:
-            doc.Delete(dim.Id)
+        if deleted_keys:
+            doc.Delete(List[ElementId]([dimensions_by_key[key].Id for key in deleted_keys]))
         t.Commit()
 
     # Update the selection to only the remaining dimension
-    remaining_dimensions = list(set(dimensions) - set(to_delete))
+    deleted = set(deleted_keys)
+    remaining_dimensions = [dim for dim in dimensions if id_value(dim.Id) not in deleted]
     selected_elements = List[ElementId]([ElementId(dim.Id.IntegerValue) for dim in remaining_dimensions])
     __revit__.ActiveUIDocument.Selection.SetElementIds(selected_elements)
     TaskDialog.Show("Success", "Retained " + str(len(remaining_dimensions)) + " dimension(s).")
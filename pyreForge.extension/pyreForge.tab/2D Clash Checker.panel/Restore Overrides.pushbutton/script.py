@@ -0,0 +1,64 @@
+__title__ = "Restore\nOverrides"
+__doc__ = """Version = 1.1
+Date    = 18.10.2026
+__________________________________________________________________
+Description:
+This script puts back the original graphic overrides of elements
+recolored by the highlight tools (Anno&Tag Clash, Dim&Text Clash,
+Door Tag Finder, Ceiling Height Color). The originals are kept in
+a journal per project, so highlights can be undone in bulk, for
+many views at once, even in a later session.
+__________________________________________________________________
+How-to:
+1. Run the script.
+2. Select the views to restore from the list; each entry shows
+how many elements are still highlighted in that view.
+3. All selected views are restored in a single transaction. The
+cached clash results of those views are dropped, so the next clash
+run checks them from scratch and highlights every overlap again.
+__________________________________________________________________
+Last update:
+- [18.10.2026] - v1.1.0 Restoring drops the cached clash results of the
+restored views; elements deleted since are skipped without a lookup.
+- [18.10.2026] - v1.0.0 Initial release
+__________________________________________________________________
+To-Do:
+-
+__________________________________________________________________
+Author: Luis Ibanez"""
+
+# Import necessary Revit API classes
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.UI import TaskDialog
+from pyrevit import forms
+
+from pyreforge.override_journal import OverrideJournal
+
+# Get the active document
+doc = __revit__.ActiveUIDocument.Document
+
+# Journal of the overrides replaced by the highlight tools
+override_journal = OverrideJournal.for_document(doc)
+
+# Label every journaled view that still exists
+view_keys_by_label = {}
+for view_key, count in sorted(override_journal.views().items()):
+    view = doc.GetElement(ElementId(view_key))
+    view_name = view.Name if view is not None else "Deleted view {}".format(view_key)
+    view_keys_by_label["{} ({} elements)".format(view_name, count)] = view_key
+
+if not view_keys_by_label:
+    TaskDialog.Show("Restore Overrides", "There are no highlighted elements to restore in this project.")
+else:
+    selected_labels = forms.SelectFromList.show(sorted(view_keys_by_label),
+                                                title="Select Views to Restore",
+                                                button_name="Restore",
+                                                multiselect=True)
+    if selected_labels:
+        restored_count = override_journal.restore(doc, [view_keys_by_label[label] for label in selected_labels])
+        override_journal.save()
+        TaskDialog.Show("Overrides Restored",
+                        "{} elements in {} views have been restored to their original graphics.".format(
+                            restored_count, len(selected_labels)))
+    else:
+        TaskDialog.Show("Operation Cancelled", "No views were selected.")
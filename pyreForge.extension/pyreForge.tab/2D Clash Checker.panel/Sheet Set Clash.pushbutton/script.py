@@ -0,0 +1,94 @@
+__title__ = "Sheet Set\nClash"
+__doc__ = """Version = 1.4
+Date    = 18.10.2026
+__________________________________________________________________
+Description:
+This script runs the tag and dimension/text clash checks on many
+views in one go: every view placed on a set of sheets, or a list
+of views. Walls and columns are read and indexed once per view
+range and shared by every view that cuts the model at the same
+elevations; each view only clashes with the walls and columns it
+shows. The clashes of all views are listed in one table.
+__________________________________________________________________
+How-to:
+1. Run the script and choose whether to pick sheets or views.
+2. Select the sheets (a sheet set can be picked from the list) or
+the views to check.
+3. A table lists every tag and annotation that overlaps a wall or
+column, per view. Click an id to select the element in Revit.
+4. Nothing is recolored; use the single-view tools to highlight.
+__________________________________________________________________
+Last update:
+- [18.10.2026] - v1.4.0 Annotation and target boxes of each view are 
+compared per grid cell in one batch (vectorized when NumPy is 
+available) before the exact checks.
+- [18.10.2026] - v1.3.0 Shared targets are limited to the ones each view 
+shows (crop, visibility, phase, design options, worksets), matching 
+the single-view tools.
+- [18.10.2026] - v1.2.0 Both checks run as rules of the shared clash 
+engine, in a single pass per view.
+- [18.10.2026] - v1.1.0 Box hits on walls are confirmed against the 
+wall's real plan footprint (location line and width).
+- [18.10.2026] - v1.0.0 Initial release
+__________________________________________________________________
+To-Do:
+-
+__________________________________________________________________
+Author: Luis Ibanez"""
+
+# Import necessary Revit API classes
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.UI import TaskDialog
+from pyrevit import forms
+from pyrevit import script
+
+from pyreforge.bbox_table import BoxTable
+from pyreforge.clash import ClashEngine
+from pyreforge.clash_rules import DIMENSIONS_AND_TEXT_VS_WALLS, TAGS_VS_WALLS_AND_COLUMNS
+from pyreforge.ids import id_value
+from pyreforge.view_batch import SharedTargetIndex, is_checkable_view, views_on_sheets
+
+# Get the active document
+doc = __revit__.ActiveUIDocument.Document
+
+# Clash rules checked in every view
+clash_engine = ClashEngine([TAGS_VS_WALLS_AND_COLUMNS, DIMENSIONS_AND_TEXT_VS_WALLS])
+
+# Function to check one view and append its clashes to the result rows
+def check_view(view, targets, rows, output):
+    view_targets = targets.for_view(view)
+    sources = clash_engine.collect_sources(doc, view)
+    source_table = BoxTable.from_elements(sources, view)
+    hits = clash_engine.check(sources, source_table, view_targets)
+    for source in sources:
+        hit = hits.get(id_value(source.Id))
+        if hit is not None:
+            rule, target_key = hit
+            rows.append([view.Name, rule.name, source.Category.Name, output.linkify(source.Id),
+                         output.linkify(ElementId(target_key))])
+
+# Ask where the views come from
+view_source = forms.CommandSwitchWindow.show(["Sheets", "Views"], message="Check the views placed on sheets or a list of views?")
+
+views = []
+if view_source == "Sheets":
+    sheets = forms.select_sheets(title="Select Sheets to Check", button_name="Check", include_placeholder=False)
+    if sheets:
+        views = views_on_sheets(doc, sheets)
+elif view_source == "Views":
+    views = forms.select_views(title="Select Views to Check", button_name="Check", filterfunc=is_checkable_view) or []
+
+if views:
+    output = script.get_output()
+    targets = SharedTargetIndex(doc, clash_engine.target_categories)
+    rows = []
+    for view in views:
+        check_view(view, targets, rows, output)
+
+    # One consolidated table for all views
+    output.print_table(table_data=rows,
+                       title="Clashes in {} views".format(len(views)),
+                       columns=["View", "Rule", "Category", "Element", "Clashes With"])
+    print("{} clashes found in {} views; {} target indexes built.".format(len(rows), len(views), len(targets)))
+else:
+    TaskDialog.Show("Operation Cancelled", "No views were selected.")
@@ -0,0 +1,79 @@
+__title__ = "Untagged\nElements"
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+__________________________________________________________________
+Description:
+Identifies and highlights the elements in the active view that do
+not have a tag, for any mix of taggable categories (doors, windows,
+rooms, walls, equipment, fixtures, ...). Category tags and
+multi-category tags both count.
+__________________________________________________________________
+How-to:
+1. Navigate to the view you want to check.
+2. Run the script and select the categories to check.
+3. Untagged elements are highlighted in red and selected; a table
+lists how many are missing a tag per category.
+4. Use Restore Overrides to take the highlight back later.
+__________________________________________________________________
+Last update:
+- [18.10.2026] - v1.0.0 Initial release
+__________________________________________________________________
+To-Do:
+-
+__________________________________________________________________
+Author: Luis Ibanez"""
+
+# Import necessary Revit API classes
+from Autodesk.Revit.UI import TaskDialog
+from Autodesk.Revit.DB import *
+from System.Collections.Generic import List
+from pyrevit import forms, script
+
+from pyreforge.ids import id_value
+from pyreforge.override_journal import OverrideJournal, apply_highlight
+from pyreforge.tag_registry import TAG_REGISTRY, UntaggedFinder
+
+# Get the active document and selection
+doc = __revit__.ActiveUIDocument.Document
+uidoc = __revit__.ActiveUIDocument
+
+# Get the active view
+active_view = doc.ActiveView
+
+# Ask which categories to check
+pairs_by_label = dict((pair.label, pair) for pair in TAG_REGISTRY)
+selected_labels = forms.SelectFromList.show([pair.label for pair in TAG_REGISTRY],
+                                            title="Select Categories to Check",
+                                            button_name="Check",
+                                            multiselect=True)
+
+if not selected_labels:
+    TaskDialog.Show("Operation Cancelled", "No categories were selected.")
+else:
+    # One collector pass over the selected categories and their tags
+    untagged_finder = UntaggedFinder([pairs_by_label[label] for label in selected_labels])
+    untagged, tagged = untagged_finder.find(doc, active_view)
+
+    # Highlight the untagged elements in red and give the others their original graphics back
+    override_journal = OverrideJournal.for_document(doc)
+    apply_highlight(active_view, [element.Id for element in untagged], [element.Id for element in tagged],
+                    "untagged_finder", "Highlight Untagged Elements", override_journal)
+    override_journal.save()
+
+    # Select the untagged elements
+    uidoc.Selection.SetElementIds(List[ElementId]([element.Id for element in untagged]))
+
+    if untagged:
+        # Count the untagged and tagged elements per category
+        counts = {}
+        for element in untagged:
+            counts.setdefault(id_value(element.Category.Id), [element.Category.Name, 0, 0])[1] += 1
+        for element in tagged:
+            counts.setdefault(id_value(element.Category.Id), [element.Category.Name, 0, 0])[2] += 1
+
+        output = script.get_output()
+        output.print_table(table_data=[list(row) for row in sorted(counts.values())],
+                           title="{} untagged elements in {}".format(len(untagged), active_view.Name),
+                           columns=["Category", "Untagged", "Tagged"])
+    else:
+        TaskDialog.Show("No Elements Found", "Every element of the selected categories is tagged in the active view.")
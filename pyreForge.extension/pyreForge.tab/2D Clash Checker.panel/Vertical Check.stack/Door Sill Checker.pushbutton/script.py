@@ -1,6 +1,6 @@
 __title__ = "Door Sill \nChecker"
-__doc__ = """Version = 1.0
-Date    = 26.06.2024
+__doc__ = """Version = 1.1
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 Highlight the door is sill height is not equal to zero. 
@@ -13,6 +13,10 @@ to change the color,select all door, then change the graphic
 override to 'no graphics override'.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.1.0 Revit filters the doors with a parameter rule
+and a 0.1 mm tolerance, so only doors with a sill height reach the
+script; doors fixed since the last run get their original graphics
+back instead of being forced to black.
 - [26.06.2024] - v1.0.0 Initial release
 __________________________________________________________________
 To-Do:
@@ -26,34 +30,25 @@ clr.AddReference("RevitAPIUI")
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
 
-# Function to set default color (black) for elements
-def set_default_color(element):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(0, 0, 0))  # Black color
-    uidoc.ActiveView.SetElementOverrides(element.Id, overrideSettings)
-
-# Function to highlight elements with non-zero sill height
-def highlight_element(element):
-    overrideSettings = OverrideGraphicSettings().SetProjectionLineColor(Color(255, 0, 0))  # Red color for highlighting
-    uidoc.ActiveView.SetElementOverrides(element.Id, overrideSettings)
+from pyreforge.ids import id_value
+from pyreforge.override_journal import OverrideJournal, apply_highlight
+from pyreforge.parameter_rules import find_violations
+from pyreforge.vertical_checks import DOOR_SILL_RULES
 
 # Get the active Revit document and UI document
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 
-# Get all doors in the document
-doors = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Doors).WhereElementIsNotElementType().ToElements()
-
-# Create Transaction to make changes in the project.
-with Transaction(doc, "Highlight Doors with Non-Zero Sill Height") as t:
-    t.Start()
+# Get the doors with a non-zero sill height in the document
+doors = find_violations(doc, BuiltInCategory.OST_Doors, DOOR_SILL_RULES)
+door_keys = set(id_value(door.Id) for door in doors)
 
-    for door in doors:
-        sill_height_param = door.get_Parameter(BuiltInParameter.INSTANCE_SILL_HEIGHT_PARAM)
-        if sill_height_param:
-            sill_height = sill_height_param.AsDouble()
-            if sill_height != 0:
-                highlight_element(door)
-            else:
-                set_default_color(door)
+# Doors highlighted by an earlier run that have been fixed since
+active_view = uidoc.ActiveView
+override_journal = OverrideJournal.for_document(doc)
+fixed_keys = override_journal.elements(id_value(active_view.Id), "door_sill_checker") - door_keys
 
-    t.Commit()
+# Highlight the doors in red and give the fixed ones their original graphics back
+apply_highlight(active_view, [door.Id for door in doors], [ElementId(key) for key in fixed_keys],
+                "door_sill_checker", "Highlight Doors with Non-Zero Sill Height", override_journal)
+override_journal.save()
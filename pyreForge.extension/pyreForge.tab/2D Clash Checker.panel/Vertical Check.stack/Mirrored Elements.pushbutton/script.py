@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Mirrored \nElements"
-__doc__ = """Version = 1.0
-Date    = 05.04.2024
+__doc__ = """Version = 1.1
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script highlights mirrored 3D elements in the active Revit view. 
@@ -10,10 +10,16 @@ BIM Interoperability tool for not adhering to best practices.
 __________________________________________________________________
 How-to:
 1. Run the script by clicking the button.
-2. The script will select mirrored 3D elements in the active view.
-3. If no mirrored elements are found, a message will be displayed.
+2. Choose the active view or the whole project.
+3. In the active view, the script will select mirrored 3D elements.
+4. For the whole project, a table lists the mirrored count per
+family type.
+5. If no mirrored elements are found, a message will be displayed.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.1.0 Only model family instances are read from the
+view, filtered inside Revit; added a whole-project report of mirrored
+counts per family type.
 - [05.04.2024] - v1.0.0 Initial release
 __________________________________________________________________
 To-Do:
@@ -27,29 +33,16 @@ clr.AddReference("RevitAPIUI")
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
 from System.Collections.Generic import List
+from pyrevit import forms, script
 
-try:
-    # Get the active Revit document and UI document
-    doc = __revit__.ActiveUIDocument.Document
-    uidoc = __revit__.ActiveUIDocument
-
-    # Get all 3D elements in the active view
-    elements = FilteredElementCollector(doc, uidoc.ActiveView.Id).WhereElementIsNotElementType().ToElements()
+from pyreforge.vertical_checks import mirrored_counts_by_type, mirrored_instances
 
-    # Filter out non-3D elements
-    three_d_elements = []
-    for element in elements:
-        if element.Category and element.Category.CategoryType == CategoryType.Model:
-            three_d_elements.append(element)
-
-    # Clear the current selection
-    uidoc.Selection.SetElementIds(List[ElementId]())
-
-    # Iterate through elements and select mirrored elements
+# Function to select the mirrored elements of the active view
+def select_in_active_view():
+    # Stream the mirrored family instances of the view into the selection
     element_ids = List[ElementId]()
-    for element in three_d_elements:
-        if hasattr(element, 'Mirrored') and element.Mirrored:
-            element_ids.Add(element.Id)
+    for element in mirrored_instances(doc, uidoc.ActiveView):
+        element_ids.Add(element.Id)
 
     uidoc.Selection.SetElementIds(element_ids)
 
@@ -59,6 +52,39 @@ try:
         task_dialog.MainContent = "No mirrored elements found in the active view."
         task_dialog.Show()
 
+# Function to list the mirrored counts per family type of the project
+def report_project():
+    counts = mirrored_counts_by_type(doc)
+    if not counts:
+        task_dialog = TaskDialog("No Mirrored Elements")
+        task_dialog.MainContent = "No mirrored elements found in the project."
+        task_dialog.Show()
+        return
+
+    rows = []
+    for type_key, (mirrored_count, instance_count) in counts.items():
+        family_type = doc.GetElement(ElementId(type_key))
+        rows.append([family_type.Category.Name if family_type.Category else "", family_type.FamilyName,
+                     Element.Name.GetValue(family_type), mirrored_count, instance_count])
+    rows.sort(key=lambda row: -row[3])
+    script.get_output().print_table(table_data=rows,
+                                    title="{} mirrored elements in {} family types".format(
+                                        sum(row[3] for row in rows), len(rows)),
+                                    columns=["Category", "Family", "Type", "Mirrored", "Instances"])
+
+try:
+    # Get the active Revit document and UI document
+    doc = __revit__.ActiveUIDocument.Document
+    uidoc = __revit__.ActiveUIDocument
+
+    # Ask for the scope of the check
+    check_scope = forms.CommandSwitchWindow.show(["Active view", "Whole project"],
+                                                 message="Where do you want to look for mirrored elements?")
+    if check_scope == "Active view":
+        select_in_active_view()
+    elif check_scope == "Whole project":
+        report_project()
+
 except AttributeError as e:
     print("Error: ", e)
     task_dialog = TaskDialog("Error")
@@ -69,4 +95,4 @@ except Exception as e:
     print("Error: ", e)
     task_dialog = TaskDialog("Error")
     task_dialog.MainContent = "An unexpected error occurred. Please try again."
-    task_dialog.Show()
\ No newline at end of file
+    task_dialog.Show()
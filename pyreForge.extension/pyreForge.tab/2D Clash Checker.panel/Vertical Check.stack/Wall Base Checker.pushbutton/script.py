@@ -1,6 +1,6 @@
 __title__ = "Wall Base \nOffset"
-__doc__ = """Version = 1.0
-Date    = 26.06.2024
+__doc__ = """Version = 1.1
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script highlights walls in the active Revit project where 
@@ -12,6 +12,8 @@ How-to:
 2. The script will select walls whose base offset is not zero.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.1.0 Revit filters the walls with a parameter rule
+and a 0.1 mm tolerance, so only offset walls reach the script.
 - [26.06.2024] - v1.0.0 Initial release
 __________________________________________________________________
 Author: Luis Ibanez"""
@@ -20,21 +22,18 @@ Author: Luis Ibanez"""
 from Autodesk.Revit.DB import *
 from System.Collections.Generic import List
 
+from pyreforge.parameter_rules import find_violations
+from pyreforge.vertical_checks import WALL_BASE_RULES
+
 # Get the active document and UI document
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 
-# Collect walls
-walls = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Walls).WhereElementIsNotElementType().ToElements()
+# Collect the offset walls
+walls = find_violations(doc, BuiltInCategory.OST_Walls, WALL_BASE_RULES)
 
 # Create a list of element IDs
-element_ids = List[ElementId]()
-
-for wall in walls:
-    base_offset = wall.get_Parameter(BuiltInParameter.WALL_BASE_OFFSET)
-    if base_offset:
-        if base_offset.AsDouble()!= 0:
-            element_ids.Add(wall.Id)
+element_ids = List[ElementId]([wall.Id for wall in walls])
 
 # Set the selection
-uidoc.Selection.SetElementIds(element_ids)
\ No newline at end of file
+uidoc.Selection.SetElementIds(element_ids)
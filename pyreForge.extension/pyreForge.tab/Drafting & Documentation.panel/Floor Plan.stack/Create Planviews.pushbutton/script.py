@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Create Plans"
-__doc__ = """Version = 1.0
-Date    = 26.06.2024
+__doc__ = """Version = 1.2
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script enables users to create multiple types of plans in Autodesk Revit based on selected levels. 
@@ -12,11 +12,19 @@ __________________________________________________________________
 How-to:
 1. Run the script by clicking the button.
 2. In the form that appears, select one or more levels from the list.
-3. Check the types of plans you want to create (Floor Plan, Area Plan, Structural Plan, Ceiling Plan).
-4. Click "OK" to generate the selected plans.
-5. A success message will confirm that the plans have been created.
+3. Check the types of plans you want to create (Floor Plan, Area Plan, Structural Plan, Ceiling Plan)
+and optionally pick a view template for each.
+4. Adjust the name template if needed; {level}, {plan} and {type} are replaced by the level name,
+the plan type and the view family type name. Characters Revit does not accept in view names
+(: { } [ ] | ; < > ? \\ ` ~) are refused.
+5. Click "OK" to generate the selected plans.
+6. A success message will confirm that the plans have been created.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.2.0 Name templates with characters Revit rejects are refused up front; a plan 
+that cannot be renamed is reported and removed instead of cancelling the whole run.
+- [18.10.2026] - v1.1.0 Levels, view types and templates are looked up once and all plans are created 
+in a single transaction; added name templates, view templates per plan type and area plan support.
 - [26.06.2024] - v1.0.0 Initial release
 __________________________________________________________________
 To-Do:
@@ -33,16 +41,25 @@ clr.AddReference('System.Windows.Forms')
 clr.AddReference('System.Drawing')
 
 from System.Windows.Forms import Form, CheckBox, Button, DialogResult, MessageBoxButtons, MessageBoxIcon, ComboBox, \
-    ListBox, CheckedListBox, Label
+    ListBox, CheckedListBox, Label, TextBox, ComboBoxStyle
 from System.Drawing import Point, Size
 from Autodesk.Revit.UI import TaskDialog
 
+from pyreforge.plan_views import DEFAULT_NAME_TEMPLATE, PLAN_TYPES, PlanGenerator, check_name_template
+
+# Lookups of levels, view types and templates, built once
+doc = __revit__.ActiveUIDocument.Document
+plan_generator = PlanGenerator(doc)
+
+# Entry of the template lists meaning "no view template"
+NO_TEMPLATE = "<None>"
+
 
 class CreatePlanForm(Form):
     def __init__(self):
         self.Text = "Create Plan"
-        self.Width = 300
-        self.Height = 450
+        self.Width = 420
+        self.Height = 500
 
         self.level_note_label = Label()
         self.level_note_label.Text = "Please select one or more levels to proceed:"
@@ -57,8 +74,8 @@ class CreatePlanForm(Form):
         self.Controls.Add(self.level_listbox)
 
         self.plan_checkboxes = []
-        plan_types = ["Floor Plan", "Area Plan", "Structural Plan", "Ceiling Plan"]
-        for i, plan_type in enumerate(plan_types):
+        self.template_comboboxes = []
+        for i, (plan_type, _, _) in enumerate(PLAN_TYPES):
             checkbox = CheckBox()
             checkbox.Text = plan_type
             checkbox.Location = Point(10, 190 + i * 30)
@@ -66,9 +83,33 @@ class CreatePlanForm(Form):
             self.Controls.Add(checkbox)
             self.plan_checkboxes.append(checkbox)
 
+            # View templates that fit this plan type
+            combobox = ComboBox()
+            combobox.DropDownStyle = ComboBoxStyle.DropDownList
+            combobox.Location = Point(170, 190 + i * 30)
+            combobox.Width = 220
+            combobox.Items.Add(NO_TEMPLATE)
+            for template in plan_generator.templates_for(plan_type):
+                combobox.Items.Add(template.Name)
+            combobox.SelectedIndex = 0
+            self.Controls.Add(combobox)
+            self.template_comboboxes.append(combobox)
+
+        self.name_label = Label()
+        self.name_label.Text = "View name template:"
+        self.name_label.Location = Point(10, 320)
+        self.name_label.Width = 250
+        self.Controls.Add(self.name_label)
+
+        self.name_textbox = TextBox()
+        self.name_textbox.Text = DEFAULT_NAME_TEMPLATE
+        self.name_textbox.Location = Point(10, 345)
+        self.name_textbox.Width = 380
+        self.Controls.Add(self.name_textbox)
+
         self.ok_button = Button()
         self.ok_button.Text = "OK"
-        self.ok_button.Location = Point(10, 350)
+        self.ok_button.Location = Point(10, 400)
         self.ok_button.Width = 75
         self.ok_button.DialogResult = DialogResult.OK
         self.AcceptButton = self.ok_button
@@ -76,7 +117,7 @@ class CreatePlanForm(Form):
 
         self.cancel_button = Button()
         self.cancel_button.Text = "Cancel"
-        self.cancel_button.Location = Point(100, 350)
+        self.cancel_button.Location = Point(100, 400)
         self.cancel_button.Width = 75
         self.cancel_button.DialogResult = DialogResult.Cancel
         self.CancelButton = self.cancel_button
@@ -85,49 +126,41 @@ class CreatePlanForm(Form):
         self.load_levels()
 
     def load_levels(self):
-        doc = __revit__.ActiveUIDocument.Document
-        levels = FilteredElementCollector(doc).OfClass(Level).ToElements()
-        for level in levels:
+        for level in plan_generator.levels:
             self.level_listbox.Items.Add(level.Name)
             self.level_listbox.SetItemChecked(self.level_listbox.Items.Count - 1, False)
 
     def create_plans(self):
-        global view_family
-        doc = __revit__.ActiveUIDocument.Document
         selected_levels = [self.level_listbox.Items[i] for i in range(self.level_listbox.Items.Count) if
                            self.level_listbox.GetItemChecked(i)]
-        view_types = FilteredElementCollector(doc).OfClass(ViewFamilyType).ToElements()
-
-        for level_name in selected_levels:
-            level = None
-            for l in FilteredElementCollector(doc).OfClass(Level).ToElements():
-                if l.Name == level_name:
-                    level = l
-                    break
-
-            for i, checkbox in enumerate(self.plan_checkboxes):
-                if checkbox.Checked:
-                    plan_type = checkbox.Text
-                    if plan_type == "Floor Plan":
-                        view_family = ViewFamily.FloorPlan
-                    elif plan_type == "Area Plan":
-                        view_family = ViewFamily.AreaPlan
-                    elif plan_type == "Structural Plan":
-                        view_family = ViewFamily.StructuralPlan
-                    elif plan_type == "Ceiling Plan":
-                        view_family = ViewFamily.CeilingPlan
-
-                    view_types_plans = [vt for vt in view_types if vt.ViewFamily == view_family]
-                    plan_type = view_types_plans[0]
-                    with Transaction(doc, "Create {} Plan".format(plan_type)) as t:
-                        t.Start()
-                        view = ViewPlan.Create(doc, plan_type.Id, level.Id)
-                        t.Commit()
-                    print("{} plan created for level {}".format(plan_type, level_name))
+        selected_plan_types = []
+        view_templates = {}
+        for checkbox, combobox in zip(self.plan_checkboxes, self.template_comboboxes):
+            if checkbox.Checked:
+                selected_plan_types.append(checkbox.Text)
+                if combobox.SelectedIndex > 0:
+                    view_templates[checkbox.Text] = plan_generator.templates_for(checkbox.Text)[combobox.SelectedIndex - 1]
+
+        name_template = self.name_textbox.Text
+        try:
+            check_name_template(name_template)
+        except ValueError as e:
+            TaskDialog.Show("Invalid Name Template", str(e))
+            return
+
+        # Create every plan in a single transaction
+        created_views, failures = plan_generator.create(selected_levels, selected_plan_types, name_template,
+                                                        view_templates)
+        for view in created_views:
+            print("{} created".format(view.Name))
+        for level_name, plan_type, message in failures:
+            print("{} plan could not be created for level {}: {}".format(plan_type, level_name, message))
 
         # Show a pop-up dialog when successful
         task_dialog = TaskDialog("Success")
-        task_dialog.MainContent = "Plans created successfully!"
+        task_dialog.MainContent = "{} plans created successfully!".format(len(created_views))
+        if failures:
+            task_dialog.MainContent += " {} could not be created, see the output window.".format(len(failures))
         task_dialog.Show()
 
 
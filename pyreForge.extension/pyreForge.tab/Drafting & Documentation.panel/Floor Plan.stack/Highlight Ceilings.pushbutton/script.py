@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Ceiling Height Color"
-__doc__ = """Version = 1.0
-Date    = 11.07.2024
+__doc__ = """Version = 1.5
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script allows users to highlight ceiling elements in the active view based on their height. 
@@ -13,10 +13,28 @@ How-to:
 1. Run the script by clicking the button.
 2. Confirm the operation in the warning dialog that appears.
 3. After confirmation, ceilings in the active view will be highlighted based on their height.
+If the view uses a view template, you can choose to color the template instead, so every view
+using it gets the colors.
 4. You will receive a message confirming the highlight operation.
 5. To revert the colors to the original state, use the provided option to revert colors.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.5.0 Only ceilings still carrying a v1.0 color (line 
+and solid fill of one palette color) lose it, and only those three 
+overrides; the overrides they replace are journaled and reverting puts 
+them back. Clearing and filters are one undo step, rolled back together.
+- [18.10.2026] - v1.4.0 Per-element colors left by v1.0 on the ceilings 
+of the active view are cleared before the filters are applied, since 
+they hide the filter colors.
+- [18.10.2026] - v1.3.0 The solid fill pattern and the band colors come 
+from a shared graphics registry, cached per project and reused between 
+runs.
+- [18.10.2026] - v1.2.0 Colors are applied with one view filter per height 
+band instead of per-element overrides, so they follow height changes; 
+filters are reused between runs and can go on the view template. No 
+per-element colors are written anymore.
+- [18.10.2026] - v1.1.0 Colors are written in one transaction instead of 
+one per ceiling.
 - [11.07.2024] - v1.0.0 Initial release
 __________________________________________________________________
 Author: Luis Ibanez"""
@@ -24,7 +42,12 @@ Author: Luis Ibanez"""
 # Import necessary Revit API classes
 from Autodesk.Revit.UI import TaskDialog, TaskDialogResult, TaskDialogCommonButtons
 from Autodesk.Revit.DB import *
-from System.Collections.Generic import List
+
+from pyreforge import color_schemes
+from pyreforge.graphics import GraphicsRegistry
+from pyreforge.ids import id_value
+from pyreforge.override_journal import OverrideJournal
+from pyreforge.overrides import OverrideBatch
 
 # Get the active document and selection
 doc = __revit__.ActiveUIDocument.Document
@@ -34,106 +57,86 @@ selection = uidoc.Selection
 # Get the active view
 active_view = doc.ActiveView
 
-# Function to get a color based on height
-def get_color_by_height(height):
-    base_height = 1.5  # Starting height in meters
-    max_height = 5.0  # Maximum height in meters
-    increment = 0.1  # Increment in meters (100mm)
-
-    colors = [
-        Color(255, 0, 0),  # Red
-        Color(0, 255, 0),  # Green
-        Color(0, 0, 255),  # Blue
-        Color(255, 255, 0),  # Yellow
-        Color(0, 255, 255),  # Cyan
-        Color(255, 0, 255),  # Magenta
-        Color(128, 0, 0),  # Maroon
-        Color(0, 128, 0),  # Dark Green
-        Color(0, 0, 128),  # Navy
-        Color(128, 128, 0)  # Olive
-    ]
-
-    if height < base_height:
-        return Color(255, 255, 255)  # White for heights below base_height
-    elif height > max_height:
-        return Color(0, 0, 0)  # Black for heights above max_height
-
-    index = int((height - base_height) / increment)
-    return colors[index % len(colors)]
-
-# Function to get the solid fill pattern ID
-def get_solid_fill_pattern_id(doc):
-    solid_fill = None
-    collector = FilteredElementCollector(doc).OfClass(FillPatternElement)
-    for pattern in collector:
-        if pattern.GetFillPattern().IsSolidFill:
-            solid_fill = pattern.Id
-            break
-    return solid_fill
-
-# Function to override graphics for ceilings based on their height
-def override_ceilings_by_height():
-    # Filter for ceilings in the active view
-    ceilings_collector = FilteredElementCollector(doc, active_view.Id).OfCategory(
-        BuiltInCategory.OST_Ceilings).WhereElementIsNotElementType()
+# Overrides replaced when clearing the colors of v1.0, kept for revert
+override_journal = OverrideJournal.for_document(doc)
 
-    # Get the solid fill pattern ID
-    solid_fill_id = get_solid_fill_pattern_id(doc)
+# Colors v1.0 wrote per ceiling: the band palette, white below and black above
+V1_COLORS = color_schemes.PALETTE + [color_schemes.WHITE, color_schemes.BLACK]
 
-    # Start a transaction
-    t = Transaction(doc, "Override Ceilings by Height")
-    t.Start()
+# One view filter per 100mm height band from 1.5 to 5 meters, colors cycling through the palette
+ceiling_colors = color_schemes.ceiling_height()
 
-    try:
-        # Iterate through the ceilings and apply overrides
-        for ceiling in ceilings_collector:
-            height_param = ceiling.LookupParameter("Height Offset From Level")
-            if height_param:
-                height = height_param.AsDouble() * 0.3048  # Convert from feet to meters
-                color = get_color_by_height(height)
+# Function to get the active view's template, or None
+def get_view_template():
+    if active_view.ViewTemplateId == ElementId.InvalidElementId:
+        return None
+    return doc.GetElement(active_view.ViewTemplateId)
 
-                # Create OverrideGraphicSettings
-                override_settings = OverrideGraphicSettings()
-                override_settings.SetProjectionLineColor(color)
-                override_settings.SetSurfaceForegroundPatternColor(color)
-
-                # Set the surface foreground pattern to solid fill
-                if solid_fill_id:
-                    override_settings.SetSurfaceForegroundPatternId(solid_fill_id)
-
-                active_view.SetElementOverrides(ceiling.Id, override_settings)
-
-        t.Commit()
+# Function to clear the per-element colors v1.0 wrote on the ceilings of the active view
+def clear_ceiling_overrides():
+    solid_fill_id = GraphicsRegistry.for_document(doc).solid_fill_id()
+    if solid_fill_id is None:
+        return 0
+    ceilings_collector = FilteredElementCollector(doc, active_view.Id).OfCategory(
+        BuiltInCategory.OST_Ceilings).WhereElementIsNotElementType()
+    # Ceilings without a v1.0 color are not written; other overrides are kept
+    batch = OverrideBatch(active_view)
+    for ceiling in ceilings_collector:
+        batch.reset_solid_fill(ceiling.Id, V1_COLORS, solid_fill_id)
+    written, skipped = batch.apply("Clear Ceiling Overrides")
+    override_journal.record(id_value(active_view.Id), batch.journal, "ceiling_height")
+    return written
+
+# Function to pick the view that receives the filters: the active view or its template
+def get_target_view():
+    view_template = get_view_template()
+    if view_template is None:
+        return active_view
+    template_dialog = TaskDialog("View Template")
+    template_dialog.MainInstruction = "The active view uses the view template '{}'. Apply the ceiling colors to the template, so every view using it is colored?".format(view_template.Name)
+    template_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
+    template_dialog.DefaultButton = TaskDialogResult.Yes
+    return view_template if template_dialog.Show() == TaskDialogResult.Yes else active_view
+
+# Function to color ceilings based on their height
+def override_ceilings_by_height():
+    target_view = get_target_view()
+    # One undo step: a failed filter apply also rolls back the cleared colors
+    group = TransactionGroup(doc, "Override Ceilings by Height")
+    group.Start()
+    try:
+        # Per-element colors of v1.0 would hide the filter colors
+        clear_ceiling_overrides()
+
+        # Height bands in use: in the active view, or in the whole model for a template
+        height_bands = ceiling_colors.occupied(doc, None if target_view.IsTemplate else active_view)
+        ceiling_colors.apply(doc, target_view, height_bands, "Override Ceilings by Height")
+        group.Assimilate()
+        override_journal.save()
     except Exception as e:
-        t.RollBack()
+        group.RollBack()
         TaskDialog.Show("Error", str(e))
         return
 
 # Function to revert ceiling colors to original
 def revert_ceilings_color():
-    # Start a transaction
-    t = Transaction(doc, "Revert Ceiling Colors")
-    t.Start()
-
+    group = TransactionGroup(doc, "Revert Ceiling Colors")
+    group.Start()
     try:
-        # Filter for ceilings in the active view
-        ceilings_collector = FilteredElementCollector(doc, active_view.Id).OfCategory(
-            BuiltInCategory.OST_Ceilings).WhereElementIsNotElementType()
-
-        # Iterate through the ceilings and revert overrides
-        for ceiling in ceilings_collector:
-            override_settings = OverrideGraphicSettings()
-
-            # Set the surface foreground pattern and color to default (no override)
-            override_settings.SetSurfaceForegroundPatternId(ElementId.InvalidElementId)
-            override_settings.SetSurfaceForegroundPatternColor(Color(255, 255, 255))  # Default color (white)
-
-            active_view.SetElementOverrides(ceiling.Id, override_settings)
-
-        t.Commit()
-        TaskDialog.Show("Ceiling Color Reverted", "Ceiling colors have been reverted to the original state.")
+        removed_count = ceiling_colors.remove(doc, active_view, "Revert Ceiling Colors")
+        view_template = get_view_template()
+        if view_template is not None:
+            removed_count += ceiling_colors.remove(doc, view_template, "Revert Ceiling Colors")
+        # Overrides replaced when the v1.0 colors were cleared
+        restored_count = override_journal.restore(doc, [id_value(active_view.Id)], "ceiling_height",
+                                                  "Revert Ceiling Colors")
+        group.Assimilate()
+        override_journal.save()
+        TaskDialog.Show("Ceiling Color Reverted",
+                        "{} height filters have been removed and {} ceiling overrides put back.".format(
+                            removed_count, restored_count))
     except Exception as e:
-        t.RollBack()
+        group.RollBack()
         TaskDialog.Show("Error", str(e))
         return
 
@@ -1,14 +1,20 @@
 __title__ = "Pin Viewports"
-__doc__ = """Version = 1.1
-Date    = 22.01.2025
+__doc__ = """Version = 1.2
+Date    = 18.10.2026
 _____________________________________________________________________
 Description:
-Pin or Unpin all viewports using a dialog with buttons.
+Pin or Unpin the viewports of selected sheets, a sheet set or the whole 
+project. Only viewports whose state changes are written, in one 
+transaction, and a table shows the pinned counts per sheet.
 _____________________________________________________________________
 How-to:
--> Click the button and select whether to pin or unpin all viewports.
+1. Click the button and choose Selected sheets or Whole project.
+2. For sheets, pick them from the list (a sheet set can be picked there).
+3. Select whether to pin or unpin the viewports.
 _____________________________________________________________________
 Last update:
+- [18.10.2026] - v1.2.0 Scoped to sheets; only viewports whose state 
+differs are written, with a before/after report per sheet.
 - [22.01.2025] - v1.1.0 Updated to use standard Yes/No buttons for Pin/Unpin options.
 _____________________________________________________________________
 To-Do:
@@ -22,49 +28,51 @@ import clr
 clr.AddReference('RevitAPI')
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import TaskDialog, TaskDialogCommonButtons, TaskDialogResult
+from pyrevit import forms
+from pyrevit import script
+
+from pyreforge.pins import PinReport, apply_pins, sheet_viewports
 
 # Get the current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
-# Create a dialog with Pin and Unpin options using buttons
-action_dialog = TaskDialog("Pin or Unpin Viewports")
-action_dialog.MainContent = "Choose whether to pin or unpin all viewports."
-action_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
-action_dialog.MainInstruction = "Click Yes to Pin or No to Unpin the viewports."
-
-# Show the dialog
-result = action_dialog.Show()
-
-# Define the function to pin or unpin viewports
-def toggle_viewports(doc, pin=True):
-    # Start a transaction
-    t = Transaction(doc, "Toggle Viewports Pin")
-    t.Start()
+# Ask which viewports to change
+scope = forms.CommandSwitchWindow.show(["Selected sheets", "Whole project"], message="Pin or unpin the viewports of:")
 
-    # Get all the viewports in the document
-    collector = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Viewports)
+sheets = None
+if scope == "Selected sheets":
+    sheets = forms.select_sheets(title="Select Sheets", button_name="Select", include_placeholder=False)
 
-    # Iterate through viewports and either pin or unpin them
-    for viewport in collector:
-        viewport.Pinned = pin
+result = None
+if scope == "Whole project" or sheets:
+    # Create a dialog with Pin and Unpin options using buttons
+    action_dialog = TaskDialog("Pin or Unpin Viewports")
+    action_dialog.MainContent = "Choose whether to pin or unpin the viewports."
+    action_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
+    action_dialog.MainInstruction = "Click Yes to Pin or No to Unpin the viewports."
 
-    # Commit the transaction
-    t.Commit()
-    t.Dispose()
+    # Show the dialog
+    result = action_dialog.Show()
 
 # Proceed based on user selection
-if result == TaskDialogResult.Yes:  # "Pin" option
-    toggle_viewports(doc, pin=True)
-    # Show success dialog for pinning
-    success_dialog = TaskDialog("Success")
-    success_dialog.MainContent = "All viewports have been pinned successfully!"
-    success_dialog.Show()
+if result in (TaskDialogResult.Yes, TaskDialogResult.No):
+    pin = result == TaskDialogResult.Yes
+    # Read every pinned state once, then write only the viewports that change
+    report = PinReport(sheet_viewports(doc, sheets), pin)
+    written = apply_pins(doc, report, "Pin Viewports" if pin else "Unpin Viewports")
+
+    output = script.get_output()
+    output.print_table(table_data=report.rows(),
+                       title="Viewports {}".format("pinned" if pin else "unpinned"),
+                       columns=["Sheet", "Viewports", "Pinned Before", "Changed", "Pinned After"])
+    for sheet, key, message in report.failed:
+        print("Viewport {} on {} could not be changed: {}".format(output.linkify(ElementId(key)), sheet, message))
 
-elif result == TaskDialogResult.No:  # "Unpin" option
-    toggle_viewports(doc, pin=False)
-    # Show success dialog for unpinning
+    # Show success dialog
     success_dialog = TaskDialog("Success")
-    success_dialog.MainContent = "All viewports have been unpinned successfully!"
+    success_dialog.MainContent = "{} viewports {}, {} already were, {} could not be changed.".format(
+        written, "pinned" if pin else "unpinned", sum(report.totals.values()) - len(report.changes),
+        len(report.failed))
     success_dialog.Show()
 
 # If the operation was canceled
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 __title__ = "Erase Rooms"
-__doc__ = """Version = 1.3
-Date    = 09.07.2024
+__doc__ = """Version = 1.4
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
 This script identifies and deletes unclosed or redundant rooms from the Revit model. 
@@ -15,6 +15,8 @@ How-to:
 4. A success or cancellation message will be shown based on your choice.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.4.0 The confirmation lists the elements Revit will delete 
+along with the rooms (tags, ...); rooms are deleted in a single call.
 - [09.07.2024] - v1.0.1 DEBUG information added
 __________________________________________________________________
 Author: Luis Ibanez"""
@@ -27,6 +29,8 @@ import Autodesk
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
 
+from pyreforge.purge import category_label, delete_plan, plan_purge
+
 
 # Main function
 def main():
@@ -51,6 +55,14 @@ def main():
                     print("Error accessing attributes for room: ", room.Id, e)
             room_list_str = "\n".join(room_info)
 
+            # Dry run: work out what Revit would delete along with the rooms
+            purge_plan = plan_purge(doc, [room.Id for room in rooms_to_delete])
+            if purge_plan.cascade:
+                cascade_info = ["{0}: {1}".format(label, count)
+                                for label, count in purge_plan.summary(category_label(doc))]
+                room_list_str += "\n\nAlong with them, {0} dependent elements will be deleted:\n{1}".format(
+                    len(purge_plan.cascade), "\n".join(cascade_info))
+
             # Show a simplified dialog with the list of rooms to be deleted
             room_list_dialog = TaskDialog("Rooms to be Deleted")
             room_list_dialog.MainContent = "The following rooms will be deleted:\n\n{0}".format(room_list_str)
@@ -60,7 +72,7 @@ def main():
 
             if result == TaskDialogResult.Yes:
                 # Call the function to delete the rooms
-                delete_rooms(doc, rooms_to_delete)
+                delete_rooms(doc, purge_plan)
 
                 # Show a smaller pop-up dialogue box when successful
                 task_dialog = TaskDialog("Success")
@@ -116,24 +128,14 @@ def get_rooms_to_delete(doc):
 
 
 # Function to delete rooms
-def delete_rooms(doc, rooms_to_delete):
+def delete_rooms(doc, purge_plan):
     try:
-        # Start a transaction
-        t = Transaction(doc, "Delete Unclosed and Redundant Rooms")
-        t.Start()
-
-        # Delete the rooms
-        for room in rooms_to_delete:
-            doc.Delete(room.Id)
-
-        # Commit the transaction
-        t.Commit()
+        # Delete the rooms in a single call, the transaction is rolled back on error
+        delete_plan(doc, purge_plan, "Delete Unclosed and Redundant Rooms")
 
     except Exception as e:
         # Print the error for debugging
         print("Error in delete_rooms function: ", e)
-        # Rollback the transaction if there's an error
-        t.RollBack()
 
 
 # Execute main function
@@ -1,14 +1,22 @@
 __title__ = "Lock RVT Links"
-__doc__ = """Version = 1.3
-Date    = 24.01.2025
+__doc__ = """Version = 1.5
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
-Pin or Unpin all Revit links using a dialog with Yes/No buttons.
+Pin or Unpin the instances of selected Revit link types using a dialog 
+with Yes/No buttons. Only links whose state changes are written, in one 
+transaction, and a table shows the pinned counts per link type.
 __________________________________________________________________
 How-to:
--> Click the button and select whether to pin or unpin all Revit links.
+1. Click the button and pick the link types (all of them for the whole 
+project).
+2. Select whether to pin or unpin their instances.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.5.0 Link types are told apart by id; types sharing a 
+name are listed separately, with their id. 
+- [18.10.2026] - v1.4.0 Scoped to link types; only links whose state 
+differs are written, with a before/after report per type.
 - [24.01.2025] - v1.3.0 Updated to use Yes/No buttons for Pin/Unpin options.
 __________________________________________________________________
 Author: Luis Ibanez"""
@@ -17,55 +25,60 @@ Author: Luis Ibanez"""
 import clr
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitAPIUI')
-from Autodesk.Revit.DB import FilteredElementCollector, BuiltInCategory, Transaction
+from Autodesk.Revit.DB import ElementId
 from Autodesk.Revit.UI import TaskDialog, TaskDialogCommonButtons, TaskDialogResult
+from pyrevit import forms
+from pyrevit import script
+
+from pyreforge.pins import PinReport, apply_pins, link_instances, link_types
 
 # Get the current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
-# Create a dialog with Pin and Unpin options using Yes/No buttons
-action_dialog = TaskDialog("Pin or Unpin Revit Links")
-action_dialog.MainContent = "Choose whether to pin or unpin all Revit links."
-action_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
-action_dialog.MainInstruction = "Click Yes to Pin or No to Unpin the Revit links."
-
-# Show the dialog
-result = action_dialog.Show()
-
-# Define the function to pin or unpin Revit links
-def toggle_links(doc, pin=True):
-    # Start a transaction
-    t = Transaction(doc, "Toggle Revit Links Pin")
-    t.Start()
-
-    # Get all the Revit links in the document
-    collector = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_RvtLinks)
+# Ask which link types to change; every type is offered, pick all for the whole project
+type_labels = link_types(doc, cad=False)
+selected_labels = []
+if type_labels:
+    selected_labels = forms.SelectFromList.show(sorted(type_labels.values()),
+                                               title="Select Revit Link Types",
+                                               button_name="Select",
+                                               multiselect=True) or []
 
-    # Iterate through the Revit links and either pin or unpin them
-    for link in collector:
-        link.Pinned = pin
+result = None
+if selected_labels:
+    # Create a dialog with Pin and Unpin options using Yes/No buttons
+    action_dialog = TaskDialog("Pin or Unpin Revit Links")
+    action_dialog.MainContent = "Choose whether to pin or unpin the selected Revit links."
+    action_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
+    action_dialog.MainInstruction = "Click Yes to Pin or No to Unpin the Revit links."
 
-    # Commit the transaction
-    t.Commit()
-    t.Dispose()
+    # Show the dialog
+    result = action_dialog.Show()
 
 # Proceed based on user selection
-if result == TaskDialogResult.Yes:  # "Pin" option
-    toggle_links(doc, pin=True)
-    # Show success dialog for pinning
-    success_dialog = TaskDialog("Success")
-    success_dialog.MainContent = "All Revit links have been pinned successfully!"
-    success_dialog.Show()
+if result in (TaskDialogResult.Yes, TaskDialogResult.No):
+    pin = result == TaskDialogResult.Yes
+    # Read every pinned state once, then write only the links that change
+    selected_types = dict((type_key, label) for type_key, label in type_labels.items() if label in selected_labels)
+    report = PinReport(link_instances(doc, cad=False, types=selected_types), pin)
+    written = apply_pins(doc, report, "Pin Revit Links" if pin else "Unpin Revit Links")
+
+    output = script.get_output()
+    output.print_table(table_data=report.rows(),
+                       title="Revit links {}".format("pinned" if pin else "unpinned"),
+                       columns=["Link Type", "Instances", "Pinned Before", "Changed", "Pinned After"])
+    for type_name, key, message in report.failed:
+        print("Link {} of {} could not be changed: {}".format(output.linkify(ElementId(key)), type_name, message))
 
-elif result == TaskDialogResult.No:  # "Unpin" option
-    toggle_links(doc, pin=False)
-    # Show success dialog for unpinning
+    # Show success dialog
     success_dialog = TaskDialog("Success")
-    success_dialog.MainContent = "All Revit links have been unpinned successfully!"
+    success_dialog.MainContent = "{} Revit links {}, {} already were, {} could not be changed.".format(
+        written, "pinned" if pin else "unpinned", sum(report.totals.values()) - len(report.changes),
+        len(report.failed))
     success_dialog.Show()
 
-# If the operation was canceled
+# If the operation was canceled or there is nothing to pin
 else:
     cancelled_dialog = TaskDialog("Cancelled")
-    cancelled_dialog.MainContent = "Operation cancelled."
+    cancelled_dialog.MainContent = "Operation cancelled." if type_labels else "The project has no Revit links."
     cancelled_dialog.Show()
@@ -1,46 +1,88 @@
 __title__ = 'Pin/Unpin CAD Links'
-__doc__ = """Version = 1.0
-Date    = 11.07.2024
+__doc__ = """Version = 1.2
+Date    = 18.10.2026
 __________________________________________________________________
 Description:
-Work-in Progress!
-Toggle pin and unpin all CAD links. 
+Pin or Unpin the instances of selected CAD link types using a dialog 
+with Yes/No buttons. Only links whose state changes are written, in one 
+transaction, and a table shows the pinned counts per link type.
 __________________________________________________________________
 How-to:
--> Just click on the button
+1. Click the button and pick the link types (all of them for the whole 
+project).
+2. Select whether to pin or unpin their instances.
 __________________________________________________________________
 Last update:
+- [18.10.2026] - v1.2.0 Link types are told apart by id; types sharing a 
+name are listed separately, with their id. 
+- [18.10.2026] - v1.1.0 Pins the linked instances to the chosen state 
+instead of toggling the link types; only links whose state differs are 
+written, with a before/after report per type.
 - [11.07.2024] - v1.0.0 Initial release
 __________________________________________________________________
 To-Do:
-Have some bugs, to be fixed on the next release.
+-
 __________________________________________________________________
 Author: Luis Ibanez"""
 
 import clr
 
 clr.AddReference('RevitAPI')
-from Autodesk.Revit.DB import FilteredElementCollector, BuiltInCategory, Transaction, CADLinkType
+clr.AddReference('RevitAPIUI')
+from Autodesk.Revit.DB import ElementId
+from Autodesk.Revit.UI import TaskDialog, TaskDialogCommonButtons, TaskDialogResult
+from pyrevit import forms
+from pyrevit import script
 
-# Get the current Revit application and document
-app = __revit__.Application
+from pyreforge.pins import PinReport, apply_pins, link_instances, link_types
+
+# Get the current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
-def toggle_pin_cad_links():
-    # Start a transaction
-    t = Transaction(doc, "Toggle Pin/Unpin CAD Links")
-    t.Start()
+# Ask which link types to change; every type is offered, pick all for the whole project
+type_labels = link_types(doc, cad=True)
+selected_labels = []
+if type_labels:
+    selected_labels = forms.SelectFromList.show(sorted(type_labels.values()),
+                                               title="Select CAD Link Types",
+                                               button_name="Select",
+                                               multiselect=True) or []
+
+result = None
+if selected_labels:
+    # Create a dialog with Pin and Unpin options using Yes/No buttons
+    action_dialog = TaskDialog("Pin or Unpin CAD Links")
+    action_dialog.MainContent = "Choose whether to pin or unpin the selected CAD links."
+    action_dialog.CommonButtons = TaskDialogCommonButtons.Yes | TaskDialogCommonButtons.No
+    action_dialog.MainInstruction = "Click Yes to Pin or No to Unpin the CAD links."
+
+    # Show the dialog
+    result = action_dialog.Show()
 
-    # Get all CAD links
-    collector = FilteredElementCollector(doc).OfClass(CADLinkType)
-    cad_links = collector.ToElements()
+# Proceed based on user selection
+if result in (TaskDialogResult.Yes, TaskDialogResult.No):
+    pin = result == TaskDialogResult.Yes
+    # Read every pinned state once, then write only the links that change
+    selected_types = dict((type_key, label) for type_key, label in type_labels.items() if label in selected_labels)
+    report = PinReport(link_instances(doc, cad=True, types=selected_types), pin)
+    written = apply_pins(doc, report, "Pin CAD Links" if pin else "Unpin CAD Links")
 
-    # Toggle pin/unpin for each CAD link
-    for link in cad_links:
-        link.Pinned = not link.Pinned
+    output = script.get_output()
+    output.print_table(table_data=report.rows(),
+                       title="CAD links {}".format("pinned" if pin else "unpinned"),
+                       columns=["Link Type", "Instances", "Pinned Before", "Changed", "Pinned After"])
+    for type_name, key, message in report.failed:
+        print("Link {} of {} could not be changed: {}".format(output.linkify(ElementId(key)), type_name, message))
 
-    # Commit the transaction
-    t.Commit()
+    # Show success dialog
+    success_dialog = TaskDialog("Success")
+    success_dialog.MainContent = "{} CAD links {}, {} already were, {} could not be changed.".format(
+        written, "pinned" if pin else "unpinned", sum(report.totals.values()) - len(report.changes),
+        len(report.failed))
+    success_dialog.Show()
 
-# Call the function to toggle pin/unpin all CAD links
-toggle_pin_cad_links()
+# If the operation was canceled or there is nothing to pin
+else:
+    cancelled_dialog = TaskDialog("Cancelled")
+    cancelled_dialog.MainContent = "Operation cancelled." if type_labels else "The project has no CAD links."
+    cancelled_dialog.Show()
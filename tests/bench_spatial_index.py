@@ -0,0 +1,43 @@
+"""Time spatial hash queries against the brute-force double loop.
+
+Run with ``python tests/bench_spatial_index.py``; plain rectangles stand
+in for tags and walls.
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pyreForge.extension", "lib"))
+
+from pyreforge.spatial_index import SpatialHash, boxes_overlap  # noqa: E402
+
+
+def random_boxes(rng, count, extent, size):
+    boxes = []
+    for _ in range(count):
+        x, y = rng.uniform(0.0, extent), rng.uniform(0.0, extent)
+        boxes.append((x, y, x + rng.uniform(0.1, size), y + rng.uniform(0.1, size)))
+    return boxes
+
+
+def main(tags=3000, walls=20000, extent=2000.0):
+    rng = random.Random(1)
+    tag_boxes = random_boxes(rng, tags, extent, 3.0)
+    wall_items = list(enumerate(random_boxes(rng, walls, extent, 30.0)))
+
+    def indexed():
+        index = SpatialHash.from_boxes(wall_items)
+        return sum(len(index.query(box)) for box in tag_boxes)
+
+    def brute_force():
+        return sum(1 for box in tag_boxes for _, wall in wall_items if boxes_overlap(box, wall))
+
+    assert indexed() == brute_force()
+    for name, run in (("spatial hash", indexed), ("brute force", brute_force)):
+        seconds = min(timeit.repeat(run, number=1, repeat=3))
+        print("{:<14}{:>8.3f} s  ({} tags x {} walls)".format(name, seconds, tags, walls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Tests of the pure-Python parts of the pyreforge library.
+
+Modules that import the Revit API only load inside Revit; the ones
+tested here run under any Python, so the library folder is put on the
+path the way pyRevit does.
+"""
+import os
+import sys
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pyreForge.extension", "lib")
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
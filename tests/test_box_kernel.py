@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from pyreforge import box_kernel
+from pyreforge.box_kernel import bucket_overlaps, overlaps, overlaps_python
+from pyreforge.spatial_index import SpatialHash
+
+
+def grid_boxes(rng, count, extent=40, size=6):
+    # Integer corners make touching edges and shared corners common;
+    # some boxes are degenerate (zero width or height)
+    boxes = []
+    for _ in range(count):
+        x, y = rng.randint(-extent, extent), rng.randint(-extent, extent)
+        boxes.append((float(x), float(y), float(x + rng.randint(0, size)), float(y + rng.randint(0, size))))
+    return boxes
+
+
+def brute_force(a_items, b_items, strict):
+    hits = {}
+    for a_key, a_box in a_items:
+        for b_key, b_box in b_items:
+            if overlaps_python([a_box], [b_box], strict):
+                hits.setdefault(a_key, set()).add(b_key)
+    return hits
+
+
+class OverlapEdgeCaseTest(unittest.TestCase):
+
+    def test_touching_edges(self):
+        a = [(0.0, 0.0, 1.0, 1.0)]
+        b = [(1.0, 0.0, 2.0, 1.0), (1.0, 1.0, 2.0, 2.0), (1.5, 0.0, 2.0, 1.0)]
+        self.assertEqual(overlaps_python(a, b), [(0, 0), (0, 1)])
+        self.assertEqual(overlaps_python(a, b, strict=True), [])
+
+    def test_degenerate_boxes(self):
+        point = [(1.0, 1.0, 1.0, 1.0)]
+        self.assertEqual(overlaps_python(point, [(0.0, 0.0, 1.0, 1.0)]), [(0, 0)])
+        self.assertEqual(overlaps_python(point, [(0.0, 0.0, 1.0, 1.0)], strict=True), [])
+
+    def test_empty_inputs(self):
+        self.assertEqual(overlaps([], [(0.0, 0.0, 1.0, 1.0)], backend="python"), [])
+        self.assertEqual(overlaps([(0.0, 0.0, 1.0, 1.0)], [], backend="python"), [])
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, overlaps, [], [], False, "fortran")
+
+
+@unittest.skipUnless(box_kernel.has_numpy(), "NumPy is not installed")
+class NumpyParityTest(unittest.TestCase):
+
+    def test_same_pairs_in_same_order(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            a = grid_boxes(rng, rng.randint(0, 60))
+            b = grid_boxes(rng, rng.randint(0, 60))
+            for strict in (False, True):
+                self.assertEqual(overlaps(a, b, strict, "numpy"), overlaps(a, b, strict, "python"))
+
+    def test_row_blocks(self):
+        rng = random.Random(4)
+        a, b = grid_boxes(rng, 300), grid_boxes(rng, 50)
+        chunk_cells = box_kernel.CHUNK_CELLS
+        box_kernel.CHUNK_CELLS = 120
+        try:
+            self.assertEqual(overlaps(a, b, backend="numpy"), overlaps(a, b, backend="python"))
+        finally:
+            box_kernel.CHUNK_CELLS = chunk_cells
+
+    def test_empty_inputs(self):
+        self.assertEqual(overlaps([], [(0.0, 0.0, 1.0, 1.0)], backend="numpy"), [])
+        self.assertEqual(overlaps([(0.0, 0.0, 1.0, 1.0)], [], backend="numpy"), [])
+
+
+class BucketOverlapsTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.b_items = list(enumerate(grid_boxes(rng, 300)))
+        # Oversized targets live outside the grid
+        self.b_items += [(1000, (-400.0, -400.0, 400.0, 400.0)), (1001, (-400.0, 3.0, 400.0, 3.0))]
+        self.a_items = [("a{}".format(i), box) for i, box in enumerate(grid_boxes(rng, 200))]
+        # A source spanning more cells than the grid keeps per box
+        self.a_items.append(("wide", (-300.0, -300.0, 300.0, 300.0)))
+        self.index = SpatialHash.from_boxes(self.b_items, cell_size=4.0)
+
+    def backends(self):
+        return ["python", "numpy"] if box_kernel.has_numpy() else ["python"]
+
+    def test_oversized_and_wide_paths_are_used(self):
+        self.assertTrue(self.index.oversized())
+        self.assertIsNone(self.index.cells_of(dict(self.a_items)["wide"]))
+
+    def test_matches_brute_force(self):
+        for backend in self.backends():
+            for strict in (False, True):
+                self.assertEqual(bucket_overlaps(self.a_items, self.index, strict, backend),
+                                 brute_force(self.a_items, self.b_items, strict))
+
+    def test_matches_spatial_hash_query(self):
+        hits = bucket_overlaps(self.a_items, self.index, backend="python")
+        for key, box in self.a_items:
+            self.assertEqual(hits.get(key, set()), set(self.index.query(box)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import shutil
+import tempfile
+import unittest
+
+from pyreforge.clash_cache import ClashCacheFile, ClashState, forget_views, make_stamp, plan_recheck
+
+SIGNATURE = "engine-v4/walls"
+
+
+def stamped(boxes, version="a"):
+    return dict((key, make_stamp(box, version)) for key, box in boxes.items())
+
+
+class PlanRecheckTest(unittest.TestCase):
+    """Sources 1 and 3 clash with targets 10 and 11; source 2 is clear."""
+
+    def setUp(self):
+        self.sources = {1: (0.5, 0.5, 2.0, 2.0), 2: (20.0, 20.0, 21.0, 21.0), 3: (50.5, 50.5, 52.0, 52.0)}
+        self.targets = {10: (0.0, 0.0, 1.0, 1.0), 11: (50.0, 50.0, 51.0, 51.0)}
+        self.previous = ClashState(SIGNATURE, stamped(self.sources), stamped(self.targets), dict(self.targets),
+                                   hits=[1, 3])
+
+    def plan(self, sources, targets, signature=SIGNATURE, source_stamps=None, target_stamps=None):
+        return plan_recheck(self.previous, signature, sources, source_stamps or stamped(sources),
+                            targets, target_stamps or stamped(targets))
+
+    def test_nothing_changed(self):
+        self.assertEqual(self.plan(self.sources, self.targets), (set(), set([1, 3])))
+
+    def test_added_source(self):
+        sources = dict(self.sources)
+        sources[4] = (30.0, 30.0, 31.0, 31.0)
+        self.assertEqual(self.plan(sources, self.targets), (set([4]), set([1, 3])))
+
+    def test_modified_source(self):
+        stamps = stamped(self.sources)
+        stamps[1] = make_stamp(self.sources[1], "b")
+        self.assertEqual(self.plan(self.sources, self.targets, source_stamps=stamps), (set([1]), set([3])))
+
+    def test_deleted_source_drops_its_hit(self):
+        sources = dict(self.sources)
+        del sources[3]
+        self.assertEqual(self.plan(sources, self.targets), (set(), set([1])))
+
+    def test_moved_target_retests_old_and_new_neighbours(self):
+        targets = dict(self.targets)
+        targets[10] = (20.5, 20.5, 22.0, 22.0)
+        self.assertEqual(self.plan(self.sources, targets), (set([1, 2]), set([3])))
+
+    def test_modified_target_in_place(self):
+        stamps = stamped(self.targets)
+        stamps[11] = make_stamp(self.targets[11], "b")
+        self.assertEqual(self.plan(self.sources, self.targets, target_stamps=stamps), (set([3]), set([1])))
+
+    def test_deleted_target(self):
+        targets = dict(self.targets)
+        del targets[11]
+        self.assertEqual(self.plan(self.sources, targets), (set([3]), set([1])))
+
+    def test_added_target(self):
+        targets = dict(self.targets)
+        targets[12] = (19.0, 19.0, 20.0, 20.0)
+        self.assertEqual(self.plan(self.sources, targets), (set([2]), set([1, 3])))
+
+    def test_engine_version_forces_a_full_run(self):
+        self.assertEqual(self.plan(self.sources, self.targets, signature="engine-v5/walls"),
+                         (set([1, 2, 3]), set()))
+
+    def test_no_previous_run(self):
+        self.previous = None
+        self.assertEqual(self.plan(self.sources, self.targets), (set([1, 2, 3]), set()))
+
+    def test_state_survives_json(self):
+        data = json.loads(json.dumps(self.previous.to_dict()))
+        self.previous = ClashState.from_dict(data)
+        self.assertEqual(self.plan(self.sources, self.targets), (set(), set([1, 3])))
+
+
+class ForgetViewsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for tool in ("tags", "dims"):
+            cache = ClashCacheFile("doc", tool, self.folder)
+            for view_key in (1, 2):
+                cache.put(view_key, ClashState(SIGNATURE, hits=[5]))
+            cache.save()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def cached_views(self, tool):
+        cache = ClashCacheFile("doc", tool, self.folder)
+        return [view_key for view_key in (1, 2) if cache.get(view_key) is not None]
+
+    def test_forget_one_view_of_one_tool(self):
+        forget_views("doc", [1], "tags", self.folder)
+        self.assertEqual(self.cached_views("tags"), [2])
+        self.assertEqual(self.cached_views("dims"), [1, 2])
+
+    def test_forget_every_view_of_every_tool(self):
+        forget_views("doc", None, None, self.folder)
+        self.assertEqual(self.cached_views("tags"), [])
+        self.assertEqual(self.cached_views("dims"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
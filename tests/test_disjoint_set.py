@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from pyreforge.disjoint_set import DisjointSet, cluster_pairs, keep_highest, keep_oldest, split_clusters
+
+
+def naive_groups(pairs):
+    # Merge sets until no pair spans two of them
+    groups = []
+    for key_a, key_b in pairs:
+        merged = set([key_a, key_b])
+        rest = []
+        for group in groups:
+            if group & merged:
+                merged |= group
+            else:
+                rest.append(group)
+        groups = rest + [merged]
+    return sorted(sorted(group) for group in groups if len(group) > 1)
+
+
+class DisjointSetTest(unittest.TestCase):
+
+    def test_groups_match_naive_merge(self):
+        rng = random.Random(5)
+        pairs = [(rng.randint(0, 200), rng.randint(0, 200)) for _ in range(150)]
+        self.assertEqual(sorted(sorted(group) for group in cluster_pairs(pairs)), naive_groups(pairs))
+
+    def test_find_compresses_the_path(self):
+        sets = DisjointSet()
+        for key in range(5):
+            sets.add(key)
+        # Build a chain 4 -> 3 -> 2 -> 1 -> 0 by hand
+        for key in range(1, 5):
+            sets._parent[key] = key - 1
+        self.assertEqual(sets.find(4), 0)
+        self.assertEqual([sets._parent[key] for key in range(5)], [0, 0, 0, 0, 0])
+
+    def test_union_by_rank_keeps_trees_flat(self):
+        sets = DisjointSet()
+        sets.union(1, 2)
+        sets.union(3, 4)
+        root = sets.union(1, 3)
+        self.assertEqual(sets._rank[root], 2)
+        # A single key joins under the deeper tree, which stays at rank 2
+        self.assertEqual(sets.union(5, 4), root)
+        self.assertEqual(sets._rank[root], 2)
+        self.assertEqual(sets._rank[5], 0)
+
+    def test_self_pairs_and_repeats(self):
+        sets = DisjointSet()
+        self.assertEqual(sets.union(7, 7), 7)
+        self.assertIn(7, sets)
+        self.assertEqual(cluster_pairs([(1, 1), (2, 3), (3, 2)]), [[2, 3]])
+
+
+class SplitClustersTest(unittest.TestCase):
+
+    def test_keep_oldest(self):
+        kept, deleted = split_clusters([[9, 4, 6], [12, 10]], keep_oldest)
+        self.assertEqual(kept, [4, 10])
+        self.assertEqual(sorted(deleted), [6, 9, 12])
+
+    def test_keep_highest_breaks_ties_by_lowest_id(self):
+        score = {1: 5, 2: 8, 3: 8}.get
+        self.assertEqual(keep_highest(score)([3, 1, 2]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
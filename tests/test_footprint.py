@@ -0,0 +1,51 @@
+import unittest
+
+from pyreforge.footprint import box_hits_polygons, extend_polyline, polyline_bands
+
+
+def centerline_wall(points, width):
+    # What wall_footprint builds for a centerline wall
+    reach = width / 2.0
+    return polyline_bands(extend_polyline(points, reach), -reach, reach)
+
+
+class ExtendPolylineTest(unittest.TestCase):
+
+    def test_both_ends_move_along_their_segment(self):
+        self.assertEqual(extend_polyline([(0.0, 0.0), (10.0, 0.0)], 2.0), [(-2.0, 0.0), (12.0, 0.0)])
+        self.assertEqual(extend_polyline([(0.0, 0.0), (0.0, 5.0), (5.0, 5.0)], 1.0),
+                         [(0.0, -1.0), (0.0, 5.0), (6.0, 5.0)])
+
+    def test_degenerate_input_is_kept(self):
+        self.assertEqual(extend_polyline([(1.0, 1.0)], 2.0), [(1.0, 1.0)])
+        self.assertEqual(extend_polyline([(0.0, 0.0), (0.0, 0.0)], 2.0), [(0.0, 0.0), (0.0, 0.0)])
+        self.assertEqual(extend_polyline([(0.0, 0.0), (3.0, 0.0)], 0.0), [(0.0, 0.0), (3.0, 0.0)])
+
+
+class JoinedCornerTest(unittest.TestCase):
+    """Two centerline walls joined in an L at the origin, widths 1 and 2.
+
+    Revit fills the outer corner up to the other wall's outer face,
+    beyond both location curve ends.
+    """
+
+    def setUp(self):
+        self.footprints = (centerline_wall([(-10.0, 0.0), (0.0, 0.0)], 1.0) +
+                           centerline_wall([(0.0, 0.0), (0.0, 10.0)], 2.0))
+
+    def test_outer_corner_is_covered(self):
+        self.assertTrue(box_hits_polygons((0.85, -0.45, 0.9, -0.4), self.footprints))
+        self.assertTrue(box_hits_polygons((-0.1, -0.49, -0.05, -0.45), self.footprints))
+
+    def test_bands_without_extension_miss_the_corner(self):
+        bare = (polyline_bands([(-10.0, 0.0), (0.0, 0.0)], -0.5, 0.5) +
+                polyline_bands([(0.0, 0.0), (0.0, 10.0)], -1.0, 1.0))
+        self.assertFalse(box_hits_polygons((0.85, -0.45, 0.9, -0.4), bare))
+
+    def test_clear_of_both_walls(self):
+        self.assertFalse(box_hits_polygons((1.5, -3.0, 2.0, -2.5), self.footprints))
+        self.assertFalse(box_hits_polygons((-5.0, 1.2, -4.0, 1.5), self.footprints))
+
+
+if __name__ == "__main__":
+    unittest.main()
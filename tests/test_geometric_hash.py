@@ -0,0 +1,68 @@
+import unittest
+
+from pyreforge.geometric_hash import EDGE_FRACTION, cells, group_by_keys, hash_keys
+
+# 1 mm in feet, as the duplicate finder uses it
+QUANTUM = 1.0 / 304.8
+
+
+def point_keys(exact, x, y, z=0.0):
+    return hash_keys(exact, [(x, QUANTUM), (y, QUANTUM), (z, QUANTUM)])
+
+
+def mm(value):
+    return value * QUANTUM
+
+
+class CellsTest(unittest.TestCase):
+
+    def test_middle_of_a_cell(self):
+        self.assertEqual(cells(mm(3.0), QUANTUM), (3,))
+        self.assertEqual(cells(mm(-3.2), QUANTUM), (-3,))
+
+    def test_near_an_edge_adds_the_neighbour(self):
+        self.assertEqual(cells(mm(3.45), QUANTUM), (3, 4))
+        self.assertEqual(cells(mm(3.55), QUANTUM), (4, 3))
+        self.assertEqual(cells(mm(-3.45), QUANTUM), (-3, -4))
+
+    def test_edge_band_width(self):
+        inside = 0.5 - EDGE_FRACTION / 2
+        outside = 0.5 - EDGE_FRACTION * 2
+        self.assertEqual(len(cells(mm(inside), QUANTUM)), 2)
+        self.assertEqual(len(cells(mm(outside), QUANTUM)), 1)
+
+
+class GroupAtCellEdgesTest(unittest.TestCase):
+
+    def group(self, points, exact=("text", "A")):
+        return sorted(sorted(group) for group in
+                      group_by_keys((key, point_keys(exact, *point)) for key, point in points))
+
+    def test_copies_straddling_an_edge_are_grouped(self):
+        # 0.02 mm apart but rounded to different cells
+        first, second = mm(12.49), mm(12.51)
+        self.assertNotEqual(int(round(first / QUANTUM)), int(round(second / QUANTUM)))
+        self.assertEqual(self.group([(1, (first, mm(5.0))), (2, (second, mm(5.0)))]), [[1, 2]])
+
+    def test_copies_near_a_corner_are_grouped(self):
+        points = [(1, (mm(7.49), mm(-2.51))), (2, (mm(7.51), mm(-2.49))), (3, (mm(7.52), mm(-2.52)))]
+        self.assertEqual(self.group(points), [[1, 2, 3]])
+
+    def test_same_cell_is_grouped(self):
+        self.assertEqual(self.group([(1, (mm(4.1), mm(0.0))), (2, (mm(4.3), mm(0.0)))]), [[1, 2]])
+
+    def test_cells_apart_are_not_grouped(self):
+        points = [(1, (mm(12.3), mm(5.0))), (2, (mm(12.7), mm(5.0))), (3, (mm(14.0), mm(5.0)))]
+        self.assertEqual(self.group(points), [])
+
+    def test_exact_part_must_match(self):
+        items = [(1, point_keys(("text", "A"), mm(12.49), 0.0)), (2, point_keys(("text", "B"), mm(12.51), 0.0))]
+        self.assertEqual(group_by_keys(items), [])
+
+    def test_one_key_away_from_edges(self):
+        self.assertEqual(len(point_keys(("tag",), mm(3.0), mm(8.0), mm(1.0))), 1)
+        self.assertEqual(len(point_keys(("tag",), mm(3.5), mm(8.5), mm(1.0))), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from pyreforge.names import clean_name, invalid_characters
+
+
+class NamesTest(unittest.TestCase):
+
+    def test_invalid_characters(self):
+        self.assertEqual(invalid_characters("L1 - {plan}: [A]"), [":", "[", "]", "{", "}"])
+        self.assertEqual(invalid_characters("Level 1 - Floor Plan"), [])
+
+    def test_clean_name(self):
+        self.assertEqual(clean_name("Height 1.50-1.60 m"), "Height 1.50-1.60 m")
+        self.assertEqual(clean_name("Rating <2h>; A|B"), "Rating _2h__ A_B")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from pyreforge.purge_plan import PurgePlan, reachable
+
+
+class ReachableTest(unittest.TestCase):
+
+    def test_closure_with_cycles(self):
+        graph = {1: [2], 2: [3], 3: [1, 4]}
+        self.assertEqual(reachable(graph, [1]), set([1, 2, 3, 4]))
+        self.assertEqual(reachable(graph, [4]), set([4]))
+
+
+class PurgePlanTest(unittest.TestCase):
+
+    def test_cascade_closure(self):
+        # Pattern 1 -> region type 2 -> regions 3 and 4
+        plan = PurgePlan([1], {1: [2], 2: [3, 4]})
+        self.assertEqual(plan.cascade, set([2, 3, 4]))
+        self.assertEqual(plan.cascade_of(2), set([3, 4]))
+        self.assertEqual(plan.total, 4)
+
+    def test_self_dependency_is_excluded(self):
+        # GetDependentElements lists the element itself
+        plan = PurgePlan([1, 2], {1: [1, 5], 2: [2]})
+        self.assertEqual(plan.cascade_of(1), set([5]))
+        self.assertEqual(plan.cascade, set([5]))
+        self.assertEqual(plan.safe, [1, 2])
+        self.assertEqual(plan.covered(), set())
+
+    def test_shared_dependent_of_a_survivor_is_protected(self):
+        # 9 is not a candidate and owns 5 too, so deleting 1 would take 5 from it
+        plan = PurgePlan([1], {1: [5], 9: [5]})
+        self.assertEqual(plan.safe, [])
+        self.assertEqual(plan.held, [1])
+        self.assertEqual(plan.cascade, set())
+
+    def test_shared_dependent_goes_when_every_owner_goes(self):
+        plan = PurgePlan([1, 9], {1: [5], 9: [5]})
+        self.assertEqual(plan.safe, [1, 9])
+        self.assertEqual(plan.cascade, set([5]))
+        self.assertEqual(plan.shared(), set([5]))
+
+    def test_only_the_safe_set_is_deleted(self):
+        plan = PurgePlan([1, 2, 3], {1: [5], 9: [5], 2: [6], 3: [3]})
+        self.assertEqual(plan.safe, [2, 3])
+        self.assertEqual(plan.held, [1])
+        self.assertEqual(plan.cascade, set([6]))
+        self.assertEqual(plan.total, 3)
+
+    def test_holding_back_cascades(self):
+        # 1 is held for 9's sake; 2 would delete 1 along with it, so it stays too
+        plan = PurgePlan([1, 2, 3], {1: [5], 9: [5], 2: [1], 3: [7]})
+        self.assertEqual(plan.safe, [3])
+        self.assertEqual(plan.held, [1, 2])
+        self.assertEqual(plan.cascade, set([7]))
+
+    def test_candidate_owned_by_a_survivor_can_go(self):
+        # A tag (2) of a room that stays (9) can still be deleted on its own
+        plan = PurgePlan([2], {9: [2], 2: []})
+        self.assertEqual(plan.safe, [2])
+
+    def test_covered_candidates_and_duplicates(self):
+        plan = PurgePlan([1, 2, 1], {1: [2], 2: [3]})
+        self.assertEqual(plan.candidates, [1, 2])
+        self.assertEqual(plan.covered(), set([2]))
+        self.assertEqual(plan.cascade, set([3]))
+
+    def test_summary_counts_by_label(self):
+        plan = PurgePlan([1], {1: [2, 3, 4]})
+        labels = {2: "Tags", 3: "Tags", 4: "Lines"}
+        self.assertEqual(plan.summary(labels.get), [("Tags", 2), ("Lines", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from pyreforge.spatial_index import MAX_CELLS_PER_BOX, SpatialHash, boxes_overlap
+
+
+def random_box(rng, extent=100.0, size=5.0):
+    x = rng.uniform(-extent, extent)
+    y = rng.uniform(-extent, extent)
+    return x, y, x + rng.uniform(0.0, size), y + rng.uniform(0.0, size)
+
+
+def brute_force(items, box):
+    return sorted(key for key, other in items if boxes_overlap(box, other))
+
+
+class SpatialHashQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.items = [(key, random_box(rng)) for key in range(400)]
+        # Boxes far larger than the cells take the oversized path
+        self.items += [(1000, (-150.0, -150.0, 150.0, 150.0)), (1001, (-120.0, 10.0, 140.0, 12.0))]
+        self.index = SpatialHash.from_boxes(self.items)
+        self.queries = [random_box(rng, size=20.0) for _ in range(200)]
+
+    def test_oversized_boxes_are_kept_apart(self):
+        x0, y0, x1, y1 = self.index._cell_range(self.index.box(1000))
+        self.assertGreater((x1 - x0 + 1) * (y1 - y0 + 1), MAX_CELLS_PER_BOX)
+        self.assertIn(1000, self.index._oversized)
+
+    def test_query_matches_brute_force(self):
+        for box in self.queries:
+            self.assertEqual(sorted(self.index.query(box)), brute_force(self.items, box))
+
+    def test_query_larger_than_the_grid(self):
+        box = (-1000.0, -1000.0, 1000.0, 1000.0)
+        self.assertEqual(sorted(self.index.query(box)), brute_force(self.items, box))
+
+    def test_touching_edges_count(self):
+        index = SpatialHash.from_boxes([("a", (0.0, 0.0, 1.0, 1.0))], cell_size=1.0)
+        self.assertEqual(index.query((1.0, 1.0, 2.0, 2.0)), ["a"])
+        self.assertEqual(index.query((1.0 + 1e-9, 0.0, 2.0, 1.0)), [])
+
+    def test_first_hit_matches_query(self):
+        for box in self.queries:
+            hit = self.index.first_hit(box)
+            if hit is None:
+                self.assertEqual(brute_force(self.items, box), [])
+            else:
+                self.assertIn(hit, brute_force(self.items, box))
+
+    def test_remove_and_reinsert(self):
+        items = dict(self.items)
+        for key in (3, 1000, 57):
+            self.index.remove(key)
+            del items[key]
+        items[5] = (500.0, 500.0, 501.0, 501.0)
+        self.index.insert(5, items[5])
+        for box in self.queries + [items[5]]:
+            self.assertEqual(sorted(self.index.query(box)), brute_force(items.items(), box))
+
+
+if __name__ == "__main__":
+    unittest.main()
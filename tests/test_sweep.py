@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from pyreforge.spatial_index import boxes_overlap
+from pyreforge.sweep import sweep_pairs
+
+
+def grid_boxes(rng, count, extent=30, size=5):
+    # Integer corners make touching edges, shared corners and zero-width
+    # boxes common
+    boxes = []
+    for _ in range(count):
+        x, y = rng.randint(-extent, extent), rng.randint(-extent, extent)
+        boxes.append((float(x), float(y), float(x + rng.randint(0, size)), float(y + rng.randint(0, size))))
+    return boxes
+
+
+def strictly_overlap(a, b):
+    return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+
+def brute_force(items, strict):
+    test = strictly_overlap if strict else boxes_overlap
+    pairs = []
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            if test(items[i][1], items[j][1]):
+                pairs.append((items[i][0], items[j][0]))
+    return sorted(pairs)
+
+
+class SweepPairsTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.items = [("k{}".format(order), box) for order, box in enumerate(grid_boxes(rng, 300))]
+
+    def test_touching_matches_brute_force(self):
+        self.assertEqual(sorted(sweep_pairs(self.items)), brute_force(self.items, strict=False))
+
+    def test_strict_matches_brute_force(self):
+        self.assertEqual(sorted(sweep_pairs(self.items, strict=True)), brute_force(self.items, strict=True))
+
+    def test_pairs_follow_input_order(self):
+        # The later box sorts first on X, the pair still comes out in input order
+        items = [("b", (5.0, 0.0, 6.0, 1.0)), ("a", (0.0, 0.0, 5.5, 1.0))]
+        self.assertEqual(list(sweep_pairs(items)), [("b", "a")])
+
+    def test_edges_and_corners(self):
+        items = [("a", (0.0, 0.0, 1.0, 1.0)), ("right", (1.0, 0.0, 2.0, 1.0)),
+                 ("corner", (1.0, 1.0, 2.0, 2.0)), ("line", (0.5, 0.5, 0.5, 3.0))]
+        self.assertEqual(sorted(sweep_pairs(items)),
+                         [("a", "corner"), ("a", "line"), ("a", "right"), ("right", "corner")])
+        # A zero-width box crossing the interior still overlaps strictly
+        self.assertEqual(list(sweep_pairs(items, strict=True)), [("a", "line")])
+
+    def test_no_boxes(self):
+        self.assertEqual(list(sweep_pairs([])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()